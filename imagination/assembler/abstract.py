@@ -1,6 +1,26 @@
 class ConfigParser(object):
+    # The file extensions (lowercase, with the leading dot) to dispatch to this parser without probing
+    __extensions__ = ()
+
     def can_handle(self, filepath : str) -> bool:
         raise NotImplementedError()
 
     def parse(self, filepath : str) -> dict:
         raise NotImplementedError()
+
+    def scan(self, filepath : str) -> tuple:
+        """ Scan the IDs of the entities defined by the file and the IDs of the entities they intercept.
+
+            The parsers should override this to scan without converting the
+            definitions. By default, the file is fully parsed.
+
+            :return: the list of the defined IDs and the list of the intercepted IDs
+        """
+        container_map   = self.parse(filepath)
+        intercepted_ids = {
+            interception.intercepted_id
+            for meta_container in container_map.values()
+            for interception in meta_container.interceptions
+        }
+
+        return list(container_map), sorted(intercepted_ids)
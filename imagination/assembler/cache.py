@@ -0,0 +1,189 @@
+# v2
+import collections
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+
+from ..debug import get_logger
+
+log = get_logger(__name__)
+
+# NOTE Bump this whenever the meta containers change their attributes.
+CACHE_FORMAT_VERSION = 1
+
+
+class ConfigCacheStats(collections.namedtuple('ConfigCacheStats', ('hits', 'misses', 'writes'))):
+    """ Statistics of :class:`ConfigCache` """
+    __slots__ = ()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+
+class ConfigCache(object):
+    """ On-disk cache of the parsed configuration files
+
+        Each configuration file has one cache file, named after its absolute
+        path and the parser. The cache file stores the size, the modification
+        time and the content hash of the configuration file with the pickled
+        map of the entity ID to the meta container.
+
+        The cached map is valid when the size and the modification time still
+        match. Otherwise, the content hash is checked so that the cache survives
+        the deployments only touching the files.
+
+        The cache files are written to temporary files first and then moved in
+        place atomically, so concurrent writers never expose a partial file.
+
+        .. warning:: The cache files are unpickled. Only use a directory writable by trusted users.
+
+        :param str directory: the path to the cache directory, created on demand
+    """
+    def __init__(self, directory : str):
+        self.__directory = directory
+        self.__lock      = threading.Lock()
+
+        self.__hits   = 0
+        self.__misses = 0
+        self.__writes = 0
+
+    @property
+    def directory(self) -> str:
+        return self.__directory
+
+    def load(self, parser, filepath : str) -> dict:
+        """ Parse the configuration file with the parser unless the cached map is still valid.
+
+            :param parser: the :class:`imagination.assembler.abstract.ConfigParser`
+            :param str filepath: the path to the configuration file
+        """
+        cache_path = self.__get_cache_path(parser, filepath)
+        stat       = os.stat(filepath)
+        entry      = self.__read(cache_path)
+        digest     = None
+
+        if entry is not None and (entry['size'], entry['mtime']) == (stat.st_size, stat.st_mtime_ns):
+            self.__count(hit = True)
+
+            return entry['containers']
+
+        if entry is not None and entry['size'] == stat.st_size:
+            digest = _hash_file(filepath)
+
+            if entry['digest'] == digest:
+                self.__count(hit = True)
+
+                # Refresh the modification time to skip the hash next time.
+                entry['mtime'] = stat.st_mtime_ns
+
+                self.__write(cache_path, entry)
+
+                return entry['containers']
+
+        self.__count(hit = False)
+
+        meta_container_map = parser.parse(filepath)
+
+        self.__write(cache_path, {
+            'version'   : CACHE_FORMAT_VERSION,
+            'size'      : stat.st_size,
+            'mtime'     : stat.st_mtime_ns,
+            'digest'    : digest or _hash_file(filepath),
+            'containers': meta_container_map,
+        })
+
+        return meta_container_map
+
+    def stats(self) -> ConfigCacheStats:
+        with self.__lock:
+            return ConfigCacheStats(self.__hits, self.__misses, self.__writes)
+
+    def merge(self, stats : ConfigCacheStats):
+        """ Add the statistics collected by another instance, e.g., in a worker process. """
+        with self.__lock:
+            self.__hits   += stats.hits
+            self.__misses += stats.misses
+            self.__writes += stats.writes
+
+    def clear(self):
+        """ Remove all cache files and reset the statistics. """
+        with self.__lock:
+            self.__hits   = 0
+            self.__misses = 0
+            self.__writes = 0
+
+        if not os.path.isdir(self.__directory):
+            return
+
+        for filename in os.listdir(self.__directory):
+            if filename.endswith('.cache'):
+                os.unlink(os.path.join(self.__directory, filename))
+
+    def __count(self, hit : bool):
+        with self.__lock:
+            if hit:
+                self.__hits += 1
+            else:
+                self.__misses += 1
+
+    def __get_cache_path(self, parser, filepath : str) -> str:
+        parser_class = type(parser)
+        key          = '{}.{}:{}'.format(parser_class.__module__, parser_class.__qualname__, os.path.abspath(filepath))
+
+        return os.path.join(self.__directory, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.cache')
+
+    def __read(self, cache_path : str):
+        try:
+            with open(cache_path, 'rb') as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # NOTE A broken cache file is simply replaced.
+            log.warning('Ignored the unreadable cache file %s (%s)', cache_path, e)
+
+            return None
+
+        if not isinstance(entry, dict) or entry.get('version') != CACHE_FORMAT_VERSION:
+            return None
+
+        return entry
+
+    def __write(self, cache_path : str, entry : dict):
+        try:
+            os.makedirs(self.__directory, exist_ok = True)
+
+            fd, temp_path = tempfile.mkstemp(suffix = '.tmp', dir = self.__directory)
+
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+
+                os.replace(temp_path, cache_path)
+            except BaseException:
+                os.unlink(temp_path)
+
+                raise
+        except OSError as e:
+            # NOTE The cache is only an optimization.
+            log.warning('Failed to write the cache file %s (%s)', cache_path, e)
+
+            return
+
+        with self.__lock:
+            self.__writes += 1
+
+
+def _hash_file(filepath : str) -> str:
+    digest = hashlib.sha256()
+
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
@@ -1,8 +1,18 @@
 # v2
-from ..core  import Imagination
-from ..debug import dump_meta_container, get_logger
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import os
+import time
+from typing import List
 
-from .xml import XMLParser
+from ..core          import Imagination
+from ..debug         import dump_meta_container, get_logger
+from ..meta.fragment import Fragment
+
+from .cache import ConfigCache, ConfigCacheStats
+from .json  import JSONParser
+from .toml  import TOMLParser
+from .xml   import StreamingXMLParser, XMLParser
 
 log = get_logger(__name__)
 
@@ -11,10 +21,39 @@ class UnsupportedConfigFileError(RuntimeError):
     """ Error when detect unsupported configuration file """
 
 
+class DuplicateContainerIDError(RuntimeError):
+    """ Error when more than one configuration file define the same ID and overriding is disabled. """
+
+
 class Assembler(object):
-    def __init__(self, core : Imagination = None):
+    """ Assembler of the configuration files
+
+        :param Imagination core: the container (a new one by default)
+        :param str cache_dir: the directory of the cache of the parsed files
+                              (``IMAGINATION_CONFIG_CACHE_DIR`` by default, disabled if unset)
+        :param str xml_parser: the XML parser, either ``dom`` (kotoba) or ``streaming``
+                               (``IMAGINATION_XML_PARSER`` by default, otherwise ``dom``)
+        :param int workers: the number of processes to parse the files concurrently (sequential by default)
+        :param bool allow_override: flag if a file can override the IDs defined by the previous files
+        :param bool lazy: flag if the files are only scanned for the IDs on load, and fully parsed
+                          when any of their IDs is first requested
+    """
+    __xml_parsers__ = {
+        'dom'       : XMLParser,
+        'streaming' : StreamingXMLParser,
+    }
+
+    def __init__(self, core : Imagination = None, cache_dir : str = None, xml_parser : str = None,
+                 workers : int = None, allow_override : bool = True, lazy : bool = False):
+        xml_parser = xml_parser or os.getenv('IMAGINATION_XML_PARSER') or 'dom'
+
+        if xml_parser not in self.__xml_parsers__:
+            raise ValueError(f'Unknown XML parser ({xml_parser})')
+
         self._parsers = [
-            XMLParser(),
+            self.__xml_parsers__[xml_parser](),
+            JSONParser(),
+            TOMLParser(),
         ]
 
         if core and core.in_standalone_mode():
@@ -22,32 +61,158 @@ class Assembler(object):
 
         self._core = core or Imagination()
 
+        cache_dir   = cache_dir or os.getenv('IMAGINATION_CONFIG_CACHE_DIR')
+        self._cache = ConfigCache(cache_dir) if cache_dir else None
+
+        self._workers        = workers
+        self._allow_override = allow_override
+        self._lazy           = lazy
+        self._parse_timings  = []  # (file path, time in seconds) of the last load
+
     @property
     def core(self):
         return self._core
 
+    @property
+    def cache(self) -> ConfigCache:
+        """ The cache of the parsed files, or ``None`` if disabled """
+        return self._cache
+
+    def get_cache_stats(self) -> ConfigCacheStats:
+        return self._cache.stats() if self._cache else ConfigCacheStats(0, 0, 0)
+
     def load(self, *filepaths):
+        if self._lazy:
+            for fragment in self._scan_config_files(*filepaths):
+                self.core.add_fragment(fragment)
+
+            return
+
         meta_container_map = self._load_config_files(*filepaths)
 
         self.core.update_metadata(meta_container_map)
 
+    def get_parse_timings(self) -> List[tuple]:
+        """ Get the time spent to parse each file by the last load, in the order of the files.
+
+            In the lazy mode, the files are listed in the order they are parsed on demand.
+
+            :return: the list of the pairs of the file path and the parse time in seconds
+        """
+        return list(self._parse_timings)
+
     def _load_config_files(self, *filepaths):
-        meta_container_map = {}
+        parser_index = self._index_parsers()
+        jobs         = [(self._select_parser(filepath, parser_index), filepath) for filepath in filepaths]
+
+        if self._workers and self._workers > 1 and len(jobs) > 1:
+            cache_dirs = [self._cache.directory if self._cache else None] * len(jobs)
+
+            with ProcessPoolExecutor(min(self._workers, len(jobs))) as executor:
+                results = list(executor.map(_parse_config_file_in_worker, *zip(*jobs), cache_dirs))
+        else:
+            results = [_parse_config_file(parser, filepath, self._cache) + (None,) for parser, filepath in jobs]
+
+        meta_container_map  = {}
+        defining_file_paths = {}  # entity ID -> file path
+        parse_timings       = []
+
+        # NOTE Merge in the order of the files, so the later files override the earlier ones.
+        for filepath, (sub_meta_container_map, elapsed_time, cache_stats) in zip(filepaths, results):
+            parse_timings.append((filepath, elapsed_time))
+
+            if cache_stats:
+                self._cache.merge(cache_stats)
+
+            if not self._allow_override:
+                for entity_id in sub_meta_container_map:
+                    if entity_id in defining_file_paths:
+                        raise DuplicateContainerIDError(
+                            '{} is defined in both {} and {}.'.format(entity_id, defining_file_paths[entity_id], filepath)
+                        )
+
+                    defining_file_paths[entity_id] = filepath
+
+            meta_container_map.update(sub_meta_container_map)
+
+            log.debug('Parsed %s in %.3f s', filepath, elapsed_time)
+
+        self._parse_timings = parse_timings
+
+        return meta_container_map
+
+    def _scan_config_files(self, *filepaths) -> List[Fragment]:
+        parser_index        = self._index_parsers()
+        fragments           = []
+        defining_file_paths = {}  # entity ID -> file path
 
         for filepath in filepaths:
-            config_handled = False
+            parser = self._select_parser(filepath, parser_index)
+
+            ids, intercepted_ids = parser.scan(filepath)
+
+            if not self._allow_override:
+                for entity_id in ids:
+                    if entity_id in defining_file_paths:
+                        raise DuplicateContainerIDError(
+                            '{} is defined in both {} and {}.'.format(entity_id, defining_file_paths[entity_id], filepath)
+                        )
 
-            for parser in self._parsers:
-                if not parser.can_handle(filepath):
-                    continue
+                    defining_file_paths[entity_id] = filepath
 
-                sub_meta_container_map = parser.parse(filepath)
+            fragments.append(Fragment(filepath, ids, partial(self._load_fragment, parser, filepath), intercepted_ids))
 
-                meta_container_map.update(sub_meta_container_map)
+        return fragments
 
-                config_handled = True
+    def _load_fragment(self, parser, filepath : str) -> dict:
+        meta_container_map, elapsed_time = _parse_config_file(parser, filepath, self._cache)
 
-            if not config_handled:
-                raise UnsupportedConfigFileError(filepath)
+        self._parse_timings.append((filepath, elapsed_time))
+
+        log.debug('Parsed %s in %.3f s on demand', filepath, elapsed_time)
 
         return meta_container_map
+
+    def _index_parsers(self) -> dict:
+        """ Index the parsers by the file extension, the first parser first. """
+        parser_index = {}
+
+        for parser in self._parsers:
+            for extension in parser.__extensions__:
+                parser_index.setdefault(extension, parser)
+
+        return parser_index
+
+    def _select_parser(self, filepath : str, parser_index : dict):
+        """ Select the parser by the file extension, or by probing the parsers without extensions. """
+        parser = parser_index.get(os.path.splitext(filepath)[1].lower())
+
+        if parser:
+            return parser
+
+        for parser in self._parsers:
+            if not parser.__extensions__ and parser.can_handle(filepath):
+                return parser
+
+        raise UnsupportedConfigFileError(filepath)
+
+
+def _parse_config_file(parser, filepath : str, cache : ConfigCache = None) -> tuple:
+    """ Parse the configuration file.
+
+        :return: the map of the meta containers and the parse time in seconds
+    """
+    started_time       = time.perf_counter()
+    meta_container_map = cache.load(parser, filepath) if cache else parser.parse(filepath)
+
+    return meta_container_map, time.perf_counter() - started_time
+
+
+def _parse_config_file_in_worker(parser, filepath : str, cache_dir : str = None) -> tuple:
+    """ Parse the configuration file in a worker process.
+
+        :return: the map of the meta containers, the parse time in seconds and the statistics of the cache
+    """
+    cache = ConfigCache(cache_dir) if cache_dir else None
+
+    return _parse_config_file(parser, filepath, cache) + (cache.stats() if cache else None,)
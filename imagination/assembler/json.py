@@ -0,0 +1,16 @@
+# v2
+import json
+
+from .mapping import MappingConfigParser
+
+
+class JSONParser(MappingConfigParser):
+    """ JSON configuration parser
+
+        See :func:`imagination.assembler.mapping.convert_definition_to_meta_container` for the format.
+    """
+    __extensions__ = ('.json',)
+
+    def load(self, filepath : str) -> dict:
+        with open(filepath, 'rb') as f:
+            return json.load(f)
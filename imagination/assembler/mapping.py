@@ -0,0 +1,182 @@
+# v2
+import json
+
+from ..meta.container  import Container
+from ..meta.definition import ParameterCollection, DataDefinition, Interception, MethodCall
+from .abstract         import ConfigParser
+from .handlers         import EntityCreator, FactorizationCreator, LambdaCreator
+from .xml              import SELF_REFERENCE, UndefinedSelfIDError, UnknownEventTypeError, UnsupportedContainerError
+
+_container_creators = [EntityCreator, FactorizationCreator, LambdaCreator]
+_collection_kinds   = ('tuple', 'list', 'set', 'frozenset', 'dict')
+
+
+class MappingNode(object):
+    """ Adapter of a container definition to the node interface used by the container creators """
+    __slots__ = ('definition',)
+
+    def __init__(self, definition : dict):
+        self.definition = definition
+
+    def attribute(self, key : str):
+        value = self.definition.get(key)
+
+        return None if value is None else str(value)
+
+
+def convert_definition_to_meta_container(container_id : str, definition : dict) -> Container:
+    """ Convert the definition of a container, e.g., from JSON or TOML, to a meta container.
+
+        The definition mirrors the XML elements, e.g.,
+
+        .. code-block:: json
+
+            {
+                "type": "entity",
+                "class": "app.report.Report",
+                "params": [
+                    {"name": "final_exam_score", "type": "int", "value": 89},
+                    {"name": "calculator", "type": "entity", "value": "calc"}
+                ],
+                "interceptions": [{"before": "calc", "do": "add", "with": "log"}],
+                "calls": [{"method": "prepare", "params": [{"type": "entity", "value": "self"}]}]
+            }
+
+        where ``type`` is either ``entity`` (default), ``factorization`` or ``callable``.
+    """
+    container_type   = str(definition.get('type') or 'entity').lower()
+    container_params = convert_definitions_to_parameter_collection(definition.get('params') or [])
+    interceptions    = convert_definitions_to_interception_metadatas(container_id, definition.get('interceptions') or [])
+    initial_calls    = convert_definitions_to_initial_method_calls(container_id, definition.get('calls') or [])
+
+    for creator in _container_creators:
+        if not creator.can_handle(container_type):
+            continue
+
+        return creator.create(container_id, container_params, interceptions, MappingNode(definition),
+                              initial_calls)
+
+    raise UnsupportedContainerError(container_type)
+
+
+def convert_definitions_to_parameter_collection(param_definitions : list, self_id = None) -> ParameterCollection:
+    collection = ParameterCollection()
+
+    for param_definition in param_definitions:
+        name = param_definition.get('key') or param_definition.get('name') or None
+        kind = param_definition.get('type')
+
+        definition = convert_definitions_to_parameter_collection(param_definition.get('items') or [], self_id) \
+            if kind in _collection_kinds \
+            else _to_definition_string(param_definition.get('value'))
+
+        if kind == 'entity' and definition == SELF_REFERENCE:
+            if not self_id:
+                raise UndefinedSelfIDError('The self-reference ID is undefined.')
+
+            definition = self_id
+
+        data = DataDefinition(definition, name, kind)
+
+        collection.add(data, name)
+
+    return collection
+
+
+def convert_definitions_to_initial_method_calls(entity_id : str, call_definitions : list) -> list:
+    method_calls = []
+
+    for call_definition in call_definitions:
+        method_name = call_definition.get('method')
+        actor_id    = call_definition.get('from') or entity_id
+
+        definition = convert_definitions_to_parameter_collection(call_definition.get('params') or [],
+                                                                 self_id = entity_id)
+
+        method_calls.append(MethodCall(actor_id, method_name, definition))
+
+    return method_calls
+
+
+def convert_definitions_to_interception_metadatas(interceptor_id : str, interception_definitions : list) -> list:
+    interceptions = []
+
+    for interception_definition in interception_definitions:
+        event_type     = None
+        intercepted_id = None
+
+        for known_event_type in Interception.__known_events__:
+            if interception_definition.get(known_event_type):
+                event_type     = known_event_type
+                intercepted_id = interception_definition[event_type]
+
+                break
+
+        try:
+            interceptions.append(Interception(
+                when_to_intercept   = event_type,
+                intercepted_id      = intercepted_id,
+                method_to_intercept = interception_definition.get('do'),
+                interceptor_id      = interceptor_id,
+                intercepting_method = interception_definition.get('with'),
+            ))
+        except AssertionError as e:
+            raise UnknownEventTypeError(
+                'Invalid Interception for {} ({})'.format(
+                    interceptor_id,
+                    e
+                )
+            )
+
+    return interceptions
+
+
+def _to_definition_string(value) -> str:
+    """ Convert the native value to the string definition, as if it is written in XML. """
+    if value is None or isinstance(value, str):
+        return value
+
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+
+    if isinstance(value, (int, float)):
+        return str(value)
+
+    if isinstance(value, (dict, list)):
+        # NOTE For the "json" type
+        return json.dumps(value)
+
+    # NOTE e.g., the dates and times of TOML
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+class MappingConfigParser(ConfigParser):
+    """ Base configuration parser for the formats decoded into a map of the entity ID to the definition """
+    def can_handle(self, filepath : str):
+        return filepath.lower().endswith(self.__extensions__)
+
+    def parse(self, filepath : str):
+        container_map = {}
+
+        for container_id, definition in self.load(filepath).items():
+            container_map[container_id] = convert_definition_to_meta_container(container_id, definition)
+
+        return container_map
+
+    def scan(self, filepath : str) -> tuple:
+        definitions     = self.load(filepath)
+        intercepted_ids = set()
+
+        for definition in definitions.values():
+            for interception_definition in definition.get('interceptions') or []:
+                for known_event_type in Interception.__known_events__:
+                    if interception_definition.get(known_event_type):
+                        intercepted_ids.add(interception_definition[known_event_type])
+
+                        break
+
+        return list(definitions), sorted(intercepted_ids)
+
+    def load(self, filepath : str) -> dict:
+        """ Decode the file into the map of the entity ID to the definition. """
+        raise NotImplementedError()
@@ -0,0 +1,23 @@
+# v2
+from .mapping import MappingConfigParser
+
+
+class TOMLParser(MappingConfigParser):
+    """ TOML configuration parser
+
+        The parser uses :mod:`tomllib` from Python 3.11, or ``tomli`` with the
+        older versions of Python.
+
+        See :func:`imagination.assembler.mapping.convert_definition_to_meta_container` for the format.
+    """
+    __extensions__ = ('.toml',)
+
+    def load(self, filepath : str) -> dict:
+        try:
+            import tomllib
+        except ImportError:
+            # NOTE Python 3.10 or older
+            import tomli as tomllib
+
+        with open(filepath, 'rb') as f:
+            return tomllib.load(f)
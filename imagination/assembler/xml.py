@@ -1,7 +1,6 @@
 # v2
 import re
-
-from kotoba import load_from_file
+from xml.etree.ElementTree import iterparse
 
 from ..meta.container  import Container
 from ..meta.definition import ParameterCollection, DataDefinition, Interception, MethodCall
@@ -54,7 +53,7 @@ def convert_container_node_to_parameter_collection(node, key_property_name = Non
         kind = child_node.attribute('type')
 
         definition = convert_container_node_to_parameter_collection(child_node, 'key', self_id) \
-            if kind in ('tuple', 'list', 'dict') \
+            if kind in ('tuple', 'list', 'set', 'frozenset', 'dict') \
             else child_node.data().strip()
 
         if kind == 'entity' and definition == SELF_REFERENCE:
@@ -123,7 +122,37 @@ def convert_blocks_to_interception_metadatas(node):
     return interceptions
 
 
+class ElementNode(object):
+    """ Adapter of :class:`xml.etree.ElementTree.Element` to the node interface of kotoba
+
+        Only the methods used by the converters are implemented.
+    """
+    __slots__ = ('element',)
+
+    def __init__(self, element):
+        self.element = element
+
+    def name(self) -> str:
+        return self.element.tag
+
+    def attribute(self, key : str):
+        return self.element.get(key)
+
+    def children(self, name : str = None) -> list:
+        return [
+            ElementNode(child)
+            for child in self.element
+            if name is None or child.tag == name
+        ]
+
+    def data(self) -> str:
+        return ''.join(self.element.itertext())
+
+
 class XMLParser(ConfigParser):
+    """ XML configuration parser based on the DOM of kotoba """
+    __extensions__ = ('.xml',)
+
     def __init__(self):
         self._re_acceptable_file_extension = re.compile(r'\.xml$', re.IGNORECASE)
 
@@ -131,6 +160,9 @@ class XMLParser(ConfigParser):
         return bool(self._re_acceptable_file_extension.search(filepath))
 
     def parse(self, filepath : str):
+        # NOTE kotoba is only imported when this parser is used.
+        from kotoba import load_from_file
+
         root_node     = load_from_file(filepath)
         container_map = {}
 
@@ -140,3 +172,70 @@ class XMLParser(ConfigParser):
             container_map[meta_container.id] = meta_container
 
         return container_map
+
+    def scan(self, filepath : str) -> tuple:
+        ids             = []
+        intercepted_ids = set()
+        root_element    = None
+        depth           = 0
+
+        for event, element in iterparse(filepath, events = ('start', 'end')):
+            if event == 'start':
+                if root_element is None:
+                    root_element = element
+
+                depth += 1
+
+                if depth == 2:
+                    ids.append(element.get('id'))
+
+                continue
+
+            depth -= 1
+
+            if depth == 2 and element.tag == 'interception':
+                for known_event_type in Interception.__known_events__:
+                    if element.get(known_event_type):
+                        intercepted_ids.add(element.get(known_event_type))
+
+                        break
+
+            if depth == 1:
+                root_element.clear()
+
+        return ids, sorted(intercepted_ids)
+
+
+class StreamingXMLParser(XMLParser):
+    """ XML configuration parser based on the incremental parser of the standard library
+
+        Each top-level element is converted into a meta container as soon as
+        it is fully parsed, and then discarded, so the memory usage does not
+        grow with the size of the file.
+    """
+    def parse(self, filepath : str):
+        container_map = {}
+        root_element  = None
+        depth         = 0
+
+        for event, element in iterparse(filepath, events = ('start', 'end')):
+            if event == 'start':
+                if root_element is None:
+                    root_element = element
+
+                depth += 1
+
+                continue
+
+            depth -= 1
+
+            if depth != 1:
+                continue
+
+            meta_container = convert_container_node_to_meta_container(ElementNode(element))
+
+            container_map[meta_container.id] = meta_container
+
+            root_element.clear()
+
+        return container_map
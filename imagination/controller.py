@@ -1,24 +1,24 @@
 # v2
 import inspect
 import logging
+import threading
 
-from .debug import get_logger
-from .exc import MissingParameterException, UnexpectedDefinitionTypeException
-from .loader import Loader
+from .debug import get_entity_logger
+from .exc import CircularDependencyError, MissingParameterException, UnexpectedDefinitionTypeException
+from .helper.signature import get_parameters
+from .loader import attributing, resolve_symbol
 from .meta.container import Container, Entity, Factorization, Lambda
-from .meta.definition import ParameterCollection
-from .wrapper import Wrapper
+from .meta.definition import DataDefinition, ParameterCollection
+from .wrapper import InterceptorBinder, Wrapper
 
+# The number of activations in progress on each thread
+_activation_depth = threading.local()
 
-def _assert_with_annotation(entity_id, metadata):
-    definition = metadata.value
-    param_name = metadata.spec.name
-    param_annotation = metadata.spec.annotation
+# The controllers constructing their entities on each thread, in the order of the requests
+_construction_path = threading.local()
 
-    if isinstance(definition, Undefined):
-        # No assertion on undefined definition.
-        return
 
+def _assert_with_annotation(entity_id, param_name, param_annotation, definition):
     definition_type = type(definition)
 
     try:
@@ -41,24 +41,92 @@ def _assert_with_annotation(entity_id, metadata):
         pass
 
 
+def _is_activating() -> bool:
+    """ Check if the current thread is in the middle of activating any entity. """
+    return getattr(_activation_depth, 'value', 0) > 0
+
+
+class _Activating(object):
+    """ Context to mark the current thread as activating an entity """
+    def __enter__(self):
+        _activation_depth.value = getattr(_activation_depth, 'value', 0) + 1
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _activation_depth.value -= 1
+
+
+class _Constructing(object):
+    """ Context to mark the current thread as constructing the entity of the controller
+
+        As the construction lock cannot be acquired twice, the same thread
+        constructing the same entity again is detected before taking the lock.
+
+        :raises CircularDependencyError: when the current thread is already constructing the entity
+    """
+    def __init__(self, controller):
+        self.__controller = controller
+
+    def __enter__(self):
+        path = getattr(_construction_path, 'value', None)
+
+        if path is None:
+            path = _construction_path.value = []
+
+        if self.__controller in path:
+            cycle = path[path.index(self.__controller):] + [self.__controller]
+
+            raise CircularDependencyError(' -> '.join(controller.metadata.id for controller in cycle))
+
+        path.append(self.__controller)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _construction_path.value.pop()
+
+
 class Controller(object):
+    """ Entity Controller
+
+        The controller activates the entity by replaying an activation plan,
+        which is compiled once per callable from the signature of the callable
+        and the definition of the parameters. When the controller is not told
+        that the core is on lockdown, the plans are compiled on every activation
+        as the metadata may still change.
+    """
     def __init__(self,
                  metadata: Container,
                  core_get: callable,
                  core_get_interceptions: callable,
                  transformer_cast: callable,
+                 core_is_on_lockdown: callable = None,
+                 interceptor_binder: InterceptorBinder = None,
+                 wrapper_factory: callable = Wrapper,
+                 transformer_fold: callable = None,
                  ):
         self.__metadata = metadata
         self.__core_get = core_get
         self.__core_get_interceptions = core_get_interceptions
+        self.__core_is_on_lockdown = core_is_on_lockdown
+        self.__interceptor_binder = interceptor_binder
+        self.__wrapper_factory = wrapper_factory
         self.__transformer_cast = transformer_cast
-        self.__logger = get_logger('controller/{}'.format(metadata.id))
+        self.__transformer_fold = transformer_fold
+        self.__logger = None  # Entity Logger (created on the first use)
         self.__container_instance = None  # Cache
         self.__wrapper_instance = None  # Wrapper Cache
-        self.__ignored_parameters = []
+        self.__activation_plan = None  # Activation Plan Cache
+        self.__initial_call_plans = {}  # Index of the initial call -> Activation Plan Cache
+        self.__lock = threading.Lock()  # Once-only construction lock
+        self.__constructed = None  # (instance, ready event) while the initial method calls are running
 
         self.activation_sequence = None  # Activation Sequence
 
+    @property
+    def logger(self):
+        if self.__logger is None:
+            self.__logger = get_entity_logger(self.__metadata.id)
+
+        return self.__logger
+
     @property
     def metadata(self):
         return self.__metadata
@@ -67,16 +135,21 @@ class Controller(object):
     def instance(self):
         return self.__wrapper_instance or self.__container_instance
 
+    @property
+    def activation_plan(self):
+        """ The compiled activation plan (``None`` if the plan is not compiled yet) """
+        return self.__activation_plan
+
     @property
     def instantiator(self):
         metadata = self.__metadata
         container_type = type(metadata)
 
         if container_type is Lambda:
-            return Loader(metadata.fq_callable_name).package
+            return resolve_symbol(metadata.fq_callable_name)
 
         if container_type is Entity:
-            return Loader(metadata.fqcn).package
+            return resolve_symbol(metadata.fqcn)
         elif container_type is Factorization:
             factory_service = self.__core_get(metadata.factory_id)
             factory_method_name = metadata.factory_method_name
@@ -88,75 +161,212 @@ class Controller(object):
         return self.__wrapper_instance is not None or self.__container_instance is not None
 
     def activate(self, previously_activated: list = None):
-        previously_activated = previously_activated or []
-
+        """ Activate the entity, including the initial method calls.
+
+            The activation of a cacheable entity happens only once. When multiple
+            threads activate the same entity concurrently, all of them wait for
+            the one doing the construction.
+
+            The lock is released before the initial method calls, which may
+            activate the other entities. Until the initial method calls are
+            done, the other threads requesting the entity wait for them, except
+            the threads in the middle of activating other entities, e.g., with
+            the initial method calls forming a cycle. Like the sequential
+            activation, those get the constructed instance right away, so that
+            no thread waits for another one waiting for itself.
+
+            :raises CircularDependencyError: when the construction requests the entity again on the same thread
+        """
         if self.activated():
             return self.__wrapper_instance or self.__container_instance
 
-        if self.metadata.id in previously_activated:
-            raise CircularDependencyError(
-                '{}: previous activation sequence: {}'.format(self.metadata.id, ', '.join(previously_activated)))
+        previously_activated = previously_activated or []
+
+        if not self.__metadata.cacheable:
+            # NOTE Non-cacheable (prototype) entities are never kept by the controller.
+            with _Activating():
+                with _Constructing(self):
+                    new_instance, wrapper_instance = self.__construct(previously_activated)
+
+                instance = wrapper_instance or new_instance
+
+                self.__run_initial_calls(instance, previously_activated)
 
-        previously_activated.append(self.metadata.id)
+            return instance
 
-        new_instance = self.__instantiate_container(previously_activated)
+        while True:
+            with _Constructing(self), self.__lock:
+                # NOTE Another thread may have completed the activation while this thread was waiting for the lock.
+                if self.activated():
+                    return self.__wrapper_instance or self.__container_instance
 
-        if self.__metadata.cacheable:
-            self.__container_instance = new_instance
+                constructed = self.__constructed
+
+                if constructed is None:
+                    with _Activating():
+                        new_instance, wrapper_instance = self.__construct(previously_activated)
+
+                    instance = wrapper_instance or new_instance
+                    ready    = threading.Event()
+
+                    self.__constructed = (instance, ready)
+
+                    break
+
+            instance, ready = constructed
+
+            # NOTE The initial method calls may request the same entity on the same thread too.
+            if _is_activating():
+                return instance
+
+            ready.wait()
+
+            # NOTE Retry if the initial method calls failed.
+
+        try:
+            with _Activating():
+                self.__run_initial_calls(instance, previously_activated)
+
+            # Publish the instance.
+            with self.__lock:
+                self.__wrapper_instance = wrapper_instance
+                self.__container_instance = new_instance
+        finally:
+            with self.__lock:
+                self.__constructed = None
+
+            ready.set()
+
+        return instance
+
+    def __construct(self, previously_activated: list):
+        # NOTE The circular dependencies are detected by the dependency graph and the construction path of the thread.
+        with attributing(self.__metadata.id):
+            new_instance = self.__instantiate_container(previously_activated)
 
         interceptions = self.__core_get_interceptions(self.__metadata.id)
 
         if not interceptions:
-            return self.__container_instance
+            return new_instance, None
 
-        self.__wrapper_instance = Wrapper(
+        return new_instance, self.__wrapper_factory(
             self.__core_get,
-            self.__container_instance,
-            interceptions
+            new_instance,
+            interceptions,
+            self.__interceptor_binder,
         )
 
-        return self.__wrapper_instance
-
     def __instantiate_container(self, previously_activated: list):
-        if isinstance(self.__metadata, Lambda):
-            return self.instantiator
+        plan = self.__activation_plan
+
+        if plan is None:
+            target = self.instantiator
+            plan = self.__compile_plan(target,
+                                       self.__metadata.params,
+                                       # NOTE The callable of a factorization depends on the factory service.
+                                       cacheable_target = type(self.__metadata) is not Factorization)
 
-        return self.__execute(self.instantiator,
-                              self.__cast_to_params(self.__metadata.params,
-                                                    previously_activated))
+            if self.__plan_cacheable():
+                self.__activation_plan = plan
+        else:
+            target = plan.target if plan.target is not None else self.instantiator
 
-    def run_initial_calls(self, previously_activated: list):
-        internal_instance = self.activate(previously_activated)
+        if isinstance(self.__metadata, Lambda):
+            return target
 
-        for initial_call in self.__metadata.initial_calls:
-            self.__execute_after_instantiation(internal_instance, initial_call.method_name, initial_call.parameters,
-                                               previously_activated)
+        args, kwargs = self.__resolve_arguments(plan, previously_activated)
 
-    def __execute(self, target_callable, params):
-        # Compile parameters.
-        signature = inspect.signature(target_callable)
-        expected_params = [signature.parameters[name] for name in signature.parameters]
-        enable_auto_wiring = self.metadata.auto_wired
+        return target(*args, **kwargs)
 
-        # Check whether the signature include dynamic parameters.
-        self.__scan_for_dynamic_parameters(expected_params)
-        parameters = self.__scan_for_usable_parameters(params, expected_params, auto_wire=enable_auto_wiring)
+    def __run_initial_calls(self, instance, previously_activated: list):
+        with attributing(self.__metadata.id):
+            for index, initial_call in enumerate(self.__metadata.initial_calls):
+                self.__execute_after_instantiation(instance, index, initial_call, previously_activated)
 
-        return target_callable(*parameters['args'], **parameters['kwargs'])
+    def __execute_after_instantiation(self, instance, index, initial_call, previously_activated):
+        method_name = initial_call.method_name
 
-    def __execute_after_instantiation(self, instance, method_name, params, previously_activated):
         if not hasattr(instance, method_name):
             raise AttributeError('The entity {} has no method named {}.'.format(self.__metadata.id, method_name))
 
-        parameters = self.__cast_to_params(params, previously_activated)
+        target_callable = getattr(instance, method_name)
+        plan = self.__initial_call_plans.get(index)
+
+        if plan is None:
+            plan = self.__compile_plan(target_callable, initial_call.parameters)
+
+            if self.__plan_cacheable():
+                self.__initial_call_plans[index] = plan
+
+        args, kwargs = self.__resolve_arguments(plan, previously_activated)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('%s.%s(%s)', instance, method_name, {'args': args, 'kwargs': kwargs})
+
+        target_callable(*args, **kwargs)
+
+    def __plan_cacheable(self):
+        return self.__core_is_on_lockdown is None or self.__core_is_on_lockdown()
+
+    def __compile_plan(self, target_callable, params: ParameterCollection, cacheable_target: bool = False):
+        """ Compile the activation plan for the given callable and parameter definitions. """
+        if isinstance(self.__metadata, Lambda):
+            return ActivationPlan(target_callable, (), ())
+
+        # NOTE Dynamic parameters (*args and **kwargs) are not considered as fixed parameters.
+        expected_params = [
+            param
+            for param in get_parameters(target_callable)
+            if param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+        ]
+
+        given_params = {
+            'sequence': [ParameterSlot(index, definition) for index, definition in enumerate(params.sequence())],
+            'items': {key: ParameterSlot(key, definition) for key, definition in params.items()},
+        }
+
+        parameters = self.__scan_for_usable_parameters(given_params, expected_params, auto_wire=self.metadata.auto_wired)
+
+        # NOTE The literal definitions are only cast once the definitions cannot change anymore.
+        if self.__transformer_fold is not None and self.__plan_cacheable():
+            for slot in parameters['args'] + list(parameters['kwargs'].values()):
+                slot.fold(self.__transformer_fold)
+
+        return ActivationPlan(target_callable if cacheable_target else None,
+                              tuple(parameters['args']),
+                              tuple(parameters['kwargs'].items()))
 
-        logging.debug('[Imagination/Controller] {}.{}({})'.format(
-            instance,
-            method_name,
-            parameters,
-        ))
+    def __resolve_arguments(self, plan, previously_activated: list):
+        args = [self.__resolve(slot, previously_activated) for slot in plan.args]
+        kwargs = {name: self.__resolve(slot, previously_activated) for name, slot in plan.kwargs}
 
-        self.__execute(getattr(instance, method_name), parameters)
+        return args, kwargs
+
+    def __resolve(self, slot, previously_activated: list):
+        if slot.auto_wired_type is not None:
+            value = self.__core_get(slot.auto_wired_type)
+        elif slot.constant:
+            value = slot.value
+        elif slot.copy is not None:
+            value = slot.copy()
+        else:
+            try:
+                value = self.__transformer_cast(slot.definition, previously_activated)
+            except TypeError:
+                if isinstance(slot.source, int):
+                    raise ValueInterpretationError(
+                        'Entity "{}": Failed to interpret {} (positional)'.format(self.__metadata.id,
+                                                                                  slot.definition))
+
+                raise ValueInterpretationError(
+                    'Entity "{}": Failed to interpret "{}" -> {} (keyword)'.format(self.__metadata.id,
+                                                                                    slot.source,
+                                                                                    slot.definition))
+
+        if slot.annotation is not inspect._empty:
+            _assert_with_annotation(self.__metadata.id, slot.name, slot.annotation, value)
+
+        return value
 
     def __scan_for_usable_parameters(self, given_params, expected_params, auto_wire: bool):
         fixed_parameter_list = []
@@ -167,9 +377,6 @@ class Controller(object):
         iterating_index = 0
 
         for expected_param in expected_params:
-            if expected_param.name in self.__ignored_parameters:
-                continue
-
             parameter_name = expected_param.name
             parameter_required = expected_param.default and expected_param.default == inspect._empty
             parameter_metadata = ParameterMetadata(iterating_index, parameter_name, parameter_required, expected_param)
@@ -185,22 +392,22 @@ class Controller(object):
         # Gather definitions from the given parameters.
         iterating_index = 0  # reset the index
 
-        self.__logger.debug('ID {}: Given: {}'.format(self.__metadata.id, given_params))
+        self.logger.debug('Given: %s', given_params)
 
         # First, consider the keyword ones.
         # FIXME This is for backward-compatibility and the whole loop will be removed in version 3.
         for key, definition in given_params['items'].items():
             # Handle a dynamic parameter.
             if key not in fixed_parameter_map:
-                self.__logger.debug(
-                    'ID {}: Keyword Param ({} -> {}): Considered as extra'.format(self.__metadata.id, key, definition))
+                self.logger.debug(
+                    'Keyword Param (%s -> %s): Considered as extra', key, definition)
 
                 keywoard_parameters[key] = definition
 
                 continue
 
-            self.__logger.debug(
-                'ID {}: Keyword Param ({} -> {}): Considered as defined'.format(self.__metadata.id, key, definition))
+            self.logger.debug(
+                'Keyword Param (%s -> %s): Considered as defined', key, definition)
 
             fixed_parameter = fixed_parameter_map[key]
 
@@ -214,8 +421,8 @@ class Controller(object):
         for definition in given_params['sequence']:
             # Handle a dynamic parameter.
             if iterating_index >= fixed_parameter_count:
-                self.__logger.debug(
-                    'ID {}: Positional Param ({}): Considered as extra'.format(self.__metadata.id, definition))
+                self.logger.debug(
+                    'Positional Param (%s): Considered as extra', definition)
 
                 positional_parameters.append(definition)
 
@@ -226,15 +433,15 @@ class Controller(object):
             # Handle a defined parameter.
             # FIXME This is for backward-compatibility and this block will be removed in version 3.
             if fixed_parameter.defined:
-                self.__logger.debug(
-                    'ID {}: Positional Param ({}): Backward compatible'.format(self.__metadata.id, definition))
+                self.logger.debug(
+                    'Positional Param (%s): Backward compatible', definition)
 
                 positional_parameters.append(definition)
 
                 continue
 
-            self.__logger.debug(
-                'ID {}: Positional Param ({}): Considered as defined'.format(self.__metadata.id, definition))
+            self.logger.debug(
+                'Positional Param (%s): Considered as defined', definition)
 
             fixed_parameter.defined = True
             fixed_parameter.value = definition
@@ -250,21 +457,19 @@ class Controller(object):
         auto_wiring_count = 0
 
         for fixed_parameter in fixed_parameter_list:
-            _assert_with_annotation(self.__metadata.id, fixed_parameter)
-
             if fixed_parameter.defined:
-                self.__logger.debug('ID {}: Param {}: Already defined'.format(self.__metadata.id, fixed_parameter.name))
+                self.logger.debug('Param %s: Already defined', fixed_parameter.name)
 
                 continue
 
             if not fixed_parameter.required:
-                self.__logger.debug('ID {}: Param {}: Delegated'.format(self.__metadata.id, fixed_parameter.name))
+                self.logger.debug('Param %s: Delegated', fixed_parameter.name)
 
                 undefined_fixed_parameter_count -= 1
 
                 continue
 
-            self.__logger.debug('ID {}: Param {}: Not defined'.format(self.__metadata.id, fixed_parameter.name))
+            self.logger.debug('Param %s: Not defined', fixed_parameter.name)
 
             feature_info_list = ['pos: {}'.format(fixed_parameter.index)]
 
@@ -276,7 +481,8 @@ class Controller(object):
                 if not issubclass(annotation, (int, float, bytes, bool, str, complex, set, dict, list, tuple)):
                     if auto_wire:  # Attempt to automatically wire a missing dependency.
                         auto_wiring_count += 1
-                        given_params['items'][fixed_parameter.name] = self.__core_get(annotation)
+                        given_params['items'][fixed_parameter.name] = ParameterSlot(fixed_parameter.name,
+                                                                                    auto_wired_type = annotation)
                     else:
                         feature_info_list.append('ignored: auto-wire')
 
@@ -293,10 +499,10 @@ class Controller(object):
 
         # When NOT all fixed parameters are defined, all additional positional parameters will be disregarded.
         if undefined_fixed_parameter_count > 0:
-            kwargs = {key: metadata.value for key, metadata in fixed_parameter_map.items() if metadata.defined}
+            kwargs = {key: metadata.bind() for key, metadata in fixed_parameter_map.items() if metadata.defined}
             kwargs.update(keywoard_parameters)
 
-            logging.info('Not all fixed parameters defined. All positional parameters will be ignored.')
+            self.logger.info('Not all fixed parameters defined. All positional parameters will be ignored.')
 
             return {
                 'args': [],
@@ -304,7 +510,7 @@ class Controller(object):
             }
 
         # When all fixed parameters are defined, they will be converted into positional parameters.
-        args = [parameter.value for parameter in fixed_parameter_list if parameter.defined]
+        args = [parameter.bind() for parameter in fixed_parameter_list if parameter.defined]
         args.extend(positional_parameters)
 
         return {
@@ -312,41 +518,6 @@ class Controller(object):
             'kwargs': keywoard_parameters,
         }
 
-    def __scan_for_dynamic_parameters(self, expected_params):
-        for param in expected_params:
-            if param.kind == param.VAR_POSITIONAL:
-                self.__ignored_parameters.append(param.name)
-
-            if param.kind == param.VAR_KEYWORD:
-                self.__ignored_parameters.append(param.name)
-
-    def __cast_to_params(self, params: ParameterCollection, previously_activated: list):
-        sequence = []
-        items = {}
-
-        for item in params.sequence():
-            try:
-                sequence.append(self.__transformer_cast(item, previously_activated))
-            except TypeError:
-                raise ValueInterpretationError(
-                    'Entity "{}": Failed to interpret {} (positional)'.format(self.__metadata.id, item))
-
-        for key, value in params.items():
-            try:
-                items[key] = self.__transformer_cast(value, previously_activated)
-            except TypeError:
-                raise ValueInterpretationError(
-                    'Entity "{}": Failed to interpret "{}" -> {} (keyword)'.format(self.__metadata.id, key, value))
-
-        return {
-            'sequence': sequence,
-            'items': items,
-        }
-
-
-class CircularDependencyError(RuntimeError):
-    """ Circular Dependency Error """
-
 
 class ValueInterpretationError(RuntimeError):
     """ Value interpretation error """
@@ -366,3 +537,81 @@ class ParameterMetadata(object):
         self.defined = False
         self.source_type = None  # list or dict
         self.source_ref = None  # index (list) or key (dict)
+
+    def bind(self):
+        """ Bind the given parameter slot to this parameter. """
+        return self.value.bind(self.name, self.spec.annotation)
+
+
+class ParameterSlot(object):
+    """ Parameter slot of an activation plan
+
+        :param source: the index (positional) or the key (keyword) of the given definition
+        :param definition: the given definition (``None`` if the slot is auto-wired)
+        :param str name: the name of the bound parameter (``None`` for extra parameters)
+        :param annotation: the annotation of the bound parameter
+        :param auto_wired_type: the type of the service to wire automatically
+    """
+    __slots__ = ('source', 'definition', 'name', 'annotation', 'auto_wired_type', 'reference', 'constant', 'value',
+                 'copy')
+
+    def __init__(self, source, definition = None, name = None, annotation = inspect._empty, auto_wired_type = None):
+        self.source = source
+        self.definition = definition
+        self.name = name
+        self.annotation = annotation
+        self.auto_wired_type = auto_wired_type
+
+        # An entity reference must be resolved on every activation.
+        self.reference = auto_wired_type is not None \
+            or (type(definition) is DataDefinition and definition.kind == 'entity')
+
+        # A literal definition is used as it is.
+        self.constant = not self.reference \
+            and (type(definition) is not DataDefinition or not definition.transformation_required)
+        self.value = (definition if type(definition) is not DataDefinition else definition.definition) \
+            if self.constant \
+            else None
+        self.copy = None  # Copier of the folded mutable value
+
+    def bind(self, name, annotation):
+        return ParameterSlot(self.source, self.definition, name, annotation, self.auto_wired_type)
+
+    def fold(self, transformer_fold: callable):
+        """ Use the value cast ahead of the activation if the definition is literal. """
+        if self.reference or self.constant:
+            return
+
+        folded = transformer_fold(self.definition)
+
+        if folded is None:
+            return
+
+        if folded.mutable:
+            self.copy = folded.copy
+
+            return
+
+        self.constant = True
+        self.value = folded.value
+
+    def __repr__(self):
+        if self.auto_wired_type is not None:
+            return '<auto-wired {}>'.format(self.auto_wired_type)
+
+        return repr(self.definition)
+
+
+class ActivationPlan(object):
+    """ Activation Plan
+
+        :param target: the resolved callable (``None`` if the callable must be resolved on every activation)
+        :param tuple args: the parameter slots of the positional arguments
+        :param tuple kwargs: the pairs of the name and the parameter slot of the keyword arguments
+    """
+    __slots__ = ('target', 'args', 'kwargs')
+
+    def __init__(self, target, args: tuple, kwargs: tuple):
+        self.target = target
+        self.args = args
+        self.kwargs = kwargs
@@ -1,18 +1,23 @@
 # v2
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 import threading
-from typing import Callable, Optional
+import time
+from typing import Callable, Dict, Iterable, List, Optional
 import uuid
 
 from .controller         import Controller
 from .debug              import get_logger
-from .exc                import UndefinedContainerIDError
+from .exc                import UndefinedContainerIDError, UnknownEnvironmentVariableError
 from .helper.context     import DefinitionContext
-from .helper.general     import exclusive_lock
+from .helper.graph       import DependencyGraph
 from .helper.id_naming   import fully_qualified_class_name as default_id_naming_strategy
 from .helper.transformer import Transformer
+from .loader             import attributing, import_timings, resolve_symbol
 from .meta.container     import Container, Entity, Factorization, Lambda
 from .meta.definition    import MethodCall
+from .meta.fragment      import Fragment
+from .wrapper            import InterceptorBinder, ProxyFactory, Wrapper
 
 CORE_SELF_REFERENCE = 'container'
 log = get_logger(__name__)
@@ -35,8 +40,38 @@ class Imagination(object):
                             (1) --> (3) event-type
                                         (1) --> (0..n) interception
 
+        The instances with interceptions are wrapped according to ``wrapper_mode``:
+
+        - ``dynamic`` (default) relays every attribute through :class:`imagination.wrapper.Wrapper`.
+        - ``generated`` uses a proxy class generated once per wrapped type, which makes the access
+          to the attributes almost as fast as on the wrapped instance.
+
+        The classes and callables referenced by the entities are imported according to ``import_policy``:
+
+        - ``lazy`` (default) imports them when the entities are activated.
+        - ``prefetch`` imports them on a background thread after the lockdown, in the order of dependencies.
+        - ``eager`` imports them when the entities are defined, which fails fast on any import error.
+
+        The definitions can also be added as :class:`imagination.meta.fragment.Fragment`,
+        which is only loaded when one of its IDs is first requested, together
+        with the fragments defining its dependencies and its interceptors.
     """
-    def __init__(self, transformer: Transformer = None, standalone_mode: bool = False):
+    # NOTE Each core makes its own wrapper factory, so that the generated proxy classes are not shared.
+    __wrapper_factories__ = {
+        'dynamic'   : lambda: Wrapper,
+        'generated' : ProxyFactory,
+    }
+
+    __import_policies__ = ('lazy', 'prefetch', 'eager')
+
+    def __init__(self, transformer: Transformer = None, standalone_mode: bool = False,
+                 wrapper_mode: str = 'dynamic', import_policy: str = 'lazy'):
+        if wrapper_mode not in self.__wrapper_factories__:
+            raise ValueError(f'Unknown wrapper mode ({wrapper_mode})')
+
+        if import_policy not in self.__import_policies__:
+            raise ValueError(f'Unknown import policy ({import_policy})')
+
         self.__guid = uuid.uuid4()
 
         self.__standalone_mode = standalone_mode
@@ -44,15 +79,31 @@ class Imagination(object):
         self.__internal_lock  = threading.Lock()
         self.__controller_map = {}
         self.__on_lockdown    = False
+        self.__prepared       = False
+
+        self.__dependency_graph = None
         self.__transformer    = transformer or Transformer(self.get)
 
         self.__interception_graph = {}
         self.__initial_calls      = {}
+        self.__interceptor_binder = InterceptorBinder(self.get, self.__is_cacheable)
+        self.__wrapper_factory    = self.__wrapper_factories__[wrapper_mode]()
+        self.__import_policy      = import_policy
+        self.__prefetch_thread    = None
+
+        self.__fragment_lock         = threading.RLock()
+        self.__fragments             = {}  # entity ID -> unloaded Fragment
+        self.__interceptor_fragments = {}  # intercepted entity ID -> unloaded Fragments
 
         # When this property is set, this container will only work as a proxy to
         # the other container.
         self.__original_container = None
 
+        # The table of activated instances by entity ID or class. Once an
+        # instance is resolved, the same key is always resolved to the same
+        # instance, so the table can be read without any lock.
+        self.__resolved_instances = {CORE_SELF_REFERENCE: self}
+
     @property
     def guid(self):
         return self.__guid
@@ -73,9 +124,14 @@ class Imagination(object):
 
         self.__original_container = other
 
+        self.__resolved_instances.clear()
+
     def stop_proxy_mode(self):
         self.__original_container = None
 
+        self.__resolved_instances.clear()
+        self.__resolved_instances[CORE_SELF_REFERENCE] = self
+
     def lock_down(self):
         """ Lock down the core.
 
@@ -83,9 +139,26 @@ class Imagination(object):
 
             .. note:: This method will be invoked on the first ``get`` call.
         """
-        log.debug(f'Lock down the container.')
+        log.debug('Lock down the container.')
         self.__on_lockdown = True
 
+        # Index the whole dependency graph once as the definitions cannot change anymore.
+        self.__dependency_graph = None
+        self.get_dependency_graph()
+
+        # NOTE The definitions may have been updated after they were imported.
+        if self.__import_policy == 'eager':
+            self.import_all()
+
+        if self.__import_policy == 'prefetch' and self.__prefetch_thread is None:
+            self.__prefetch_thread = threading.Thread(target = self.__prefetch_imports,
+                                                      name = 'imagination-prefetch',
+                                                      daemon = True)
+            self.__prefetch_thread.start()
+
+        if self.__prepared:
+            self.__generate_proxy_classes()
+
     def is_on_lockdown(self) -> bool:
         """ Check if the core is locked down. """
         return self.__on_lockdown
@@ -103,10 +176,141 @@ class Imagination(object):
             else:
                 raise CoreOnLockDownError('Failed to batch-update the meta container map')
 
-        with exclusive_lock(self.__internal_lock):
+        with self.__internal_lock:
             for entity_id, meta_container in meta_container_map.items():
                 self.set_metadata(entity_id, meta_container)
 
+    def add_fragment(self, fragment : Fragment):
+        """ Add the definitions to load on demand.
+
+            The fragment is loaded when one of its IDs is first requested, or
+            when any entity intercepted by it is first requested. Like
+            :meth:`update_metadata`, the fragments override the existing IDs.
+        """
+        if self.original_container:
+            raise RuntimeWarning('This method is disabled when the container is running in the proxy mode.')
+
+        if self.__on_lockdown and not self.__standalone_mode:
+            raise CoreOnLockDownError(f'Failed to add the fragment {fragment.name}')
+
+        with self.__fragment_lock:
+            for entity_id in fragment.ids:
+                self.__fragments[entity_id] = fragment
+
+            for intercepted_id in fragment.intercepted_ids:
+                self.__interceptor_fragments.setdefault(intercepted_id, []).append(fragment)
+
+    def __load_fragments(self, entity_ids : Iterable[str]):
+        """ Load the fragments defining the entities, and the fragments they need, e.g., for their dependencies.
+
+            If a fragment fails to load, its remaining IDs stay unloaded so that
+            the next request raises the same error again.
+        """
+        with self.__fragment_lock:
+            pending_fragments = []
+            loaded_containers = []
+
+            for entity_id in entity_ids:
+                self.__collect_fragments(entity_id, pending_fragments)
+
+            try:
+                while pending_fragments:
+                    fragment = pending_fragments.pop()
+
+                    if fragment.loaded:
+                        continue
+
+                    log.debug('Load the fragment %s', fragment.name)
+
+                    try:
+                        self.__define_fragment(fragment, pending_fragments, loaded_containers)
+                    except Exception:
+                        fragment.loaded = False
+
+                        # NOTE The unloaded interceptor fragments are needed again on retry.
+                        for unloaded_fragment in [fragment, *pending_fragments]:
+                            self.__restore_interceptor_fragment(unloaded_fragment)
+
+                        raise
+            finally:
+                # NOTE Once prepared, only the loaded containers have to be prepared.
+                if loaded_containers and self.__prepared:
+                    self._declare_initial_method_calls(loaded_containers)
+                    self._generate_interception_graph(loaded_containers)
+
+                    self.__interceptor_binder.invalidate()
+
+    def __define_fragment(self, fragment : Fragment, pending_fragments : list, loaded_containers : list):
+        for entity_id, meta_container in fragment.load().items():
+            # NOTE Skip the IDs overridden by the other fragments or definitions.
+            if self.__fragments.get(entity_id) is not fragment:
+                continue
+
+            self.__define_metadata(entity_id, meta_container)
+
+            del self.__fragments[entity_id]
+
+            loaded_containers.append(meta_container)
+
+            self.__collect_fragments(entity_id, pending_fragments)
+
+            for dependency_id in meta_container.construction_dependencies | meta_container.initial_call_dependencies:
+                self.__collect_fragments(dependency_id, pending_fragments)
+
+        # NOTE The IDs no longer defined by the fragment are forgotten.
+        for entity_id in fragment.ids:
+            if self.__fragments.get(entity_id) is fragment:
+                del self.__fragments[entity_id]
+
+    def __load_dependency_fragments(self, entity_ids : Iterable[str]):
+        """ Load the fragments defining the entities or any of their dependencies, directly or not.
+
+            Unlike :meth:`__load_fragments`, this also follows the dependencies
+            of the entities already defined, e.g., by :meth:`define_entity`.
+        """
+        if not self.__fragments:
+            return
+
+        pending_ids = list(entity_ids)
+        visited_ids = set()
+
+        while pending_ids:
+            entity_id = pending_ids.pop()
+
+            if entity_id in visited_ids:
+                continue
+
+            visited_ids.add(entity_id)
+
+            if entity_id in self.__fragments:
+                self.__load_fragments([entity_id])
+
+            controller = self.__controller_map.get(entity_id)
+
+            if controller is None:
+                continue
+
+            metadata = controller.metadata
+
+            pending_ids.extend(metadata.construction_dependencies | metadata.initial_call_dependencies)
+
+    def __restore_interceptor_fragment(self, fragment : Fragment):
+        if fragment.loaded:
+            return
+
+        for intercepted_id in fragment.intercepted_ids:
+            fragments = self.__interceptor_fragments.setdefault(intercepted_id, [])
+
+            if fragment not in fragments:
+                fragments.append(fragment)
+
+    def __collect_fragments(self, entity_id : str, pending_fragments : list):
+        if entity_id in self.__fragments:
+            pending_fragments.append(self.__fragments[entity_id])
+
+        if entity_id in self.__interceptor_fragments:
+            pending_fragments.extend(self.__interceptor_fragments.pop(entity_id))
+
     def contain(self, entity_id : str):
         """ Check if the entity ID is registered.
 
@@ -115,14 +319,15 @@ class Imagination(object):
         if self.original_container:
             return self.original_container.contain(entity_id)
 
-        return entity_id in self.__controller_map
+        # NOTE The IDs of the unloaded fragments are known without loading them.
+        return entity_id in self.__controller_map or entity_id in self.__fragments
 
     def get(self, entity_id, previously_activated : list = None, id_naming_strategy : Optional[Callable] = None,
             lock_down_enabled: bool = True):
         """ Retrieve an entity by ID
 
             :param entity_id: the identifier of the entity or a class of the service.
-            :param list previously_activated: the list of identifiers of previously activated entities (for internal use only)
+            :param list previously_activated: the list of identifiers of previously activated entities (for internal use only, no longer used for the detection of circular dependencies)
             :param Callable id_naming_strategy: an optional callable object for ID naming strategy
             :param bool lock_down_enabled: the flag to enable the core lockdown
 
@@ -132,6 +337,13 @@ class Imagination(object):
         """
         global CORE_SELF_REFERENCE
 
+        # Fast path: the entity has already been activated and resolved.
+        if id_naming_strategy is None:
+            try:
+                return self.__resolved_instances[entity_id]
+            except (KeyError, TypeError):
+                pass
+
         # NOTE: Assume non-string ``entity_id`` to be a class.
         actual_entity_id = (entity_id
                             if isinstance(entity_id, str)
@@ -146,23 +358,18 @@ class Imagination(object):
         info = self.get_info(actual_entity_id)
 
         if info.activated():
-            return info.instance
+            return self.__resolve(entity_id, actual_entity_id, info.instance, id_naming_strategy)
 
-        # with exclusive_lock(self.__internal_lock):
         # On the first request, the core will be on lockdown.
         if not self.is_on_lockdown():
-            if lock_down_enabled:
-                self.lock_down()
-            self._declare_initial_method_calls()
-            self._generate_interception_graph()
+            self.__prepare(lock_down_enabled)
 
-        if not info.activation_sequence:
-            new_sequence = self._calculate_activation_sequence(actual_entity_id)
+        if info.activation_sequence is None:
+            self.__load_dependency_fragments([actual_entity_id])
 
-            info.activation_sequence = new_sequence
+            info.activation_sequence = self._calculate_activation_sequence(actual_entity_id)
 
         previously_activated = previously_activated or []
-        activation_sequence  = []
 
         # Activate all dependencies.
         for dependency_id in info.activation_sequence:
@@ -172,18 +379,183 @@ class Imagination(object):
             # Trigger the service activation.
             self.get_info(dependency_id).activate(previously_activated)
 
-            activation_sequence.append(dependency_id)
-
         # Activate the requested container ID.
         instance = info.activate()
 
-        activation_sequence.append(actual_entity_id)
+        if not info.activated():
+            # Non-cacheable entities are never resolved.
+            return instance
 
-        for activated_entity_id in activation_sequence:
-            self.get_info(activated_entity_id).run_initial_calls(previously_activated)
+        return self.__resolve(entity_id, actual_entity_id, instance, id_naming_strategy)
+
+    def __resolve(self, entity_id, actual_entity_id : str, instance, id_naming_strategy : Optional[Callable]):
+        """ Register the activated instance to the resolved instance table. """
+        resolved_instances = self.__resolved_instances
+
+        resolved_instances[actual_entity_id] = instance
+
+        # NOTE Only the classes resolved with the default ID naming strategy are registered.
+        if entity_id is not actual_entity_id and id_naming_strategy is None:
+            resolved_instances[entity_id] = instance
 
         return instance
 
+    def import_all(self, ids : Optional[Iterable[str]] = None):
+        """ Import the classes and callables referenced by the entities in the order of dependencies.
+
+            :param ids: the entity IDs (all entities by default)
+            :raises ImportError: when any of them cannot be imported
+        """
+        ids = list(ids) if ids is not None else None
+
+        if ids is None:
+            self.__load_fragments(list(self.__fragments))
+        else:
+            self.__load_dependency_fragments(ids)
+
+        for entity_id, symbol_path in self.__iterate_symbol_paths(ids):
+            with attributing(entity_id):
+                resolve_symbol(symbol_path)
+
+    def wait_for_prefetch(self, timeout : Optional[float] = None) -> bool:
+        """ Wait for the background imports with the ``prefetch`` import policy.
+
+            :return: ``True`` if the background imports are done (or have never been started)
+        """
+        thread = self.__prefetch_thread
+
+        if thread is None:
+            return True
+
+        thread.join(timeout)
+
+        return not thread.is_alive()
+
+    def get_import_timings(self) -> List[tuple]:
+        """ Get the time spent to import each module through the loader, the slowest first.
+
+            :return: the list of the pairs of the module name and the import time in seconds
+        """
+        return import_timings.report()
+
+    def __iterate_symbol_paths(self, ids : Optional[Iterable[str]] = None):
+        for layer in self.get_dependency_graph().layers(ids):
+            for entity_id in layer:
+                for symbol_path in self.__render_symbol_paths(self.get_metadata(entity_id)):
+                    yield entity_id, symbol_path
+
+    def __render_symbol_paths(self, meta_container : Container) -> List[str]:
+        """ Render the symbol paths of the container with the current environment variables.
+
+            The paths with undefined environment variables are left to the activation.
+        """
+        symbol_paths = []
+
+        for symbol_path in sorted(meta_container.symbol_paths):
+            try:
+                symbol_paths.append(self.__transformer.compile(symbol_path).render())
+            except UnknownEnvironmentVariableError as error:
+                log.debug('Skipped %s of %s (undefined environment variable %s)', symbol_path, meta_container.id, error)
+
+        return symbol_paths
+
+    def __prefetch_imports(self):
+        for entity_id, symbol_path in self.__iterate_symbol_paths():
+            try:
+                with attributing(entity_id):
+                    resolve_symbol(symbol_path)
+            except Exception as error:
+                # NOTE Leave the error to the activation.
+                log.debug('Failed to prefetch %s for %s: %s', symbol_path, entity_id, error)
+
+    def warm_up(self, workers : Optional[int] = None) -> Dict[str, float]:
+        """ Activate all cacheable entities eagerly.
+
+            See :meth:`activate_all`.
+        """
+        return self.activate_all(workers = workers)
+
+    def activate_all(self, ids : Optional[Iterable[str]] = None, workers : Optional[int] = None) -> Dict[str, float]:
+        """ Activate the entities and their dependencies eagerly.
+
+            The entities are grouped into layers where each entity only depends
+            on the entities from the previous layers. The entities of the same
+            layer are then activated concurrently on a thread pool.
+
+            :param ids: the entity IDs to activate (all cacheable entities by default)
+            :param int workers: the maximum number of worker threads (``1`` to activate one by one)
+            :return: the map of the entity ID to the activation time (in seconds) in the order of activation
+
+            This is compatible with the proxy mode.
+        """
+        if self.original_container:
+            return self.original_container.activate_all(ids, workers)
+
+        timings = {}
+        layers  = self._calculate_activation_layers(ids)
+
+        def activate(entity_id):
+            started_at = time.perf_counter()
+
+            self.get(entity_id)
+
+            return entity_id, time.perf_counter() - started_at
+
+        if workers == 1:
+            for layer in layers:
+                timings.update(activate(entity_id) for entity_id in layer)
+
+            return timings
+
+        with ThreadPoolExecutor(max_workers = workers) as executor:
+            for layer in layers:
+                if len(layer) == 1:
+                    timings.update([activate(layer[0])])
+
+                    continue
+
+                timings.update(executor.map(activate, layer))
+
+        return timings
+
+    def _calculate_activation_layers(self, ids : Optional[Iterable[str]] = None) -> List[List[str]]:
+        """ Calculate the layers of cacheable entities where each entity only depends on the previous layers.
+
+            The layers follow the depth of the entities in the dependency graph.
+            The entities in a circular dependency, and the entities depending
+            on them, are left out for the lazy activation to report the error.
+        """
+        ids = list(ids) if ids is not None else None
+
+        if ids is None:
+            self.__load_fragments(list(self.__fragments))
+        else:
+            self.__load_dependency_fragments(ids)
+
+        graph       = self.get_dependency_graph()
+        skipped_ids = set()
+
+        for cycle in graph.cycles():
+            for entity_id in cycle:
+                skipped_ids.add(entity_id)
+                skipped_ids.update(graph.impact(entity_id))
+
+        if skipped_ids:
+            log.warning('Skipped the eager activation of %s (circular dependency)', ', '.join(sorted(skipped_ids)))
+
+        return [
+            cacheable_layer
+            for cacheable_layer in (
+                [
+                    entity_id
+                    for entity_id in layer
+                    if entity_id not in skipped_ids and self.get_metadata(entity_id).cacheable
+                ]
+                for layer in graph.layers(ids)
+            )
+            if cacheable_layer
+        ]
+
     def all_ids(self):
         """ Get all entity IDs.
 
@@ -194,12 +566,15 @@ class Imagination(object):
         if self.original_container:
             return self.original_container.all_ids()
 
-        return tuple(self.__controller_map.keys())
+        return tuple(dict.fromkeys([*self.__controller_map, *self.__fragments]))
 
     def get_info(self, entity_id : str) -> Controller:
         if self.original_container:
             raise RuntimeWarning('This method is disabled when the container is running in the proxy mode.')
 
+        if entity_id in self.__fragments or entity_id in self.__interceptor_fragments:
+            self.__load_fragments([entity_id])
+
         if not self.contain(entity_id):
             raise UndefinedContainerIDError(entity_id)
 
@@ -221,7 +596,7 @@ class Imagination(object):
             .. warning:: This method allows ID overriding.
             .. warning:: Use this with care.
         """
-        log.debug(f'Set metadata for {entity_id}')
+        log.debug('Set metadata for %s', entity_id)
 
         if self.original_container:
             raise RuntimeWarning('This method is disabled when the container is running in the proxy mode.')
@@ -229,7 +604,7 @@ class Imagination(object):
         if self.__on_lockdown:
             if self.__standalone_mode and entity_id not in self.__controller_map:
                 log.info('The container appears to be on lockdown but the standalone'
-                         f' mode will allow the container to define entity {entity_id}.')
+                         ' mode will allow the container to define entity %s.', entity_id)
             else:
                 raise CoreOnLockDownError(
                     f'Failed to set the metadata for an entity {entity_id}'
@@ -238,15 +613,45 @@ class Imagination(object):
                          f' update to the metadata of entity {entity_id}.'
                 )
 
+        # NOTE The explicit definition overrides the one from any unloaded fragment.
+        self.__fragments.pop(entity_id, None)
+
+        self.__define_metadata(entity_id, new_meta_container)
+
+    def __define_metadata(self, entity_id : str, new_meta_container : Container):
+        # Fail fast before anything is changed.
+        if self.__import_policy == 'eager':
+            with attributing(entity_id):
+                for symbol_path in self.__render_symbol_paths(new_meta_container):
+                    resolve_symbol(symbol_path)
+
+        # Forget the instance of the overridden entity.
+        if entity_id in self.__resolved_instances:
+            overridden_instance = self.__resolved_instances[entity_id]
+
+            for key, instance in list(self.__resolved_instances.items()):
+                if instance is overridden_instance:
+                    del self.__resolved_instances[key]
+
+            # The overridden entity may be an interceptor.
+            self.__interceptor_binder.invalidate()
+
         # Redefine the container ID.
         new_meta_container.id = entity_id
         new_controller        = Controller(new_meta_container,
                                            self.get,
                                            self.get_interceptions,
-                                           self.__transformer.cast)
+                                           self.__transformer.cast,
+                                           self.is_on_lockdown,
+                                           self.__interceptor_binder,
+                                           self.__wrapper_factory,
+                                           self.__transformer.fold)
 
         self.__controller_map[entity_id] = new_controller
 
+        # NOTE In the standalone mode, new entities can be defined after the lockdown.
+        self.__dependency_graph = None
+
     def get_interceptions(self, intercepted_id, event_type = None,
                           method_to_intercept = None):
         if self.original_container:
@@ -329,65 +734,129 @@ class Imagination(object):
 
         yield DefinitionContext(self, self.get_metadata(entity_id))
 
+    def register_converter(self, kind : str, convert : Callable, immutable : bool = False):
+        """ Register the converter of the parameter type, e.g., ``uuid``.
+
+            See :meth:`imagination.helper.transformer.Transformer.register`.
+        """
+        if self.__on_lockdown:
+            raise RuntimeWarning('This method is disabled when the container is on lockdown.')
+
+        self.__transformer.register(kind, convert, immutable)
+
     def reset(self):
         for ctrl in list(self.__controller_map.keys()):
             del self.__controller_map[ctrl]
 
-    def _calculate_activation_sequence(self, entity_id, known_activation_sequence = None):
-        global CORE_SELF_REFERENCE
+        self.__resolved_instances.clear()
+        self.__resolved_instances[CORE_SELF_REFERENCE] = self
 
-        if entity_id == CORE_SELF_REFERENCE:
-            return []
+        self.__dependency_graph = None
+
+        self.__fragments.clear()
+        self.__interceptor_fragments.clear()
+
+        self.__interceptor_binder.invalidate()
 
-        known_activation_sequence = known_activation_sequence or []
+    def __is_cacheable(self, entity_id : str) -> bool:
+        return self.get_metadata(entity_id).cacheable
 
-        # To prevent infinite loop
-        if entity_id in known_activation_sequence:
-            return []
+    def __prepare(self, lock_down_enabled: bool):
+        """ Prepare the core for the activation.
 
-        scoreboard = {}  # id -> number of dependants
+            The initial method calls and the interception graph are only
+            prepared once, even if multiple threads request entities at the
+            same time.
+        """
+        # NOTE Always lock the fragments first, as the lockdown may load the fragments.
+        with self.__fragment_lock, self.__internal_lock:
+            if not self.__prepared:
+                self._declare_initial_method_calls()
+                self._generate_interception_graph()
+
+                # NOTE The graph indexed by an earlier lock-down misses the initial method calls declared just now.
+                self.__dependency_graph = None
+                self.__prepared         = True
 
-        known_activation_sequence.append(entity_id)
+                # NOTE An earlier lock-down could not generate the proxy classes without the interception graph.
+                if self.__on_lockdown:
+                    self.__generate_proxy_classes()
 
-        metadata = self.get_metadata(entity_id)
+            if lock_down_enabled and not self.__on_lockdown:
+                self.lock_down()
+            elif self.__on_lockdown:
+                self.get_dependency_graph()
 
-        for dependency_id in metadata.dependencies:
-            # To prevent infinite loop
-            if dependency_id in known_activation_sequence:
+    def __generate_proxy_classes(self):
+        """ Generate the proxy classes of the intercepted entities ahead of the activation (``generated`` wrapper mode).
+
+            The proxy classes of the entities loaded later, e.g., from the fragments, are generated on activation.
+        """
+        if not isinstance(self.__wrapper_factory, ProxyFactory):
+            return
+
+        for intercepted_id, interceptions in self.__interception_graph.items():
+            controller = self.__controller_map.get(intercepted_id)
+
+            # NOTE The types of the other containers are only known on activation.
+            if controller is None or type(controller.metadata) is not Entity:
                 continue
 
-            if dependency_id not in scoreboard:
-                scoreboard[dependency_id] = 0
+            try:
+                with attributing(intercepted_id):
+                    wrapped_type = resolve_symbol(controller.metadata.fqcn)
+            except Exception as error:
+                # NOTE Leave the error to the activation.
+                log.debug('Failed to generate the proxy class for %s: %s', intercepted_id, error)
 
-            scoreboard[dependency_id] += 1
+                continue
 
-            additionals = self._calculate_activation_sequence(dependency_id, known_activation_sequence)
+            self.__wrapper_factory.get_proxy_class(wrapped_type, interceptions)
 
-            for additional_dependency_id in additionals:
-                if additional_dependency_id not in scoreboard:
-                    scoreboard[additional_dependency_id] = 0
+    def _calculate_activation_sequence(self, entity_id) -> tuple:
+        """ Calculate the order of activation of all dependencies of the entity.
+
+            :raises CircularDependencyError: when the dependencies for construction form a cycle
+            :raises UndefinedContainerIDError: when one of the dependencies is undefined
+        """
+        global CORE_SELF_REFERENCE
 
-                scoreboard[additional_dependency_id] += 1
+        if entity_id == CORE_SELF_REFERENCE:
+            return ()
 
-        sorted_sequence = [
-            (dependency_id, score)
-            for dependency_id, score in scoreboard.items()
-        ]
+        return self.get_dependency_graph().activation_order(entity_id)
 
-        sorted_sequence.sort(key = lambda step: step[1])
+    def get_dependency_graph(self) -> DependencyGraph:
+        """ Get the dependency graph of all entities.
 
-        return [
-            step[0]
-            for step in sorted_sequence
-        ]
+            The graph is indexed once when the core is locked down. Before that,
+            the graph is rebuilt on every call as the definitions may change.
+        """
+        global CORE_SELF_REFERENCE
+
+        graph = self.__dependency_graph
+
+        if graph is not None:
+            return graph
+
+        graph = DependencyGraph.build(
+            {entity_id: controller.metadata for entity_id, controller in list(self.__controller_map.items())},
+            [CORE_SELF_REFERENCE],
+        )
 
-    def _generate_interception_graph(self):
+        if self.__on_lockdown:
+            self.__dependency_graph = graph
+
+        return graph
+
+    def _generate_interception_graph(self, meta_containers : Optional[Iterable[Container]] = None):
         interception_graph   = self.__interception_graph
         unique_interceptions = list()
 
-        for controller in self.__controller_map.values():
-            metadata = controller.metadata
+        if meta_containers is None:
+            meta_containers = [controller.metadata for controller in self.__controller_map.values()]
 
+        for metadata in meta_containers:
             unique_interceptions.extend(
                 interception
                 for interception in metadata.interceptions
@@ -413,10 +882,11 @@ class Imagination(object):
 
             method_to_event_map[intercepted_method][event_type].append(interception)
 
-    def _declare_initial_method_calls(self):
-        for controller in self.__controller_map.values():
-            metadata = controller.metadata
+    def _declare_initial_method_calls(self, meta_containers : Optional[Iterable[Container]] = None):
+        if meta_containers is None:
+            meta_containers = [controller.metadata for controller in self.__controller_map.values()]
 
+        for metadata in meta_containers:
             if metadata.id not in self.__initial_calls:
                 continue
 
@@ -1,10 +1,13 @@
 # v2
+import atexit
 import json
 import logging
 import os
 import pprint
+import queue
 import re
 import sys
+import threading
 import typing
 
 import imagination
@@ -32,6 +35,23 @@ def get_logger_for(obj: object,
                                         mode='compact' if minimal else 'full')
 
 
+def get_entity_logger(entity_id: str,
+                      level: int = None):
+    return LoggerFactory.get_for_entity(entity_id, level)
+
+
+class EntityLoggerAdapter(logging.LoggerAdapter):
+    """ Logger of an entity
+
+        All entities share the same logger (and handler). The ID of the entity
+        is prefixed to the messages, and also given to the records as ``entity_id``.
+    """
+    def process(self, msg, kwargs):
+        kwargs['extra'] = self.extra
+
+        return '[{}] {}'.format(self.extra['entity_id'], msg), kwargs
+
+
 class JsonFormatter(logging.Formatter):
     def format(self, record) -> str:
         return json.dumps(dict(
@@ -49,8 +69,133 @@ class JsonFormatter(logging.Formatter):
         ))
 
 
+class LogDispatcher(object):
+    """ Background log dispatcher
+
+        The records are put into a bounded queue and handled (formatted and written) by the
+        target handlers on a background thread, which is started on the first record.
+
+        When the queue is full, the overflow policy decides what to do:
+
+        * block - Wait until the queue has room, like a synchronous handler.
+        * drop - Discard the new record.
+        * drop_oldest - Discard the oldest record in the queue to make room.
+
+        :param int max_size: the maximum number of queued records
+        :param str overflow_policy: the overflow policy
+    """
+    __overflow_policies__ = ('block', 'drop', 'drop_oldest')
+
+    def __init__(self, max_size: int = 10000, overflow_policy: str = 'drop'):
+        if overflow_policy not in self.__overflow_policies__:
+            raise ValueError(f'Unknown overflow policy ({overflow_policy})')
+
+        self.__queue           = queue.Queue(max_size)
+        self.__overflow_policy = overflow_policy
+        self.__thread          = None
+        self.__lock            = threading.Lock()
+
+        self.dropped = 0
+
+    def submit(self, handler: logging.Handler, record: logging.LogRecord):
+        if self.__thread is None:
+            self.start()
+
+        item = (handler, record)
+
+        if self.__overflow_policy == 'block':
+            self.__queue.put(item)
+
+            return
+
+        while True:
+            try:
+                self.__queue.put_nowait(item)
+
+                return
+            except queue.Full:
+                pass
+
+            with self.__lock:
+                self.dropped += 1
+
+            if self.__overflow_policy == 'drop':
+                return
+
+            try:
+                self.__queue.get_nowait()
+            except queue.Empty:
+                pass
+
+    def start(self):
+        with self.__lock:
+            if self.__thread is not None:
+                return
+
+            self.__thread = threading.Thread(target = self.__dispatch, name = 'imagination-log-dispatcher',
+                                             daemon = True)
+            self.__thread.start()
+
+        atexit.register(self.stop)
+
+    def stop(self, timeout: float = 5):
+        """ Handle the queued records, then stop the background thread. """
+        with self.__lock:
+            thread        = self.__thread
+            self.__thread = None
+
+        if thread is None:
+            return
+
+        # NOTE The sentinel comes after all queued records. If the queue is full, this waits for the background thread to make room.
+        self.__queue.put((None, None))
+
+        thread.join(timeout)
+
+    def __dispatch(self):
+        while True:
+            handler, record = self.__queue.get()
+
+            if handler is None:
+                return
+
+            try:
+                handler.handle(record)
+            except Exception:
+                handler.handleError(record)
+
+
+class QueuedHandler(logging.Handler):
+    """ Handler to pass the records to the target handler through :class:`LogDispatcher`
+
+        The records are neither formatted nor written on the calling thread.
+
+        .. note:: As the records are formatted later, the arguments of the
+                  messages should not be modified after logging.
+
+        :param logging.Handler target: the target handler
+        :param LogDispatcher dispatcher: the dispatcher
+    """
+    def __init__(self, target: logging.Handler, dispatcher: LogDispatcher):
+        super().__init__(target.level)
+
+        self.target     = target
+        self.dispatcher = dispatcher
+
+    def handle(self, record):
+        # NOTE The target handler applies its own filters on the background thread.
+        if self.filter(record):
+            self.dispatcher.submit(self.target, record)
+
+        return record
+
+    def emit(self, record):
+        self.dispatcher.submit(self.target, record)
+
+
 class LoggerFactory:
     __known_loggers__ = dict()
+    __dispatcher__    = None
 
     @staticmethod
     def get_default_log_level() -> int:
@@ -70,6 +215,25 @@ class LoggerFactory:
         """
         return os.getenv('IMAGINATION_LOG_MODE') or 'compact'
 
+    @staticmethod
+    def is_queue_enabled() -> bool:
+        """ Check if the records are handled on the background thread
+
+            This is enabled by setting ``IMAGINATION_LOG_QUEUE`` to ``true``. The size of the
+            queue and the overflow policy are set by ``IMAGINATION_LOG_QUEUE_SIZE`` (default: 10000)
+            and ``IMAGINATION_LOG_QUEUE_OVERFLOW`` (``block``, ``drop`` (default) or ``drop_oldest``).
+        """
+        return (os.getenv('IMAGINATION_LOG_QUEUE') or '').lower() in ('1', 'true', 'yes')
+
+    @classmethod
+    def get_dispatcher(cls) -> LogDispatcher:
+        """ Get the dispatcher shared by all queued handlers """
+        if cls.__dispatcher__ is None:
+            cls.__dispatcher__ = LogDispatcher(int(os.getenv('IMAGINATION_LOG_QUEUE_SIZE') or 10000),
+                                               os.getenv('IMAGINATION_LOG_QUEUE_OVERFLOW') or 'drop')
+
+        return cls.__dispatcher__
+
     @classmethod
     def get(cls,
             name: str,
@@ -78,6 +242,7 @@ class LoggerFactory:
             formatter: typing.Optional[logging.Formatter] = None,
             mode: typing.Optional[str] = None,
             cache_key: typing.Optional[str] = None,
+            queued: typing.Optional[bool] = None,
             ) -> logging.Logger:
         cache_key = cache_key or name
 
@@ -103,6 +268,9 @@ class LoggerFactory:
             handler.setFormatter(formatter)
             handler.setLevel(level)
 
+        if queued if queued is not None else cls.is_queue_enabled():
+            handler = QueuedHandler(handler, cls.get_dispatcher())
+
         logger = logging.Logger(name)
         logger.setLevel(level)
         logger.addHandler(handler)
@@ -156,6 +324,17 @@ class LoggerFactory:
                                 formatter=formatter,
                                 mode=mode)
 
+    @classmethod
+    def get_for_entity(cls,
+                       entity_id: str,
+                       level: typing.Optional[int] = None,
+                       ) -> EntityLoggerAdapter:
+        """ Get the logger of the entity.
+
+            Unlike the other loggers, it is a lightweight adapter over the logger shared by all entities.
+        """
+        return EntityLoggerAdapter(cls.get('controller', level), dict(entity_id=entity_id))
+
     @classmethod
     def instance(cls):
         if not hasattr(cls, '__instance__'):
@@ -3,6 +3,10 @@ class UndefinedContainerIDError(RuntimeError):
     """ Error when an undefined container ID is requested. """
 
 
+class CircularDependencyError(RuntimeError):
+    """ Circular Dependency Error """
+
+
 class MissingParameterException(ValueError):
     """ Exception when a parameter is missing """
 
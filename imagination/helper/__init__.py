@@ -1,11 +1,10 @@
 import os
-import sys
 
 def retrieve_module(name):
-    if name not in sys.modules:
-        __import__(name)
+    # NOTE Import through the loader for the import timings and the attribution.
+    from ..loader import import_module
 
-    return sys.modules[name]
+    return import_module(name)
 
 def retrieve_module_path(name):
     module = retrieve_module(name)
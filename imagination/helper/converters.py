@@ -0,0 +1,81 @@
+# v2
+import base64
+import datetime
+import decimal
+import json
+import pathlib
+import re
+
+from ..loader import resolve_symbol
+
+_re_timedelta = re.compile(
+    r'^(?:(?P<days>-?[0-9]+) days?, )?'
+    r'(?P<hours>[0-9]+):(?P<minutes>[0-9]{2}):(?P<seconds>[0-9]{2}(?:\.[0-9]+)?)$'
+)
+
+
+class Converter(object):
+    """ Converter of the string definition of a kind
+
+        :param callable convert: the callable taking the string and returning the converted value
+        :param bool immutable: flag if the converted value is immutable, i.e., safe to share between activations
+    """
+    __slots__ = ('convert', 'immutable')
+
+    def __init__(self, convert : callable, immutable : bool = False):
+        self.convert   = convert
+        self.immutable = immutable
+
+
+def to_bool(data : str) -> bool:
+    data = data.capitalize()
+
+    assert data in ('True', 'False')
+
+    return data == 'True'
+
+
+def to_bytes(data : str) -> bytes:
+    return data.encode('utf-8')
+
+
+def to_timedelta(data : str) -> datetime.timedelta:
+    """ Convert either the number of seconds or the format of ``str(timedelta)``, e.g., ``1 day, 2:03:04``. """
+    try:
+        return datetime.timedelta(seconds = float(data))
+    except ValueError:
+        pass
+
+    matches = _re_timedelta.match(data.strip())
+
+    if not matches:
+        raise ValueError('Invalid time delta: {}'.format(data))
+
+    return datetime.timedelta(
+        days    = int(matches.group('days') or 0),
+        hours   = int(matches.group('hours')),
+        minutes = int(matches.group('minutes')),
+        seconds = float(matches.group('seconds')),
+    )
+
+
+def to_base64_blob(data : str) -> bytes:
+    return base64.b64decode(''.join(data.split()), validate = True)
+
+
+builtin_converters = {
+    'str'      : Converter(str, True),
+    'int'      : Converter(int, True),
+    'float'    : Converter(float, True),
+    'bool'     : Converter(to_bool, True),
+    'class'    : Converter(resolve_symbol, True),
+    'bytes'    : Converter(to_bytes, True),
+    'decimal'  : Converter(decimal.Decimal, True),
+    'path'     : Converter(pathlib.Path, True),
+    'datetime' : Converter(datetime.datetime.fromisoformat, True),
+    'date'     : Converter(datetime.date.fromisoformat, True),
+    'time'     : Converter(datetime.time.fromisoformat, True),
+    'timedelta': Converter(to_timedelta, True),
+    'json'     : Converter(json.loads),
+    'base64'   : Converter(to_base64_blob, True),
+}
@@ -12,8 +12,11 @@ def exclusive_lock(lock):
     """ ..deprecated:: Use the ``with`` statement instead.
     """
     lock.acquire()
-    yield
-    lock.release()
+
+    try:
+        yield
+    finally:
+        lock.release()
 
 
 def extract_dependency_ids_from_parameters(collection : ParameterCollection):
@@ -46,3 +49,22 @@ def extract_dependency_ids_from_parameters(collection : ParameterCollection):
         container_ids.add(item.definition)
 
     return container_ids
+
+
+def extract_symbol_paths_from_parameters(collection : ParameterCollection):
+    symbol_paths = set()
+
+    for item in list(collection.sequence()) + [item for _, item in collection.items()]:
+        if type(item.definition) is ParameterCollection:
+            symbol_paths.update(
+                extract_symbol_paths_from_parameters(item.definition)
+            )
+
+            continue
+
+        if item.kind != 'class':
+            continue
+
+        symbol_paths.add(item.definition)
+
+    return symbol_paths
@@ -0,0 +1,391 @@
+# v2
+from array import array
+from collections import deque
+
+from ..exc import CircularDependencyError, UndefinedContainerIDError
+
+_VISITING = 1
+_VISITED  = 2
+
+
+class DependencyGraph(object):
+    """ Dependency graph of the entities
+
+        The graph is indexed once and stored as arrays of integer IDs in the
+        compressed sparse row format, i.e., the dependencies of the entity
+        ``i`` are ``targets[offsets[i]:offsets[i + 1]]``. Both the forward
+        (dependencies) and the reverse (dependants) adjacency are kept.
+
+        Each edge is flagged whether the dependency is required to construct
+        the dependant entity, or only used by its initial method calls. As the
+        initial method calls happen after the construction, the dependencies
+        only used by them are activated on demand, and they are neither part
+        of the activation order, the depth nor of any circular dependency.
+
+        The undefined dependencies are indexed after the defined entities
+        without any dependencies, and they raise :class:`UndefinedContainerIDError`
+        when they are reached for the activation.
+
+        :param tuple ids: the entity IDs (the defined ones first)
+        :param int defined_count: the number of defined entities
+        :param array offsets: the offsets of the dependencies of each entity
+        :param array targets: the integer IDs of the dependencies
+        :param array required: the flags whether each dependency is required for the construction
+    """
+    def __init__(self, ids : tuple, defined_count : int, offsets : array, targets : array, required : array):
+        self.__ids           = ids
+        self.__index         = {entity_id: i for i, entity_id in enumerate(ids)}
+        self.__defined_count = defined_count
+
+        self.__offsets  = offsets
+        self.__targets  = targets
+        self.__required = required
+
+        self.__reverse_offsets, self.__reverse_sources, self.__reverse_required = self.__index_reverse_adjacency()
+        self.__components, self.__component_of = self.__index_strongly_connected_components()
+        self.__depths = self.__index_depths()
+
+        self.__orders = {}  # root ID -> activation order
+
+    @staticmethod
+    def build(metadata_map : dict, ignored_ids = None):
+        """ Build the graph from the map of the entity ID to the meta container.
+
+            :param dict metadata_map: the map of the entity ID to the meta container
+            :param ignored_ids: the IDs of the dependencies to ignore
+        """
+        ignored_ids = set(ignored_ids or [])
+        ids         = list(metadata_map)
+        index       = {entity_id: i for i, entity_id in enumerate(ids)}
+        offsets     = array('l', [0])
+        targets     = array('l')
+        required    = array('b')
+
+        for metadata in metadata_map.values():
+            construction_dependencies = metadata.construction_dependencies
+
+            for dependency_id in sorted(construction_dependencies | metadata.initial_call_dependencies):
+                if dependency_id in ignored_ids:
+                    continue
+
+                if dependency_id not in index:
+                    index[dependency_id] = len(ids)
+                    ids.append(dependency_id)
+
+                targets.append(index[dependency_id])
+                required.append(dependency_id in construction_dependencies)
+
+            offsets.append(len(targets))
+
+        # The undefined dependencies have no dependencies.
+        offsets.extend([len(targets)] * (len(ids) - len(metadata_map)))
+
+        return DependencyGraph(tuple(ids), len(metadata_map), offsets, targets, required)
+
+    @property
+    def ids(self) -> tuple:
+        """ The IDs of the defined entities """
+        return self.__ids[:self.__defined_count]
+
+    def contain(self, entity_id : str) -> bool:
+        """ Check if the entity is defined. """
+        return self.__index.get(entity_id, self.__defined_count) < self.__defined_count
+
+    def dependencies(self, entity_id : str, required_only : bool = False) -> tuple:
+        """ Get the IDs of the direct dependencies. """
+        i = self.__index_of(entity_id)
+
+        return tuple(
+            self.__ids[self.__targets[k]]
+            for k in range(self.__offsets[i], self.__offsets[i + 1])
+            if self.__required[k] or not required_only
+        )
+
+    def dependants(self, entity_id : str, required_only : bool = False) -> tuple:
+        """ Get the IDs of the entities directly depending on the entity. """
+        i = self.__index_of(entity_id)
+
+        return tuple(
+            self.__ids[self.__reverse_sources[k]]
+            for k in range(self.__reverse_offsets[i], self.__reverse_offsets[i + 1])
+            if self.__reverse_required[k] or not required_only
+        )
+
+    def impact(self, entity_id : str) -> tuple:
+        """ Get the IDs of all entities depending on the entity, directly or indirectly. """
+        reverse_offsets = self.__reverse_offsets
+        reverse_sources = self.__reverse_sources
+
+        origin  = self.__index_of(entity_id)
+        visited = {origin}
+        queue   = deque([origin])
+        impact  = []
+
+        while queue:
+            i = queue.popleft()
+
+            for k in range(reverse_offsets[i], reverse_offsets[i + 1]):
+                j = reverse_sources[k]
+
+                if j in visited:
+                    continue
+
+                visited.add(j)
+                queue.append(j)
+                impact.append(self.__ids[j])
+
+        return tuple(impact)
+
+    def depth(self, entity_id : str) -> int:
+        """ Get the length of the longest chain of dependencies required for the construction. """
+        return self.__depths[self.__index_of(entity_id)]
+
+    def cycles(self) -> list:
+        """ Get the groups of entity IDs forming the circular dependencies. """
+        return [
+            tuple(self.__ids[i] for i in component)
+            for component in self.__components
+            if self.__is_cyclic(component)
+        ]
+
+    def layers(self, ids = None) -> list:
+        """ Group the entities and their required dependencies by depth.
+
+            Each entity of a layer only depends on the entities of the previous
+            layers, unless the entity is part of a circular dependency.
+
+            :param ids: the IDs of the entities (all defined entities by default)
+        """
+        offsets  = self.__offsets
+        targets  = self.__targets
+        required = self.__required
+
+        pending = [self.__index_of(entity_id) for entity_id in ids] if ids is not None else list(range(self.__defined_count))
+        known   = set(pending)
+
+        # Collect the dependencies required for the construction.
+        while pending:
+            i = pending.pop()
+
+            for k in range(offsets[i], offsets[i + 1]):
+                j = targets[k]
+
+                if required[k] and j not in known:
+                    known.add(j)
+                    pending.append(j)
+
+        layers = {}
+
+        for i in sorted(known):
+            if i >= self.__defined_count:
+                continue
+
+            layers.setdefault(self.__depths[i], []).append(self.__ids[i])
+
+        return [layers[depth] for depth in sorted(layers)]
+
+    def activation_order(self, root_id : str) -> tuple:
+        """ Get the IDs of all required dependencies of the root in the order of activation.
+
+            The order is calculated with a single depth-first pass and cached per root.
+
+            :raises CircularDependencyError: when the dependencies for construction form a cycle
+            :raises UndefinedContainerIDError: when one of the dependencies is undefined
+        """
+        if root_id in self.__orders:
+            return self.__orders[root_id]
+
+        offsets  = self.__offsets
+        targets  = self.__targets
+        required = self.__required
+
+        root   = self.__index_of(root_id)
+        order  = []
+        states = {root: _VISITING}
+        path   = [root]
+        stack  = [iter(range(offsets[root], offsets[root + 1]))]
+
+        while stack:
+            for k in stack[-1]:
+                if not required[k]:
+                    continue
+
+                j     = targets[k]
+                state = states.get(j)
+
+                if state == _VISITED:
+                    continue
+
+                if state == _VISITING:
+                    raise CircularDependencyError(
+                        ' -> '.join(self.__ids[i] for i in path[path.index(j):] + [j])
+                    )
+
+                if j >= self.__defined_count:
+                    raise UndefinedContainerIDError(self.__ids[j])
+
+                states[j] = _VISITING
+
+                path.append(j)
+                stack.append(iter(range(offsets[j], offsets[j + 1])))
+
+                break
+            else:
+                i = path.pop()
+
+                stack.pop()
+
+                states[i] = _VISITED
+
+                order.append(self.__ids[i])
+
+        # NOTE The root is always the last one.
+        activation_order = self.__orders[root_id] = tuple(order[:-1])
+
+        return activation_order
+
+    def __index_of(self, entity_id : str) -> int:
+        i = self.__index.get(entity_id, self.__defined_count)
+
+        if i >= self.__defined_count:
+            raise UndefinedContainerIDError(entity_id)
+
+        return i
+
+    def __is_cyclic(self, component : tuple) -> bool:
+        if len(component) > 1:
+            return True
+
+        i = component[0]
+
+        return any(
+            self.__required[k] and self.__targets[k] == i
+            for k in range(self.__offsets[i], self.__offsets[i + 1])
+        )
+
+    def __index_reverse_adjacency(self):
+        node_count = len(self.__ids)
+        offsets    = array('l', [0] * (node_count + 1))
+
+        for j in self.__targets:
+            offsets[j + 1] += 1
+
+        for i in range(node_count):
+            offsets[i + 1] += offsets[i]
+
+        sources  = array('l', [0] * len(self.__targets))
+        required = array('b', [0] * len(self.__targets))
+        cursors  = offsets[:-1]
+
+        for i in range(node_count):
+            for k in range(self.__offsets[i], self.__offsets[i + 1]):
+                j = self.__targets[k]
+
+                sources[cursors[j]]  = i
+                required[cursors[j]] = self.__required[k]
+
+                cursors[j] += 1
+
+        return offsets, sources, required
+
+    def __index_strongly_connected_components(self):
+        """ Index the strongly connected components of the required dependencies (Tarjan's algorithm).
+
+            The components are listed in the reverse topological order, i.e.,
+            each component comes after all components it depends on.
+        """
+        offsets  = self.__offsets
+        targets  = self.__targets
+        required = self.__required
+
+        node_count   = len(self.__ids)
+        indices      = array('l', [-1] * node_count)
+        lowlinks     = array('l', [0] * node_count)
+        on_stack     = array('b', [0] * node_count)
+        component_of = array('l', [-1] * node_count)
+        components   = []
+        stack        = []
+        counter      = 0
+
+        for origin in range(node_count):
+            if indices[origin] >= 0:
+                continue
+
+            indices[origin] = lowlinks[origin] = counter
+            counter += 1
+
+            stack.append(origin)
+            on_stack[origin] = 1
+
+            work = [(origin, offsets[origin])]
+
+            while work:
+                i, k = work[-1]
+
+                if k < offsets[i + 1]:
+                    work[-1] = (i, k + 1)
+
+                    if not required[k]:
+                        continue
+
+                    j = targets[k]
+
+                    if indices[j] < 0:
+                        indices[j] = lowlinks[j] = counter
+                        counter += 1
+
+                        stack.append(j)
+                        on_stack[j] = 1
+
+                        work.append((j, offsets[j]))
+                    elif on_stack[j] and indices[j] < lowlinks[i]:
+                        lowlinks[i] = indices[j]
+
+                    continue
+
+                work.pop()
+
+                if work:
+                    parent = work[-1][0]
+
+                    if lowlinks[i] < lowlinks[parent]:
+                        lowlinks[parent] = lowlinks[i]
+
+                if lowlinks[i] != indices[i]:
+                    continue
+
+                component = []
+
+                while True:
+                    j = stack.pop()
+
+                    on_stack[j]     = 0
+                    component_of[j] = len(components)
+
+                    component.append(j)
+
+                    if j == i:
+                        break
+
+                components.append(tuple(component))
+
+        return components, component_of
+
+    def __index_depths(self):
+        component_of     = self.__component_of
+        component_depths = array('l')
+
+        # NOTE As each component comes after its dependencies, their depths are always known.
+        for c, component in enumerate(self.__components):
+            depth = 0
+
+            for i in component:
+                for k in range(self.__offsets[i], self.__offsets[i + 1]):
+                    d = component_of[self.__targets[k]]
+
+                    if self.__required[k] and d != c and component_depths[d] >= depth:
+                        depth = component_depths[d] + 1
+
+            component_depths.append(depth)
+
+        return array('l', (component_depths[component_of[i]] for i in range(len(self.__ids))))
@@ -0,0 +1,148 @@
+# v2
+import collections
+import inspect
+import os
+import threading
+import types
+import weakref
+
+
+class SignatureCacheStats(collections.namedtuple('SignatureCacheStats',
+                                                 ('hits', 'misses', 'evictions', 'size', 'max_size'))):
+    """ Statistics of :class:`SignatureCache` """
+    __slots__ = ()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+
+class SignatureCache(object):
+    """ Bounded cache of signatures keyed by callable
+
+        Functions and classes are referenced weakly so that the dynamically
+        created ones can still be garbage-collected. Bound methods share the
+        entry of the underlying function, so the methods of all instances of
+        the same class are introspected only once.
+
+        :param int max_size: the maximum number of cached callables
+    """
+    def __init__(self, max_size: int = 4096):
+        assert max_size > 0, 'The maximum size must be positive.'
+
+        self.__max_size = max_size
+        self.__entries  = collections.OrderedDict()  # key -> [signature, parameters, bound signature, bound parameters]
+        self.__lock     = threading.Lock()
+        self.__garbage  = []  # keys of the collected callables
+
+        self.__hits      = 0
+        self.__misses    = 0
+        self.__evictions = 0
+
+    def signature(self, target) -> inspect.Signature:
+        """ Get the signature of the callable object. """
+        return self.__lookup(target)[0]
+
+    def parameters(self, target) -> tuple:
+        """ Get the parameter specifications of the callable object. """
+        return self.__lookup(target)[1]
+
+    def stats(self) -> SignatureCacheStats:
+        with self.__lock:
+            return SignatureCacheStats(self.__hits, self.__misses, self.__evictions, len(self.__entries),
+                                       self.__max_size)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.__garbage.clear()
+
+            self.__hits      = 0
+            self.__misses    = 0
+            self.__evictions = 0
+
+    def __lookup(self, target):
+        bound = isinstance(target, types.MethodType)
+        owner = target.__func__ if bound else target
+
+        try:
+            key = weakref.ref(owner, self.__garbage.append)
+        except TypeError:
+            # NOTE Built-in functions cannot be weakly referenced but they are never collected.
+            key = owner
+
+        with self.__lock:
+            self.__collect_garbage()
+
+            try:
+                entry = self.__entries.get(key)
+            except TypeError:
+                # The callable is not hashable.
+                entry = None
+                key   = None
+
+            if entry is not None:
+                self.__hits += 1
+                self.__entries.move_to_end(key)
+
+        if entry is None:
+            signature = inspect.signature(owner)
+            entry     = [signature, tuple(signature.parameters.values()), None, None]
+
+            with self.__lock:
+                self.__misses += 1
+
+                if key is not None:
+                    self.__entries[key] = entry
+
+                    while len(self.__entries) > self.__max_size:
+                        self.__entries.popitem(last = False)
+                        self.__evictions += 1
+
+        if not bound:
+            return entry
+
+        if entry[2] is None:
+            bound_signature = _bind_signature(entry[0])
+
+            entry[3] = tuple(bound_signature.parameters.values())
+            entry[2] = bound_signature
+
+        return entry[2], entry[3]
+
+    def __collect_garbage(self):
+        while self.__garbage:
+            self.__entries.pop(self.__garbage.pop(), None)
+
+
+def _bind_signature(signature: inspect.Signature) -> inspect.Signature:
+    """ Drop the first parameter, like :func:`inspect.signature` does with a bound method. """
+    params = tuple(signature.parameters.values())
+
+    if not params or params[0].kind in (inspect.Parameter.VAR_KEYWORD, inspect.Parameter.KEYWORD_ONLY):
+        raise ValueError('invalid method signature')
+
+    if params[0].kind == inspect.Parameter.VAR_POSITIONAL:
+        return signature
+
+    return signature.replace(parameters = params[1:])
+
+
+signature_cache = SignatureCache(int(os.getenv('IMAGINATION_SIGNATURE_CACHE_SIZE') or 4096))
+
+
+def get_signature(target) -> inspect.Signature:
+    """ Get the signature of the callable object from the process-wide cache. """
+    return signature_cache.signature(target)
+
+
+def get_parameters(target) -> tuple:
+    """ Get the parameter specifications of the callable object from the process-wide cache. """
+    return signature_cache.parameters(target)
+
+
+def get_signature_cache_stats() -> SignatureCacheStats:
+    """ Get the statistics of the process-wide signature cache. """
+    return signature_cache.stats()
@@ -5,19 +5,157 @@ import re
 
 from ..debug           import get_logger
 from ..exc             import UnknownEnvironmentVariableError
-from ..loader          import Loader
 from ..meta.definition import DataDefinition
+from .converters       import Converter, builtin_converters
+
+_log = get_logger('transformer', logging.ERROR)
+
+_re_placeholder = re.compile(
+    r'\{\s*\$(?P<env_name>[A-Za-z0-9_\.]+)'
+    r'(?: or (?:"(?P<string>.+?)"|(?P<float>[0-9]*\.[0-9]*)|(?P<int>[0-9]+)))?'
+    r'\s*\}',
+    re.IGNORECASE
+)
+
+
+class PlaceholderTemplate(object):
+    """ Compiled string with environment variable placeholders
+
+        The string is split once into the literal chunks and the slots for the
+        environment variables, e.g., ``{ $FOOD or "sushi" }``, so that it is
+        rendered in a single pass.
+
+        :param str source: the string with placeholders
+    """
+    __slots__ = ('source', 'chunks', 'static')
+
+    def __init__(self, source : str):
+        chunks = []  # str (literal) or tuple of (environment variable name, default value)
+        cursor = 0
+
+        for matches in _re_placeholder.finditer(source):
+            if matches.start() > cursor:
+                chunks.append(source[cursor:matches.start()])
+
+            default_value = matches.group('string') or matches.group('float') or matches.group('int') or ''
+
+            chunks.append((matches.group('env_name'), default_value))
+
+            cursor = matches.end()
+
+        if cursor < len(source):
+            chunks.append(source[cursor:])
+
+        self.source = source
+        self.chunks = tuple(chunks)
+        self.static = len(chunks) == 0 or all(isinstance(chunk, str) for chunk in chunks)
+
+    def render(self) -> str:
+        """ Render the string with the current environment variables. """
+        if self.static:
+            return self.source
+
+        rendered = []
+
+        for chunk in self.chunks:
+            if isinstance(chunk, str):
+                rendered.append(chunk)
+
+                continue
+
+            env_name, default_value = chunk
+            env_value               = os.getenv(env_name)
+
+            if not env_value and not default_value:
+                raise UnknownEnvironmentVariableError(env_name)
+
+            rendered.append(env_value or default_value)
+
+        return ''.join(rendered)
+
+
+class FoldedValue(object):
+    """ Value of a literal definition, cast ahead of the activation
+
+        :param value: the cast value, shared if immutable
+        :param callable copy: the callable making a new copy of a mutable value, or ``None`` if immutable
+    """
+    __slots__ = ('value', 'copy')
+
+    def __init__(self, value, copy : callable = None):
+        self.value = value
+        self.copy  = copy
+
+    @property
+    def mutable(self) -> bool:
+        return self.copy is not None
+
+    def get(self):
+        return self.copy() if self.copy is not None else self.value
+
+
+def _build_sequence(collection_type : type):
+    def build(transformer, data, previously_activated : list):
+        cast = transformer.cast
+
+        return collection_type([cast(item, previously_activated) for item in data.sequence()])
+
+    return build
+
+
+def _build_dict(transformer, data, previously_activated : list):
+    cast = transformer.cast
+
+    return {key: cast(value, previously_activated) for key, value in data.items()}
 
 
 class Transformer(object):
-    """ Data transformer """
+    """ Data transformer
+
+        The scalar kinds are converted by the registry of converters, which
+        can be extended with :meth:`register`.
+    """
+    __reserved_kinds__             = ('entity', 'list', 'tuple', 'set', 'frozenset', 'dict')
+    __foldable_collection_kinds__  = ('list', 'tuple', 'set', 'frozenset', 'dict')
+    __immutable_collection_kinds__ = ('tuple', 'frozenset')
+
+    __sequence_types__ = {
+        'list'     : list,
+        'tuple'    : tuple,
+        'set'      : set,
+        'frozenset': frozenset,
+    }
+
+    # NOTE Each builder takes (transformer, ParameterCollection, previously activated IDs).
+    __collection_builders__ = {
+        'list'     : _build_sequence(list),
+        'tuple'    : _build_sequence(tuple),
+        'set'      : _build_sequence(set),
+        'frozenset': _build_sequence(frozenset),
+        'dict'     : _build_dict,
+    }
+
     def __init__(self, core_getter : callable):
         self.__core_getter = core_getter
+        self.__converters  = dict(builtin_converters)  # kind -> Converter
+        self.__templates   = {}  # source -> PlaceholderTemplate
+        self.__folded      = {}  # DataDefinition (by identity) -> FoldedValue or None
 
-        self.__re_env_with_default_value_as_string = re.compile(r'\{\s*\$(?P<env_name>[A-Za-z0-9_\.]+) or "(?P<default>.+)"\s*\}', re.IGNORECASE)
-        self.__re_env_with_default_value_as_int    = re.compile(r'\{\s*\$(?P<env_name>[A-Za-z0-9_\.]+) or (?P<default>[0-9]+)\s*\}', re.IGNORECASE)
-        self.__re_env_with_default_value_as_float  = re.compile(r'\{\s*\$(?P<env_name>[A-Za-z0-9_\.]+) or (?P<default>[0-9]*\.[0-9]*)\s*\}', re.IGNORECASE)
-        self.__re_env_without_default_value        = re.compile(r'\{\s*\$(?P<env_name>[A-Za-z0-9_\.]+)\s*\}', re.IGNORECASE)
+    def register(self, kind : str, convert : callable, immutable : bool = False):
+        """ Register the converter of the kind.
+
+            The converters should be registered before any activation as the
+            literal definitions of the immutable kinds are only cast once.
+
+            :param str kind: the kind of data, e.g., ``uuid``
+            :param callable convert: the callable taking the string and returning the converted value
+            :param bool immutable: flag if the converted value is immutable, i.e., safe to share between activations
+        """
+        if kind in self.__reserved_kinds__:
+            raise ValueError('Reserved type: {}'.format(kind))
+
+        self.__converters[kind] = Converter(convert, immutable)
+        self.__folded.clear()
 
     def cast(self, data, previously_activated : list = None):
         """ Transform the given data to the given kind.
@@ -34,15 +172,14 @@ class Transformer(object):
         """
         previously_activated = previously_activated or []
 
-        logger = get_logger('transformer', logging.ERROR)
-        logger.debug('Casting {}...'.format(data))
+        _log.debug('Casting %s...', data)
 
         if type(data) is not DataDefinition:
-            logger.debug('Return right away.')
+            _log.debug('Return right away.')
             return data
 
         if not data.transformation_required:
-            logger.debug('Return without transformation.')
+            _log.debug('Return without transformation.')
             return data.definition
 
         actual_data = data.definition
@@ -50,7 +187,8 @@ class Transformer(object):
 
         returnee = self._cast(actual_data, actual_kind, previously_activated)
 
-        logger.debug('Returning {}({})'.format(type(returnee).__name__, returnee))
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug('Returning %s(%s)', type(returnee).__name__, returnee)
 
         return returnee
 
@@ -58,88 +196,120 @@ class Transformer(object):
         if not isinstance(data, str):
             return data
 
-        returnee = data
+        return self.compile(data).render()
 
-        check_sequence = [
-            self.__re_env_without_default_value,
-            self.__re_env_with_default_value_as_string,
-            self.__re_env_with_default_value_as_float,
-            self.__re_env_with_default_value_as_int,
-        ]
+    def compile(self, data : str) -> PlaceholderTemplate:
+        """ Compile the string into a template, only once per string. """
+        template = self.__templates.get(data)
 
-        while True:
-            matches      = None
-            used_pattern = None
+        if template is None:
+            template = self.__templates[data] = PlaceholderTemplate(data)
 
-            for pattern in check_sequence:
-                matches = pattern.search(returnee)
+        return template
 
-                if matches:
-                    used_pattern = pattern
+    def fold(self, data) -> FoldedValue:
+        """ Cast the literal definition once.
 
-                    break
+            A definition is literal when it neither refers to any entity nor
+            has any environment variables, i.e., its value never changes.
 
-            if not matches:
-                break
+            :param data: the data definition
+            :return: the folded value, or ``None`` if the definition must be cast on every activation
+        """
+        if type(data) is not DataDefinition:
+            return None
 
-            parsed        = matches.groupdict()
-            env_value     = os.getenv(parsed['env_name'])
-            default_value = parsed['default'] if 'default' in parsed else ''
+        try:
+            return self.__folded[data]
+        except KeyError:
+            pass
 
-            if not env_value and not default_value:
-                raise UnknownEnvironmentVariableError(parsed['env_name'])
+        try:
+            folded = self._fold(data)
+        except Exception:
+            # NOTE Leave the error to the activation.
+            folded = None
 
-            returnee = used_pattern.sub(env_value or default_value, returnee, count = 1)
+        self.__folded[data] = folded
 
-        return returnee
+        return folded
 
-    def _cast(self, actual_data, actual_kind, previously_activated):
-        actual_data = self._pre_process(actual_data)
+    def _fold(self, data : DataDefinition):
+        if not data.transformation_required:
+            # NOTE Like "cast", the definition is used as it is.
+            return FoldedValue(data.definition)
 
-        if actual_kind == 'entity':
-            return self.__core_getter(actual_data, previously_activated)
+        kind       = data.kind
+        definition = data.definition
+
+        converter = self.__converters.get(kind)
+
+        if converter is not None:
+            if not converter.immutable:
+                return None
+
+            if isinstance(definition, str) and not self.compile(definition).static:
+                return None
+
+            return FoldedValue(self._cast(definition, kind, []))
 
-        if actual_kind == 'class':
-            return Loader(actual_data).package
+        if kind not in self.__foldable_collection_kinds__:
+            return None
 
-        if actual_kind == 'int':
-            return int(actual_data)
+        # At this point, assume that definition is ParameterCollection.
+        if kind == 'dict':
+            keys  = []
+            items = []
 
-        if actual_kind == 'float':
-            return float(actual_data)
+            for key, value in definition.items():
+                keys.append(key)
+                items.append(self.fold(value))
+        else:
+            keys  = None
+            items = [self.fold(item) for item in definition.sequence()]
 
-        if actual_kind == 'bool':
-            actual_data = actual_data.capitalize()
+        if None in items:
+            return None
 
-            assert actual_data in ('True', 'False')
+        if not any(item.mutable for item in items):
+            values = [item.value for item in items]
 
-            return actual_data == 'True'
+            if kind == 'dict':
+                values = dict(zip(keys, values))
 
-        if actual_kind in ['list', 'tuple', 'set']:
-            collection = []
+                return FoldedValue(values, values.copy)
 
-            # At theis point, assume that actual_data is ParameterCollection.
+            values = self.__sequence_types__[kind](values)
 
-            for item in actual_data.sequence():
-                collection.append(self.cast(item))
+            if kind in self.__immutable_collection_kinds__:
+                return FoldedValue(values)
 
-            if actual_kind != 'list':
-                collection = eval(actual_kind)(collection)
+            return FoldedValue(values, values.copy)
 
-            return collection
+        # NOTE Build the nested mutable values on every activation.
+        getters = [item.get for item in items]
 
-        if actual_kind == 'dict':
-            kv_map = {}
+        if kind == 'dict':
+            return FoldedValue(None, lambda: {key: get() for key, get in zip(keys, getters)})
 
-            # At theis point, assume that actual_data is ParameterCollection.
+        collection_type = self.__sequence_types__[kind]
+
+        return FoldedValue(None, lambda: collection_type([get() for get in getters]))
+
+    def _cast(self, actual_data, actual_kind, previously_activated):
+        actual_data = self._pre_process(actual_data)
+
+        if actual_kind == 'entity':
+            return self.__core_getter(actual_data, previously_activated)
 
-            for key, value in actual_data.items():
-                kv_map[key] = self.cast(value)
+        if actual_kind in self.__collection_builders__:
+            # At this point, assume that actual_data is ParameterCollection.
+            return self.__collection_builders__[actual_kind](self, actual_data, previously_activated)
 
-            return kv_map
+        converter = self.__converters.get(actual_kind)
 
-        if actual_kind == 'str':
-            return str(actual_data)
+        if converter is not None:
+            return converter.convert(actual_data)
 
         error_message = 'Unknown type: {} (Given data type: {})'
         raise ValueError(error_message.format(actual_kind, type(actual_data).__name__))
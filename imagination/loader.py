@@ -26,11 +26,287 @@ The module contains the package loader used to improve code maintainability.
 
 """
 
-import re
+import builtins
+import collections
+import contextvars
 import importlib
+import json
+import os
 import sys
+import threading
+import time
 from imagination.helper import retrieve_module
 
+_builtins = vars(builtins)
+
+
+class SymbolCacheStats(collections.namedtuple('SymbolCacheStats', ('hits', 'misses', 'size', 'max_size'))):
+    """ Statistics of :class:`SymbolCache` """
+    __slots__ = ()
+
+
+class SymbolCache(object):
+    """ Bounded cache of the objects resolved by dotted path, e.g., ``json.decoder.JSONDecoder``
+
+        :param int max_size: the maximum number of cached paths
+    """
+    def __init__(self, max_size: int = 4096):
+        assert max_size > 0, 'The maximum size must be positive.'
+
+        self.__max_size = max_size
+        self.__entries  = collections.OrderedDict()  # path -> resolved object
+        self.__lock     = threading.Lock()
+
+        self.__hits   = 0
+        self.__misses = 0
+
+    def resolve(self, path: str):
+        """ Resolve the path to the object. """
+        with self.__lock:
+            try:
+                resolved = self.__entries[path]
+            except KeyError:
+                pass
+            else:
+                self.__hits += 1
+                self.__entries.move_to_end(path)
+
+                return resolved
+
+        # NOTE The import system has its own lock.
+        resolved = resolve(path)
+
+        with self.__lock:
+            self.__misses += 1
+            self.__entries[path] = resolved
+
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last = False)
+
+        return resolved
+
+    def invalidate(self, prefix: str = None):
+        """ Forget the resolved objects, e.g., after a module is reloaded.
+
+            :param str prefix: the path of the object or the module to forget (everything by default)
+        """
+        with self.__lock:
+            if prefix is None:
+                self.__entries.clear()
+
+                return
+
+            for path in [path for path in self.__entries if path == prefix or path.startswith(prefix + '.')]:
+                del self.__entries[path]
+
+    def stats(self) -> SymbolCacheStats:
+        with self.__lock:
+            return SymbolCacheStats(self.__hits, self.__misses, len(self.__entries), self.__max_size)
+
+
+class ImportTimings(object):
+    """ Time spent to import each module through the loader
+
+        The time of a module includes the time to import its own dependencies.
+    """
+    def __init__(self):
+        self.__timings = {}  # module name -> seconds
+        self.__lock    = threading.Lock()
+
+    def record(self, module_name: str, seconds: float):
+        with self.__lock:
+            self.__timings[module_name] = seconds
+
+    def report(self) -> list:
+        """ Get the list of the pairs of the module name and the import time in seconds, the slowest first. """
+        with self.__lock:
+            return sorted(self.__timings.items(), key = lambda timing: timing[1], reverse = True)
+
+    def clear(self):
+        with self.__lock:
+            self.__timings.clear()
+
+
+import_timings = ImportTimings()
+
+
+class ImportAttribution(object):
+    """ Attribution of the import cost to the entities (instrumentation mode)
+
+        When enabled, the modules newly imported through the loader while
+        resolving a path, with their parent packages, and the time spent are
+        recorded for the entity being activated (see :class:`attributing`).
+        The modules are collected on the calling thread, so the imports made
+        by the other threads at the same time are never attributed to the entity.
+        This is enabled by setting ``IMAGINATION_IMPORT_ATTRIBUTION`` to ``true``.
+
+        .. note:: The modules imported by the imported modules themselves are
+                  included in the time, but not listed.
+    """
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+
+        self.__entries = {}  # entity ID -> {'seconds': float, 'paths': list, 'modules': list}
+        self.__lock    = threading.Lock()
+
+    def record(self, entity_id: str, path: str, modules: list, seconds: float):
+        with self.__lock:
+            entry = self.__entries.get(entity_id)
+
+            if entry is None:
+                entry = self.__entries[entity_id] = {'seconds': 0.0, 'paths': [], 'modules': []}
+
+            entry['seconds'] += seconds
+            entry['paths'].append(path)
+            entry['modules'].extend(modules)
+
+    def report(self) -> list:
+        """ Get the import cost of each entity, the most expensive first.
+
+            ``None`` is the entity ID for the imports outside of any activation.
+        """
+        with self.__lock:
+            report = [
+                {
+                    'entity_id' : entity_id,
+                    'seconds'   : entry['seconds'],
+                    'paths'     : list(entry['paths']),
+                    'modules'   : sorted(entry['modules']),
+                }
+                for entity_id, entry in self.__entries.items()
+            ]
+
+        return sorted(report, key = lambda entry: entry['seconds'], reverse = True)
+
+    def dump(self, **kwargs) -> str:
+        """ Dump the report in JSON. The keyword arguments are passed to :func:`json.dumps`. """
+        return json.dumps(self.report(), **kwargs)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+
+import_attribution = ImportAttribution((os.getenv('IMAGINATION_IMPORT_ATTRIBUTION') or '').lower() in ('1', 'true', 'yes'))
+
+_attributed_entity_id = contextvars.ContextVar('imagination_attributed_entity_id', default = None)
+_attributed_modules   = contextvars.ContextVar('imagination_attributed_modules', default = None)
+
+
+class attributing(object):
+    """ Context to attribute the import cost to the entity
+
+        :param str entity_id: the entity ID
+    """
+    __slots__ = ('entity_id', 'token')
+
+    def __init__(self, entity_id: str):
+        self.entity_id = entity_id
+        self.token     = None
+
+    def __enter__(self):
+        if import_attribution.enabled:
+            self.token = _attributed_entity_id.set(self.entity_id)
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.token is not None:
+            _attributed_entity_id.reset(self.token)
+
+            self.token = None
+
+
+def import_module(module_name: str):
+    """ Import the module and record the time if it has never been imported.
+
+        The module is always imported through :func:`importlib.import_module`,
+        which waits for the import in progress on another thread, instead of
+        taking the module half-initialized from ``sys.modules``.
+    """
+    if module_name in sys.modules:
+        return importlib.import_module(module_name)
+
+    parts         = module_name.split('.')
+    missing_names = [
+        name
+        for name in ('.'.join(parts[:i]) for i in range(1, len(parts) + 1))
+        if name not in sys.modules
+    ]
+
+    started_at   = time.perf_counter()
+    module       = importlib.import_module(module_name)
+    elapsed_time = time.perf_counter() - started_at
+
+    import_timings.record(module_name, elapsed_time)
+
+    if import_attribution.enabled:
+        modules = _attributed_modules.get()
+
+        if modules is not None:
+            modules.extend(missing_names)
+        else:
+            # NOTE Imported directly, e.g., by Loader.module, instead of resolving a path.
+            import_attribution.record(_attributed_entity_id.get(), module_name, missing_names, elapsed_time)
+
+    return module
+
+
+def resolve(path: str):
+    """ Resolve the path to the object without any cache.
+
+        A path without any dots refers to either a built-in object, e.g., ``int``, or a module.
+    """
+    if not import_attribution.enabled:
+        return _resolve(path)
+
+    modules    = []
+    token      = _attributed_modules.set(modules)
+    started_at = time.perf_counter()
+
+    try:
+        return _resolve(path)
+    finally:
+        _attributed_modules.reset(token)
+
+        import_attribution.record(_attributed_entity_id.get(), path, modules, time.perf_counter() - started_at)
+
+
+def _resolve(path: str):
+    if '.' not in path:
+        if path in _builtins:
+            return _builtins[path]
+
+        return import_module(path)
+
+    module_path, _, name = path.rpartition('.')
+
+    try:
+        target_module = import_module(module_path)
+    except TypeError as exception:
+        raise ImportError('Unable to import {}.{} as {}'.format(module_path, name, exception))
+
+    try:
+        return getattr(target_module, name)
+    except AttributeError:
+        # NOTE The target may be a sub-module which has not been imported yet.
+        try:
+            return import_module(path)
+        except ImportError:
+            pass
+
+        raise ImportError('Module \'{}\' has no reference to \'{}\', except {}.'.format(
+            target_module.__name__, name, ', '.join(dir(target_module))
+        ))
+
+
+symbol_cache = SymbolCache(int(os.getenv('IMAGINATION_SYMBOL_CACHE_SIZE') or 4096))
+
+
+def resolve_symbol(path: str):
+    """ Resolve the path to the object with the process-wide cache. """
+    return symbol_cache.resolve(path)
+
 class OnDemandProxy(object):
     """On-demand Proxy
 
@@ -60,7 +336,7 @@ class Loader(object):
     """
     def __init__(self, path_to_package):
         self._path         = path_to_package
-        self._access_path  = re.split('\.', self._path)
+        self._access_path  = self._path.split('.')
         self._module_path  = '.'.join(self._access_path[:-1])
         self._module       = None
         self._package_name = self._access_path[-1]
@@ -77,7 +353,7 @@ class Loader(object):
     def module(self):
         ''' Get a reference to the module. '''
         if not self._module:
-            self._module = retrieve_module(self._module_path)
+            self._module = import_module(self._module_path)
 
         return self._module
 
@@ -85,7 +361,7 @@ class Loader(object):
     def package(self):
         ''' Get a reference to the package. '''
         if not self._package:
-            self._package = self._retrieve_package()
+            self._package = resolve_symbol(self._path)
 
         return self._package
 
@@ -96,31 +372,4 @@ class Loader(object):
 
     def _retrieve_package(self):
         ''' Retrieve a package by the module path and the package name. '''
-
-        target_module = self.module
-
-        # Either built-in class or a file.
-        if '.' not in self._path:
-            try:
-                importlib.import_module(self._path)
-
-                return getattr(target_module, self._path)
-            except ImportError as exception:
-                return eval(self._path)
-                # NOP; assume that the request path is a built-in module.
-
-            return
-
-        try:
-            __import__(self._module_path, fromlist=[self._package_name])
-        except TypeError as exception:
-            raise ImportError('Unable to import {}.{} as {}'.format(
-                self._module_path, self._package_name, exception
-            ))
-
-        try:
-            return getattr(target_module, self._package_name)
-        except AttributeError as exception:
-            raise ImportError('Module \'{}\' has no reference to \'{}\', except {}.'.format(
-                target_module.__name__, self._package_name, ', '.join(dir(target_module))
-            ))
+        return resolve(self._path)
@@ -1,6 +1,6 @@
 # v2
 from ..debug          import PrintableMixin
-from ..helper.general import extract_dependency_ids_from_parameters
+from ..helper.general import extract_dependency_ids_from_parameters, extract_symbol_paths_from_parameters
 from .definition      import ParameterCollection
 
 
@@ -78,6 +78,35 @@ class Container(PrintableMixin):
 
         return self._dependencies
 
+    @property
+    def construction_dependencies(self):
+        """ The IDs of the entities required to construct this container """
+        return extract_dependency_ids_from_parameters(self._params)
+
+    @property
+    def initial_call_dependencies(self):
+        """ The IDs of the entities used by the initial method calls of this container """
+        dependencies = set()
+
+        for initial_call in self._initial_calls:
+            dependencies.update(
+                extract_dependency_ids_from_parameters(initial_call.parameters)
+            )
+
+        return dependencies
+
+    @property
+    def symbol_paths(self):
+        """ The dotted paths of the classes and callables referenced by this container """
+        symbol_paths = extract_symbol_paths_from_parameters(self._params)
+
+        for initial_call in self._initial_calls:
+            symbol_paths.update(
+                extract_symbol_paths_from_parameters(initial_call.parameters)
+            )
+
+        return symbol_paths
+
     @property
     def auto_wired(self):
         return self._auto_wired
@@ -104,6 +133,10 @@ class Entity(Container):
     def fqcn(self):
         return self._fqcn
 
+    @property
+    def symbol_paths(self):
+        return super().symbol_paths | {self._fqcn}
+
 
 class Factorization(Container):
     """ Metadata representing Factorization """
@@ -147,6 +180,15 @@ class Factorization(Container):
 
         return self._dependencies
 
+    @property
+    def construction_dependencies(self):
+        dependencies = extract_dependency_ids_from_parameters(self._params)
+
+        # The factory is always required.
+        dependencies.add(self._factory_id)
+
+        return dependencies
+
 
 class LambdaUnusedParameterWarning(RuntimeWarning):
     """ Warning when the parameters are defined but
@@ -179,3 +221,7 @@ class Lambda(Container):
     @property
     def fq_callable_name(self):
         return self._fq_callable_name
+
+    @property
+    def symbol_paths(self):
+        return super().symbol_paths | {self._fq_callable_name}
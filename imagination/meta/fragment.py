@@ -0,0 +1,27 @@
+# v2
+class Fragment(object):
+    """ Metadata of a set of definitions loaded on demand, e.g., a configuration file
+
+        Only the IDs are known until the fragment is loaded.
+
+        :param str name: the name of the fragment, e.g., the path to the file
+        :param ids: the IDs of the entities defined by the fragment
+        :param callable loader: the callable returning the map of the entity ID to the meta container
+        :param intercepted_ids: the IDs of the entities intercepted by the entities of the fragment
+    """
+    def __init__(self, name : str, ids, loader : callable, intercepted_ids = ()):
+        self.name            = name
+        self.ids             = tuple(ids)
+        self.intercepted_ids = tuple(intercepted_ids)
+        self.loaded          = False
+
+        self.__loader = loader
+
+    def load(self) -> dict:
+        """ Load the map of the entity ID to the meta container (only once). """
+        meta_container_map = self.__loader()
+
+        # NOTE If the loader fails, the fragment is loaded again on the next request to raise the same error.
+        self.loaded = True
+
+        return meta_container_map
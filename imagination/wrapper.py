@@ -1,4 +1,8 @@
 # v2
+import operator
+import threading
+
+
 def is_wrapper(obj):
     return hasattr(obj, '__imagination_wrapper__')
 
@@ -11,13 +15,15 @@ class Wrapper(object):
         :param callable core_get: a callable reference to the associated :method:`Imagination.get`.
         :param object instance: a wrapped instance
         :param dict interceptions: the event-type-to-method-name-to-interception map
+        :param InterceptorBinder interceptor_binder: the binder shared by all wrappers of the associated core
     """
-    def __init__(self, core_get, instance, interceptions):
+    def __init__(self, core_get, instance, interceptions, interceptor_binder = None):
         self.__dict__ = {
-            '_internal_core_get'        : core_get,
-            '_internal_instance'        : instance,
-            '_internal_interceptions'   : interceptions,
-            '_internal_cache_callables' : {},
+            '_internal_core_get'           : core_get,
+            '_internal_instance'           : instance,
+            '_internal_interceptions'      : interceptions,
+            '_internal_interceptor_binder' : interceptor_binder or InterceptorBinder(core_get),
+            '_internal_cache_callables'    : {},
         }
 
     # This is just a special property to identify as __class__ is overridden to fakely representing the wrapped object.
@@ -56,7 +62,8 @@ class Wrapper(object):
             interceptable_callable = InterceptableCallable(
                 core_get,
                 returning_callable,
-                interceptions[name]
+                interceptions[name],
+                self.__dict__['_internal_interceptor_binder'],
             )
 
             cached_callables[name] = interceptable_callable
@@ -65,35 +72,205 @@ class Wrapper(object):
 
         return returning_callable
 
+class ProxyFactory(object):
+    """ Factory of Generated Proxies
+
+        Unlike :class:`Wrapper`, which relays every attribute through ``__getattr__``, a generated
+        proxy is an instance of a slot-based class generated once per wrapped type and set of
+        intercepted methods. The interceptable callables are stored in the slots named after the
+        intercepted methods, and the other attributes of the wrapped type are delegated with
+        plain descriptors. Only the attributes unknown to the wrapped type, e.g., the ones set
+        in the constructor, fall back to ``__getattr__``.
+
+        The factory has the same signature as :class:`Wrapper`.
+    """
+    def __init__(self):
+        self.__proxy_classes = {}  # (wrapped type, intercepted method names) -> proxy class
+        self.__lock          = threading.Lock()
+
+    def __call__(self, core_get, instance, interceptions, interceptor_binder = None):
+        proxy_class = self.get_proxy_class(type(instance), interceptions)
+
+        return proxy_class(core_get, instance, interceptions, interceptor_binder or InterceptorBinder(core_get))
+
+    def get_proxy_class(self, wrapped_type : type, interceptions : dict) -> type:
+        key = (wrapped_type, frozenset(interceptions))
+
+        proxy_class = self.__proxy_classes.get(key)
+
+        if proxy_class is not None:
+            return proxy_class
+
+        with self.__lock:
+            proxy_class = self.__proxy_classes.get(key)
+
+            if proxy_class is None:
+                proxy_class = self.__proxy_classes[key] = _generate_proxy_class(wrapped_type, sorted(interceptions))
+
+        return proxy_class
+
+
+def _generate_proxy_class(wrapped_type : type, intercepted_names : list) -> type:
+    internal_names = ('_internal_core_get', '_internal_instance', '_internal_interceptions',
+                      '_internal_interceptor_binder')
+
+    def __init__(self, core_get, instance, interceptions, interceptor_binder):
+        set_attribute = object.__setattr__
+
+        set_attribute(self, '_internal_core_get', core_get)
+        set_attribute(self, '_internal_instance', instance)
+        set_attribute(self, '_internal_interceptions', interceptions)
+        set_attribute(self, '_internal_interceptor_binder', interceptor_binder)
+
+        for name in intercepted_names:
+            # NOTE The missing methods are left unset to raise AttributeError on access.
+            if hasattr(instance, name):
+                set_attribute(self, name, InterceptableCallable(core_get, getattr(instance, name),
+                                                                interceptions[name], interceptor_binder))
+
+    def __getattr__(self, name):
+        instance = object.__getattribute__(self, '_internal_instance')
+
+        try:
+            return getattr(instance, name)
+        except AttributeError:
+            raise AttributeError('{} has no attribute "{}".'.format(type(instance).__name__, name))
+
+    def __setattr__(self, name, value):
+        setattr(object.__getattribute__(self, '_internal_instance'), name, value)
+
+    def __delattr__(self, name):
+        delattr(object.__getattribute__(self, '_internal_instance'), name)
+
+    namespace = {
+        '__slots__'               : internal_names + tuple(intercepted_names),
+        '__module__'              : __name__,
+        '__init__'                : __init__,
+        '__getattr__'             : __getattr__,
+        '__setattr__'             : __setattr__,
+        '__delattr__'             : __delattr__,
+        '__class__'               : property(lambda self: type(self._internal_instance)),
+        '__imagination_wrapper__' : True,
+    }
+
+    for name in dir(wrapped_type):
+        if name in namespace or name in namespace['__slots__'] or (name.startswith('__') and name.endswith('__')):
+            continue
+
+        namespace[name] = property(operator.attrgetter('_internal_instance.' + name))
+
+    return type('{}Proxy'.format(wrapped_type.__name__), (object,), namespace)
+
+
+class InterceptorBinder(object):
+    """ Interceptor Binder
+
+        This class is to bind the intercepting methods of the interceptors, shared by all
+        interceptable callables of the same core. When the core is reset, the binder is
+        invalidated and the interceptable callables bind the intercepting methods again.
+
+        :param callable core_get: a callable reference to the associated :method:`Imagination.get`.
+        :param callable core_is_cacheable: a callable to check if the entity is cacheable.
+    """
+    def __init__(self, core_get, core_is_cacheable = None):
+        self._internal_core_get          = core_get
+        self._internal_core_is_cacheable = core_is_cacheable
+
+        self.generation = 0
+
+    def invalidate(self):
+        """ Invalidate all bindings made so far. """
+        self.generation += 1
+
+    def bind(self, interceptions):
+        """ Bind the intercepting methods.
+
+            As the interceptors are activated here, this is only done on the
+            first intercepted call. The intercepting methods of non-cacheable
+            interceptors are left unbound as they must be resolved on every call.
+
+            :param list interceptions: the list of interceptions
+            :return: the tuple of (interception, interceptor, intercepting method)
+        """
+        bindings = []
+
+        for interception in interceptions:
+            interceptor_id = interception.interceptor_id
+
+            if self._internal_core_is_cacheable and not self._internal_core_is_cacheable(interceptor_id):
+                bindings.append((interception, None, None))
+
+                continue
+
+            interceptor = self._internal_core_get(interceptor_id)
+
+            bindings.append((interception, interceptor, getattr(interceptor, interception.intercepting_method)))
+
+        return tuple(bindings)
+
+
 class InterceptableCallable(object):
     """ Interceptable callable object
 
         This class is to actually handle the call operation with the ability to intercept the activity.
+
+        The advice chain is specialized by the events with interceptions when the object is created,
+        e.g., an intercepted method with only "before" interceptions is an instance of
+        :class:`BeforeAdviceChain`, so the call path never checks the events without interceptions.
+        The arguments are passed to the interceptors as given, without any copy.
     """
-    def __init__(self, core_get, callable_reference, interceptions):
+    def __new__(cls, core_get, callable_reference, interceptions, interceptor_binder = None):
+        if cls is InterceptableCallable:
+            cls = _select_advice_chain(interceptions)
+
+        return super().__new__(cls)
+
+    def __init__(self, core_get, callable_reference, interceptions, interceptor_binder = None):
         self._internal_core_get      = core_get
         self._internal_callable      = callable_reference
         self._internal_interceptions = interceptions
+        self._internal_binder        = interceptor_binder or InterceptorBinder(core_get)
+        self._internal_bindings      = {}  # event type -> tuple of (interception, interceptor, intercepting method)
+        self._internal_generation    = self._internal_binder.generation
 
     def _has_interceptions(self, event_type):
         return bool(self._internal_interceptions[event_type])
 
-    def _intercept(self, event_type, largs = None, kwargs = None, error = None):
-        if not self._has_interceptions(event_type):
-            return
+    def _get_bindings(self, event_type):
+        binder = self._internal_binder
+
+        if self._internal_generation != binder.generation:
+            self._internal_bindings   = {}
+            self._internal_generation = binder.generation
+
+        bindings = self._internal_bindings.get(event_type)
+
+        if bindings is None:
+            bindings = self._internal_bindings[event_type] = binder.bind(self._internal_interceptions[event_type])
+
+        return bindings
+
+    def _intercept(self, event_type, largs = (), kwargs = None, error = None):
+        if kwargs is None:
+            kwargs = _NO_KWARGS
 
-        largs  = largs  or []
-        kwargs = kwargs or {}
+        bindings = (
+            self._internal_bindings.get(event_type)
+            if self._internal_generation == self._internal_binder.generation
+            else None
+        )
 
-        last_result = None
+        if bindings is None:
+            bindings = self._get_bindings(event_type)
 
-        for interception in self._internal_interceptions[event_type]:
-            interceptor         = self._internal_core_get(interception.interceptor_id)
-            intercepting_method = getattr(interceptor,
-                                          interception.intercepting_method)
+        for interception, interceptor, intercepting_method in bindings:
+            if intercepting_method is None:
+                interceptor         = self._internal_core_get(interception.interceptor_id)
+                intercepting_method = getattr(interceptor,
+                                              interception.intercepting_method)
 
             try:
-                if error:
+                if error is not None:
                     intercepting_method(error, *largs, **kwargs)
 
                     continue
@@ -105,30 +282,81 @@ class InterceptableCallable(object):
                     interception.interceptor_id,
                     type(interceptor).__module__,
                     type(interceptor).__name__,
-                    largs,
+                    list(largs),
                     kwargs,
                 ))
 
     def __call__(self, *largs, **kwargs):
         self._intercept('before', largs, kwargs)
 
-        result = None
+        try:
+            result = self._internal_callable(*largs, **kwargs)
+        except Exception as error:
+            self._intercept('error', largs, kwargs, error)
 
-        if self._has_interceptions('error'):
-            try:
-                result = self._internal_callable(*largs, **kwargs)
-            except Exception as error:
-                self._intercept('error', largs, kwargs, error)
+            raise error
+
+        self._intercept('after', (result,))
+
+        return result
 
-                raise error
-        else:
-            result = self._internal_callable(*largs, **kwargs)
 
-        if self._has_interceptions('after'):
-            self._intercept('after', [result])
+class PassThroughAdviceChain(InterceptableCallable):
+    """ Advice chain without any interceptions """
+    def __call__(self, *largs, **kwargs):
+        return self._internal_callable(*largs, **kwargs)
+
+
+class BeforeAdviceChain(InterceptableCallable):
+    """ Advice chain with only "before" interceptions """
+    def __call__(self, *largs, **kwargs):
+        self._intercept('before', largs, kwargs)
+
+        return self._internal_callable(*largs, **kwargs)
+
+
+class AfterAdviceChain(InterceptableCallable):
+    """ Advice chain with only "after" interceptions """
+    def __call__(self, *largs, **kwargs):
+        result = self._internal_callable(*largs, **kwargs)
+
+        self._intercept('after', (result,))
 
         return result
 
 
+class AroundAdviceChain(InterceptableCallable):
+    """ Advice chain with "before" and "after" interceptions """
+    def __call__(self, *largs, **kwargs):
+        self._intercept('before', largs, kwargs)
+
+        result = self._internal_callable(*largs, **kwargs)
+
+        self._intercept('after', (result,))
+
+        return result
+
+
+class ErrorAdviceChain(InterceptableCallable):
+    """ Advice chain with "error" interceptions, optionally with "before" and "after" interceptions """
+
+
+_NO_KWARGS = {}  # NOTE Only used for unpacking, never modified.
+
+_ADVICE_CHAINS = {
+    # (before, after, error) -> advice chain
+    (False, False, False) : PassThroughAdviceChain,
+    (True,  False, False) : BeforeAdviceChain,
+    (False, True,  False) : AfterAdviceChain,
+    (True,  True,  False) : AroundAdviceChain,
+}
+
+
+def _select_advice_chain(interceptions):
+    shape = tuple(bool(interceptions[event_type]) for event_type in ('before', 'after', 'error'))
+
+    return _ADVICE_CHAINS.get(shape, ErrorAdviceChain)
+
+
 class InterceptionError(TypeError):
     """ Unable to intercept the method call """
@@ -0,0 +1,27 @@
+import time
+
+
+def measure(operation, iterations : int = 10000, repeat : int = 5) -> float:
+    """ Measure the best time of the operation in nanoseconds per operation. """
+    best = None
+
+    for _ in range(repeat):
+        started_at = time.perf_counter_ns()
+
+        for _ in range(iterations):
+            operation()
+
+        elapsed_time = (time.perf_counter_ns() - started_at) / iterations
+
+        if best is None or elapsed_time < best:
+            best = elapsed_time
+
+    return best
+
+
+def report(title : str, results : dict):
+    """ Print the benchmark results (in nanoseconds per operation). """
+    print('\n{}'.format(title))
+
+    for label, ns_per_op in results.items():
+        print('  {:<40} {:>12.1f} ns/op'.format(label, ns_per_op))
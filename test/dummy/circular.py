@@ -0,0 +1,20 @@
+class AutoWiredAlpha(object):
+    def __init__(self, bravo):
+        self.bravo = bravo
+
+
+class AutoWiredBravo(object):
+    def __init__(self, alpha : AutoWiredAlpha):
+        self.alpha = alpha
+
+
+# NOTE The annotation is set afterward as both classes depend on each other.
+AutoWiredAlpha.__init__.__annotations__['bravo'] = AutoWiredBravo
+
+
+class SelfRequesting(object):
+    """ Service requesting itself from the container on construction """
+    entity_id = 'self.requesting'
+
+    def __init__(self, container):
+        self.itself = container.get(self.entity_id)
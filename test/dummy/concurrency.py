@@ -0,0 +1,40 @@
+import threading
+import time
+
+
+class SlowService(object):
+    """ Service which takes a while to construct """
+    delay     = 0.05
+    instances = []
+    lock      = threading.Lock()
+
+    def __init__(self, name):
+        time.sleep(self.delay)
+
+        self.name = name
+
+        with SlowService.lock:
+            SlowService.instances.append(self)
+
+
+class SlowConsumer(object):
+    def __init__(self, service):
+        self.service = service
+        self.ready   = False
+
+    def prepare(self):
+        time.sleep(SlowService.delay)
+
+        self.ready = True
+
+
+class SlowPeer(object):
+    """ Service linked to another one by an initial method call """
+    def __init__(self, name):
+        time.sleep(SlowService.delay)
+
+        self.name = name
+        self.peer = None
+
+    def link(self, peer):
+        self.peer = peer
@@ -0,0 +1,12 @@
+class Registry(object):
+    def __init__(self, name):
+        self.name    = name
+        self.members = []
+
+    def register(self, member):
+        self.members.append(member)
+
+
+class Member(object):
+    def __init__(self, code):
+        self.code = code
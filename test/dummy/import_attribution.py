@@ -0,0 +1,6 @@
+import decimal
+
+
+class Accountant(object):
+    def __init__(self, currency = None):
+        self.currency = currency
@@ -0,0 +1,2 @@
+class Heavy(object):
+    pass
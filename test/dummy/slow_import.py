@@ -0,0 +1,8 @@
+import time
+
+# NOTE The module is visible in sys.modules before the class is defined.
+time.sleep(0.2)
+
+
+class Slow(object):
+    pass
@@ -0,0 +1,72 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from imagination.assembler.cache import ConfigCache
+from imagination.assembler.core  import Assembler
+from imagination.assembler.xml   import XMLParser
+from imagination.debug           import dump_meta_container
+
+
+class UnitTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir   = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.cache_dir, 'locator.xml')
+
+        shutil.copyfile('test/data/locator.xml', self.config_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_hit_after_miss(self):
+        first  = Assembler(cache_dir = self.cache_dir)
+        second = Assembler(cache_dir = self.cache_dir)
+
+        expected = first._load_config_files(self.config_path)
+        actual   = second._load_config_files(self.config_path)
+
+        self.assertEqual((0, 1, 1), tuple(first.get_cache_stats()))
+        self.assertEqual((1, 0, 0), tuple(second.get_cache_stats()))
+        self.assertEqual(sorted(expected), sorted(actual))
+
+        for entity_id in expected:
+            self.assertEqual(repr(dump_meta_container(expected[entity_id])), repr(dump_meta_container(actual[entity_id])))
+
+    def test_touched_file(self):
+        cache = ConfigCache(self.cache_dir)
+
+        cache.load(XMLParser(), self.config_path)
+
+        stat = os.stat(self.config_path)
+        os.utime(self.config_path, ns = (stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+        cache.load(XMLParser(), self.config_path)
+        cache.load(XMLParser(), self.config_path)
+
+        self.assertEqual((2, 1), cache.stats()[:2])
+
+    def test_modified_file(self):
+        cache = ConfigCache(self.cache_dir)
+
+        cache.load(XMLParser(), self.config_path)
+
+        with open(self.config_path, 'a') as f:
+            f.write('\n')
+
+        cache.load(XMLParser(), self.config_path)
+
+        self.assertEqual((0, 2), cache.stats()[:2])
+
+    def test_broken_cache_file(self):
+        cache = ConfigCache(self.cache_dir)
+
+        cache.load(XMLParser(), self.config_path)
+
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith('.cache'):
+                with open(os.path.join(self.cache_dir, filename), 'wb') as f:
+                    f.write(b'broken')
+
+        self.assertIn('poo', cache.load(XMLParser(), self.config_path))
+        self.assertEqual((0, 2), cache.stats()[:2])
@@ -0,0 +1,128 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from imagination.assembler.core import Assembler, DuplicateContainerIDError
+from imagination.assembler.xml  import UnsupportedContainerError
+from imagination.exc            import UndefinedContainerIDError
+
+
+class FunctionalTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+        # NOTE The scenario of locator-aop.xml split into multiple files
+        self.test_filepaths = [
+            self.__write_config('conversation.xml', '<entity id="conversation" class="dummy.sample_aop.Conversation"/>'),
+            self.__write_config('charlie.xml', '''
+                <entity id="charlie" class="dummy.sample_aop.Charlie">
+                    <param type="entity" name="conversation">conversation</param>
+                </entity>
+            '''),
+            self.__write_config('crew.xml', '''
+                <entity id="alpha" class="dummy.sample_aop.Alpha">
+                    <param type="entity" name="conversation">conversation</param>
+                    <param type="entity" name="accompany">beta</param>
+                    <interception before="charlie" do="cook" with="order"/>
+                    <interception after="charlie" do="serve" with="say_thank"/>
+                </entity>
+                <entity id="beta" class="dummy.sample_aop.Beta">
+                    <param type="entity" name="conversation">conversation</param>
+                    <interception after="alpha" do="order" with="acknowledge"/>
+                    <interception after="charlie" do="serve" with="say_thank"/>
+                </entity>
+            '''),
+            'test/data/locator.xml',
+        ]
+
+        self.assembler = Assembler(lazy = True)
+        self.assembler.load(*self.test_filepaths)
+
+        self.core = self.assembler.core
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_index_only(self):
+        self.assertEqual([], self.assembler.get_parse_timings())
+        self.assertTrue(self.core.contain('poo'))
+        self.assertFalse(self.core.contain('unknown'))
+        self.assertIn('alpha', self.core.all_ids())
+        self.assertEqual([], self.assembler.get_parse_timings())
+
+        with self.assertRaises(UndefinedContainerIDError):
+            self.core.get('unknown')
+
+    def test_load_on_first_request(self):
+        self.core.get('dioe')
+
+        self.assertEqual(['test/data/locator.xml'], [filepath for filepath, _ in self.assembler.get_parse_timings()])
+
+    def test_load_dependencies_and_interceptors(self):
+        # The other files are loaded after the lockdown.
+        self.core.get('poo')
+
+        self.assertTrue(self.core.is_on_lockdown())
+
+        charlie      = self.core.get('charlie')
+        conversation = self.core.get('conversation')
+
+        charlie.cook()
+        charlie.serve()
+
+        self.assertEqual(
+            [
+                'Alpha: orders "egg"',
+                'Beta: acknowledge "egg"',
+                'Charlie: cook',
+                'Charlie: serve',
+            ],
+            conversation.logs[:4],
+        )
+        self.assertEqual(4, len(self.assembler.get_parse_timings()))
+
+    def test_duplicate_ids_without_override(self):
+        assembler = Assembler(lazy = True, allow_override = False)
+
+        with self.assertRaises(DuplicateContainerIDError):
+            assembler.load('test/data/locator.xml', 'test/data/locator.json')
+
+    def test_programmatic_definitions_with_lazy_dependencies(self):
+        with self.core.define_entity('mine', 'dummy.dynamic_param.SuperDynamicParamObject') as definition:
+            definition.add_dependency('poo', 'x')
+
+        with self.core.define_entity('mine.user', 'dummy.dynamic_param.SuperDynamicParamObject') as definition:
+            definition.add_dependency('mine', 'x')
+            definition.add_dependency('charlie', 'charlie')
+
+        mine_user = self.core.get('mine.user')
+
+        self.assertIs(self.core.get('poo'), mine_user.x.x)
+        self.assertIs(self.core.get('charlie'), mine_user.b['charlie'])
+
+    def test_parse_error_raised_again(self):
+        filepath = os.path.join(self.temp_dir, 'broken.json')
+
+        with open(filepath, 'w') as f:
+            f.write('{"a": {"class": "dummy.sample_aop.Conversation"}, "b": {"type": "unknown"}}')
+
+        assembler = Assembler(lazy = True)
+        assembler.load(filepath)
+
+        for _ in range(2):
+            with self.assertRaises(UnsupportedContainerError):
+                assembler.core.get('a')
+
+        self.assertTrue(assembler.core.contain('a'))
+
+    def __write_config(self, filename, content):
+        filepath = os.path.join(self.temp_dir, filename)
+
+        with open(filepath, 'w') as f:
+            f.write('<imagination>{}</imagination>'.format(content))
+
+        return filepath
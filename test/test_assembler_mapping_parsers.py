@@ -0,0 +1,43 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from imagination.assembler.core import Assembler
+from imagination.assembler.json import JSONParser
+from imagination.assembler.toml import TOMLParser
+from imagination.assembler.xml  import XMLParser
+
+
+class UnitTest(unittest.TestCase):
+    def test_same_containers_as_xml(self):
+        expectations = [
+            (JSONParser(), 'test/data/locator.json', 'test/data/locator.xml'),
+            (JSONParser(), 'test/data/locator-factorization.json', 'test/data/locator-factorization.xml'),
+            (JSONParser(), 'test/data/container-callable.json', 'test/data/container-callable.xml'),
+            (TOMLParser(), 'test/data/locator.toml', 'test/data/locator.xml'),
+        ]
+
+        for parser, filepath, xml_filepath in expectations:
+            with self.subTest(filepath = filepath):
+                expected = XMLParser().parse(xml_filepath)
+                actual   = parser.parse(filepath)
+
+                self.assertEqual(list(expected), list(actual))
+
+                for entity_id in expected:
+                    self.assertEqual(repr(expected[entity_id]), repr(actual[entity_id]))
+
+    def test_activation(self):
+        for filepath in ('test/data/config-formats.json', 'test/data/config-formats.toml'):
+            with self.subTest(filepath = filepath):
+                assembler = Assembler()
+                assembler.load(filepath)
+
+                registry = assembler.core.get('registry')
+                member   = assembler.core.get('member')
+
+                self.assertEqual('sushi', registry.name)
+                self.assertEqual([registry, member], registry.members)
+                self.assertEqual(7, member.code)
@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from imagination.assembler.core import Assembler, DuplicateContainerIDError, UnsupportedConfigFileError
+
+
+class UnitTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+        self.test_filepaths = [
+            'test/data/locator.xml',
+            'test/data/locator-factorization.xml',
+            'test/data/locator-lazy-action.xml',
+            self.__write_config('override.xml', '<entity id="poo" class="dummy.core.PlainOldObjectWithParameters"/>'),
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_same_as_sequential_loading(self):
+        sequential_assembler = Assembler()
+        parallel_assembler   = Assembler(workers = 2)
+
+        expected = sequential_assembler._load_config_files(*self.test_filepaths)
+        actual   = parallel_assembler._load_config_files(*self.test_filepaths)
+
+        self.assertEqual(list(expected), list(actual))
+
+        for entity_id in expected:
+            self.assertEqual(repr(expected[entity_id]), repr(actual[entity_id]))
+
+        # The last file overrides the earlier ones.
+        self.assertEqual('dummy.core.PlainOldObjectWithParameters', actual['poo'].fqcn)
+
+        self.assertEqual(self.test_filepaths, [filepath for filepath, _ in parallel_assembler.get_parse_timings()])
+
+    def test_parallel_loading_with_cache(self):
+        cache_dir = os.path.join(self.temp_dir, 'cache')
+
+        Assembler(workers = 2, cache_dir = cache_dir)._load_config_files(*self.test_filepaths)
+
+        assembler = Assembler(workers = 2, cache_dir = cache_dir)
+        assembler._load_config_files(*self.test_filepaths)
+
+        self.assertEqual(len(self.test_filepaths), assembler.get_cache_stats().hits)
+
+    def test_duplicate_ids_without_override(self):
+        assembler = Assembler(allow_override = False)
+
+        with self.assertRaisesRegex(DuplicateContainerIDError, 'poo is defined in both'):
+            assembler._load_config_files(*self.test_filepaths)
+
+    def test_unsupported_file(self):
+        with self.assertRaises(UnsupportedConfigFileError):
+            Assembler()._load_config_files('test/data/locator.xml', 'containers.yml')
+
+    def __write_config(self, filename, content):
+        filepath = os.path.join(self.temp_dir, filename)
+
+        with open(filepath, 'w') as f:
+            f.write('<imagination>{}</imagination>'.format(content))
+
+        return filepath
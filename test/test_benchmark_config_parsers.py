@@ -0,0 +1,103 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# noinspection PyUnresolvedReferences
+from dummy.benchmark import measure, report
+
+from imagination.assembler.json import JSONParser
+from imagination.assembler.toml import TOMLParser
+from imagination.assembler.xml  import StreamingXMLParser, XMLParser
+
+
+class BenchmarkTest(unittest.TestCase):
+    """ Benchmark the configuration parsers with 5,000 entities
+
+        The tests only check that the parsers agree. The timings are reported
+        by running this module directly.
+    """
+    entity_count = 5000
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+        xml_chunks  = []
+        toml_lines  = []
+        definitions = {}
+
+        for i in range(self.entity_count):
+            entity_id = 'e{}'.format(i)
+            params    = [
+                {'name': 'a', 'type': 'int', 'value': i},
+                {'name': 'b', 'type': 'entity', 'value': 'e{}'.format(max(i - 1, 0))},
+            ]
+
+            definitions[entity_id] = {'class': 'dummy.core.PlainOldObjectWithParameters', 'params': params}
+
+            xml_chunks.append(
+                '<entity id="{}" class="dummy.core.PlainOldObjectWithParameters">'
+                '<param type="int" name="a">{}</param>'
+                '<param type="entity" name="b">{}</param>'
+                '</entity>'.format(entity_id, params[0]['value'], params[1]['value'])
+            )
+
+            toml_lines.extend([
+                '[{}]'.format(entity_id),
+                'class = "dummy.core.PlainOldObjectWithParameters"',
+                'params = [{{name = "a", type = "int", value = {}}}, {{name = "b", type = "entity", value = "{}"}}]'.format(
+                    params[0]['value'], params[1]['value']
+                ),
+            ])
+
+        self.xml_path  = self.__write('entities.xml', '<imagination>{}</imagination>'.format(''.join(xml_chunks)))
+        self.json_path = self.__write('entities.json', json.dumps(definitions))
+        self.toml_path = self.__write('entities.toml', '\n'.join(toml_lines))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def run_benchmark(self):
+        return {
+            'XMLParser (kotoba)'  : measure(lambda: XMLParser().parse(self.xml_path), 1, 1),
+            'StreamingXMLParser'  : measure(lambda: StreamingXMLParser().parse(self.xml_path), 1, 1),
+            'JSONParser'          : measure(lambda: JSONParser().parse(self.json_path), 1, 1),
+            'TOMLParser'          : measure(lambda: TOMLParser().parse(self.toml_path), 1, 1),
+        }
+
+    def test_same_definitions(self):
+        expected = XMLParser().parse(self.xml_path)
+
+        self.assertEqual(self.entity_count, len(expected))
+
+        for parser, filepath in ((StreamingXMLParser(), self.xml_path),
+                                 (JSONParser(), self.json_path),
+                                 (TOMLParser(), self.toml_path)):
+            with self.subTest(type(parser).__name__):
+                parsed = parser.parse(filepath)
+
+                self.assertEqual(list(expected), list(parsed))
+                self.assertEqual(expected['e1'].fqcn, parsed['e1'].fqcn)
+                self.assertEqual(expected['e1'].dependencies, parsed['e1'].dependencies)
+
+    def __write(self, filename, content):
+        filepath = os.path.join(self.temp_dir, filename)
+
+        with open(filepath, 'w') as f:
+            f.write(content)
+
+        return filepath
+
+
+if __name__ == '__main__':
+    test = BenchmarkTest()
+    test.setUp()
+
+    try:
+        report('Configuration parsers ({} entities)'.format(BenchmarkTest.entity_count), test.run_benchmark())
+    finally:
+        test.tearDown()
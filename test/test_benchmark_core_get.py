@@ -0,0 +1,64 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# noinspection PyUnresolvedReferences
+from dummy.benchmark import measure, report
+# noinspection PyUnresolvedReferences
+from dummy.core import PlainOldObject
+
+from imagination.core import Imagination
+from imagination.helper.id_naming import fully_qualified_class_name
+
+
+class BenchmarkTest(unittest.TestCase):
+    """ Benchmark ``Imagination.get`` on an already-activated entity
+
+        The tests only check that the warm calls take the fast path. The
+        timings are reported by running this module directly.
+    """
+    def setUp(self):
+        self.core = Imagination()
+
+        with self.core.define_entity('poo', 'dummy.core.PlainOldObject'):
+            pass
+
+        with self.core.define_entity(fully_qualified_class_name(PlainOldObject), 'dummy.core.PlainOldObject'):
+            pass
+
+        # Warm up.
+        self.core.get('poo')
+        self.core.get(PlainOldObject)
+
+    def run_benchmark(self):
+        core = self.core
+
+        return {
+            'warm get by string'                  : measure(lambda: core.get('poo')),
+            'warm get by class'                   : measure(lambda: core.get(PlainOldObject)),
+            'warm get by class (explicit naming)' : measure(
+                lambda: core.get(PlainOldObject, id_naming_strategy = fully_qualified_class_name)
+            ),
+        }
+
+    def test_warm_get(self):
+        with mock.patch.object(Imagination, 'get_info', wraps = self.core.get_info) as get_info:
+            self.core.get('poo')
+            self.core.get(PlainOldObject)
+
+            self.assertEqual(0, get_info.call_count)
+
+            # The explicit naming strategy bypasses the resolved instance table.
+            self.core.get(PlainOldObject, id_naming_strategy = fully_qualified_class_name)
+
+            self.assertEqual(1, get_info.call_count)
+
+
+if __name__ == '__main__':
+    test = BenchmarkTest()
+    test.setUp()
+
+    report('Imagination.get', test.run_benchmark())
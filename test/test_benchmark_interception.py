@@ -0,0 +1,83 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# noinspection PyUnresolvedReferences
+from dummy.benchmark import measure, report
+
+from imagination.meta.definition import Interception
+from imagination.wrapper import BeforeAdviceChain, InterceptableCallable, InterceptorBinder
+
+
+class Service(object):
+    def run(self, value):
+        return value
+
+
+class Auditor(object):
+    def __init__(self):
+        self.count = 0
+
+    def record(self, *largs, **kwargs):
+        self.count += 1
+
+
+class BenchmarkTest(unittest.TestCase):
+    """ Benchmark the intercepted calls against the raw calls
+
+        The tests only check the specialized call path. The timings are
+        reported by running this module directly.
+    """
+    def setUp(self):
+        self.service = Service()
+        self.auditor = Auditor()
+
+        interceptions = {
+            'before' : [Interception('before', 'service', 'run', 'auditor', 'record')],
+            'after'  : [],
+            'error'  : [],
+        }
+
+        self.intercepted_run = InterceptableCallable(lambda entity_id: self.auditor, self.service.run, interceptions)
+
+        # Warm up.
+        self.intercepted_run(1)
+
+    def run_benchmark(self):
+        run             = self.service.run
+        record          = self.auditor.record
+        intercepted_run = self.intercepted_run
+
+        def manually_advised_run(value):
+            record(value)
+
+            return run(value)
+
+        return {
+            'raw call'                 : measure(lambda: run(1)),
+            'manually advised call'    : measure(lambda: manually_advised_run(1)),
+            'intercepted call (before)': measure(lambda: intercepted_run(1)),
+        }
+
+    def test_intercepted_call(self):
+        self.assertIsInstance(self.intercepted_run, BeforeAdviceChain)
+
+        self.auditor.count = 0
+
+        # The interceptor is bound once, so the calls go straight to the advice.
+        with mock.patch.object(InterceptorBinder, 'bind') as bind:
+            for value in range(3):
+                self.assertEqual(value, self.intercepted_run(value))
+
+        self.assertEqual(0, bind.call_count)
+        self.assertEqual(3, self.auditor.count)
+
+
+if __name__ == '__main__':
+    test = BenchmarkTest()
+    test.setUp()
+
+    report('InterceptableCallable', test.run_benchmark())
@@ -0,0 +1,137 @@
+import logging
+import os
+import sys
+import unittest
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# noinspection PyUnresolvedReferences
+from dummy.benchmark import measure, report
+
+from imagination.core import Imagination
+from imagination.debug import LoggerFactory
+from imagination.helper import transformer as transformer_module
+from imagination.helper.transformer import Transformer
+from imagination.meta.container import Entity
+from imagination.meta.definition import DataDefinition, ParameterCollection
+
+
+class FormattingHandler(logging.Handler):
+    """ Handler only formatting the records, i.e., the cost of formatting every message """
+    def __init__(self):
+        super().__init__()
+
+        self.count = 0
+
+    def emit(self, record):
+        self.format(record)
+
+        self.count += 1
+
+
+def set_level(logger : logging.Logger, level : int):
+    logger.setLevel(level)
+
+    # NOTE The loggers of the factory are not registered to the manager, which only resets the cached levels of its loggers.
+    logger._cache.clear()
+
+
+@contextmanager
+def formatting_handler(loggers, level : int = None):
+    """ Replace the handlers of the loggers with one formatting handler temporarily.
+
+        :param loggers: the loggers
+        :param int level: the temporary level of the loggers (unchanged by default)
+    """
+    states  = [(logger, logger.level, logger.handlers[:]) for logger in loggers]
+    handler = FormattingHandler()
+
+    for logger in loggers:
+        if level is not None:
+            set_level(logger, level)
+
+        logger.handlers[:] = [handler]
+
+    try:
+        yield handler
+    finally:
+        for logger, level, handlers in states:
+            set_level(logger, level)
+            logger.handlers[:] = handlers
+
+
+class BenchmarkTest(unittest.TestCase):
+    """ Benchmark the activation hot paths with the debug level disabled and enabled
+
+        The tests only check that no record is made while the debug level is
+        disabled. The timings are reported by running this module directly.
+    """
+    def setUp(self):
+        items = ParameterCollection()
+        items.add(DataDefinition('2.5', 'ratio', 'float'), 'ratio')
+        items.add(DataDefinition('{ $HOME or "/tmp" }', 'home', 'str'), 'home')
+
+        prototype = Entity('report', 'dummy.dynamic_param.DynamicParamObject', cacheable = False)
+        prototype.params.add(DataDefinition('1', 'a', 'int'), 'a')
+        prototype.params.add(DataDefinition('alpha', kind = 'str'))
+        prototype.params.add(DataDefinition(items, 'options', 'dict'), 'options')
+
+        self.core = Imagination()
+        self.core.update_metadata({'report': prototype})
+
+        # Warm up.
+        self.core.get('report')
+
+        self.transformer = Transformer(None)
+        self.definition  = DataDefinition('{ $HOME or "/tmp" }', kind = 'str')
+
+        self.loggers = (LoggerFactory.get('controller'), transformer_module._log)
+
+    def run_benchmark(self):
+        core        = self.core
+        transformer = self.transformer
+        definition  = self.definition
+
+        def activate():
+            core.get('report')
+
+        def cast():
+            transformer.cast(definition)
+
+        results = {
+            'prototype activation (warning)' : measure(activate, 1000),
+            'Transformer.cast (warning)'     : measure(cast, 1000),
+        }
+
+        # NOTE Every debug message is formatted as the hot paths did before.
+        with formatting_handler(self.loggers, logging.DEBUG):
+            results['prototype activation (debug)'] = measure(activate, 1000)
+            results['Transformer.cast (debug)']     = measure(cast, 1000)
+
+        return results
+
+    def test_disabled_debug_logging(self):
+        with formatting_handler(self.loggers) as handler:
+            self.core.get('report')
+            self.transformer.cast(self.definition)
+
+        self.assertEqual(0, handler.count)
+
+    def test_enabled_debug_logging(self):
+        with formatting_handler(self.loggers, logging.DEBUG) as handler:
+            self.core.get('report')
+
+            activation_count = handler.count
+
+            self.transformer.cast(self.definition)
+
+        self.assertGreater(activation_count, 0)
+        self.assertGreater(handler.count, activation_count)
+
+
+if __name__ == '__main__':
+    test = BenchmarkTest()
+    test.setUp()
+
+    report('Logging on the activation hot paths', test.run_benchmark())
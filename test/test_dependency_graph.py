@@ -0,0 +1,106 @@
+import unittest
+
+from imagination.core import Imagination
+from imagination.exc import CircularDependencyError, UndefinedContainerIDError
+
+
+class FunctionalTest(unittest.TestCase):
+    """ Test the activation order calculated from the dependency graph """
+    def setUp(self):
+        self.core = Imagination()
+
+    def define(self, entity_id, *dependency_ids, initial_call_dependency_ids = None):
+        with self.core.define_entity(entity_id, 'dummy.dynamic_param.SuperDynamicParamObject') as definition:
+            for dependency_id in dependency_ids:
+                definition.add_dependency(dependency_id)
+
+            if initial_call_dependency_ids:
+                with definition.call('__init__') as method_call:
+                    for dependency_id in initial_call_dependency_ids:
+                        method_call.with_entity(dependency_id)
+
+    def test_topological_order(self):
+        self.define('a', 'b', 'c')
+        self.define('b', 'd')
+        self.define('c', 'd')
+        self.define('d')
+
+        sequence = self.core._calculate_activation_sequence('a')
+
+        self.assertEqual(['b', 'c', 'd'], sorted(sequence))
+        self.assertLess(sequence.index('d'), sequence.index('b'))
+        self.assertLess(sequence.index('d'), sequence.index('c'))
+
+    def test_circular_dependency_with_full_path(self):
+        self.define('a', 'b')
+        self.define('b', 'c')
+        self.define('c', 'a')
+
+        with self.assertRaises(CircularDependencyError) as context:
+            self.core._calculate_activation_sequence('a')
+
+        self.assertEqual('a -> b -> c -> a', str(context.exception))
+
+    def test_cycle_through_initial_calls(self):
+        self.define('a', 'b')
+        self.define('b', initial_call_dependency_ids = ['a'])
+
+        b = self.core.get('b')
+
+        self.assertIs(self.core.get('a'), b.x)
+        self.assertEqual((), self.core._calculate_activation_sequence('b'))
+        self.assertEqual(('b',), self.core._calculate_activation_sequence('a'))
+
+    def test_undefined_dependency(self):
+        self.define('a', 'b')
+
+        self.assertRaises(UndefinedContainerIDError, self.core._calculate_activation_sequence, 'a')
+
+    def test_graph_indexed_at_lockdown(self):
+        self.define('a', 'b')
+        self.define('b')
+
+        self.core.lock_down()
+
+        self.assertIs(self.core.get_dependency_graph(), self.core.get_dependency_graph())
+
+    def test_dependants_and_impact(self):
+        self.define('a', 'b')
+        self.define('b', 'c')
+        self.define('c')
+        self.define('d', initial_call_dependency_ids = ['c'])
+
+        self.core.get('d')  # Declare the initial method calls.
+
+        graph = self.core.get_dependency_graph()
+
+        self.assertEqual(('b', 'd'), graph.dependants('c'))
+        self.assertEqual(('b',), graph.dependants('c', required_only = True))
+        self.assertEqual(['a', 'b', 'd'], sorted(graph.impact('c')))
+        self.assertEqual((), graph.impact('a'))
+
+    def test_depth_and_layers(self):
+        self.define('a', 'b', 'c')
+        self.define('b', 'c')
+        self.define('c')
+        self.define('d', initial_call_dependency_ids = ['a'])
+
+        graph = self.core.get_dependency_graph()
+
+        self.assertEqual(2, graph.depth('a'))
+        self.assertEqual(0, graph.depth('d'))
+        self.assertEqual([['c', 'd'], ['b'], ['a']], graph.layers())
+        self.assertEqual([['c'], ['b']], graph.layers(['b']))
+
+    def test_cycles(self):
+        self.define('a', 'b')
+        self.define('b', 'a')
+        self.define('c', 'c')
+        self.define('d', 'a')
+        self.define('e', initial_call_dependency_ids = ['e'])
+
+        graph = self.core.get_dependency_graph()
+
+        self.assertEqual([('a', 'b'), ('c',)], sorted(tuple(sorted(cycle)) for cycle in graph.cycles()))
+        self.assertEqual(graph.depth('a'), graph.depth('b'))
+        self.assertEqual(graph.depth('a') + 1, graph.depth('d'))
@@ -0,0 +1,71 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# noinspection PyUnresolvedReferences
+from dummy.core import PlainOldObjectWithParameters
+
+from imagination.core import Imagination
+from imagination.meta.container import Entity
+from imagination.meta.definition import DataDefinition, ParameterCollection
+
+
+class FunctionalTest(unittest.TestCase):
+    """ Test the activation plans compiled by the controller """
+    def setUp(self):
+        self.core = Imagination()
+
+        params = ParameterCollection()
+        params.add(DataDefinition('2', 'a', 'int'), 'a')
+        params.add(DataDefinition('3', 'b', 'float'), 'b')
+
+        self.core.set_metadata('prototype', Entity('prototype', 'dummy.core.PlainOldObjectWithParameters', params,
+                                                   cacheable = False))
+        self.core.set_metadata('singleton', Entity('singleton', 'dummy.core.PlainOldObject'))
+
+        items = ParameterCollection()
+        items.add(DataDefinition('1', kind = 'int'))
+
+        params = ParameterCollection()
+        params.add(DataDefinition(items, 'x', 'list'), 'x')
+        params.add(DataDefinition(items, 'y', 'tuple'), 'y')
+
+        self.core.set_metadata('collections', Entity('collections', 'dummy.dynamic_param.SuperDynamicParamObject', params,
+                                                     cacheable = False))
+
+    def test_prototype_activation_replays_plan(self):
+        first  = self.core.get('prototype')
+        plan   = self.core.get_info('prototype').activation_plan
+        second = self.core.get('prototype')
+
+        self.assertIsInstance(first, PlainOldObjectWithParameters)
+        self.assertIsInstance(second, PlainOldObjectWithParameters)
+        self.assertIsNot(first, second)
+        self.assertEqual(6, second.method())
+
+        self.assertIsNotNone(plan)
+        self.assertIs(plan, self.core.get_info('prototype').activation_plan)
+        self.assertIs(PlainOldObjectWithParameters, plan.target)
+        self.assertEqual(('a', 'b'), tuple(name for name, _ in plan.kwargs))
+        self.assertFalse(self.core.get_info('prototype').activated())
+
+    def test_plan_not_cached_before_lockdown(self):
+        self.core.get('singleton', lock_down_enabled = False)
+
+        self.assertFalse(self.core.is_on_lockdown())
+        self.assertIsNone(self.core.get_info('singleton').activation_plan)
+
+    def test_literal_parameters_folded(self):
+        first  = self.core.get('collections')
+        second = self.core.get('collections')
+
+        x_slot, y_slot = [slot for _, slot in self.core.get_info('collections').activation_plan.kwargs]
+
+        self.assertEqual([1], second.x)
+        self.assertIsNot(first.x, second.x)
+        self.assertIs(first.b['y'], second.b['y'])
+
+        self.assertIsNotNone(x_slot.copy)
+        self.assertTrue(y_slot.constant)
@@ -0,0 +1,145 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# noinspection PyUnresolvedReferences
+from dummy.concurrency import SlowConsumer, SlowPeer, SlowService
+
+from imagination.core import Imagination
+
+
+class FunctionalTest(unittest.TestCase):
+    """ Test the concurrent activation """
+    def setUp(self):
+        SlowService.instances.clear()
+
+        self.core = Imagination()
+
+        for entity_id in ('slow.alpha', 'slow.bravo', 'slow.charlie'):
+            with self.core.define_entity(entity_id, 'dummy.concurrency.SlowService') as definition:
+                definition.set_param('str', entity_id, 'name')
+
+        with self.core.define_entity('consumer', 'dummy.concurrency.SlowConsumer') as definition:
+            definition.add_dependency('slow.alpha', 'service')
+
+            with definition.call('prepare'):
+                pass
+
+        # NOTE The initial method calls of x and y form a cycle.
+        for entity_id, peer_id in (('peer.x', 'peer.y'), ('peer.y', 'peer.x')):
+            with self.core.define_entity(entity_id, 'dummy.concurrency.SlowPeer') as definition:
+                definition.set_param('str', entity_id, 'name')
+
+                with definition.call('link') as method_call:
+                    method_call.with_entity(peer_id)
+
+    def run_concurrently(self, entity_ids):
+        results = {}
+        errors  = []
+        barrier = threading.Barrier(len(entity_ids))
+
+        def activate(index, entity_id):
+            barrier.wait()
+
+            try:
+                results[index] = self.core.get(entity_id)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [
+            threading.Thread(target = activate, args = (index, entity_id), daemon = True)
+            for index, entity_id in enumerate(entity_ids)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join(5)
+
+            self.assertFalse(thread.is_alive(), 'Deadlocked')
+
+        self.assertFalse(errors, errors)
+
+        return [results[index] for index in range(len(entity_ids))]
+
+    def test_same_entity_constructed_once(self):
+        instances = self.run_concurrently(['slow.alpha'] * 8)
+
+        self.assertEqual(1, len(SlowService.instances))
+
+        for instance in instances:
+            self.assertIs(SlowService.instances[0], instance)
+
+    def test_unrelated_entities_constructed_in_parallel(self):
+        started_at = time.perf_counter()
+
+        self.run_concurrently(['slow.alpha', 'slow.bravo', 'slow.charlie'])
+
+        elapsed_time = time.perf_counter() - started_at
+
+        self.assertEqual(3, len(SlowService.instances))
+        self.assertLess(elapsed_time, SlowService.delay * 3)
+
+    def test_instance_published_after_initial_calls(self):
+        consumers = self.run_concurrently(['consumer'] * 4)
+
+        self.assertEqual(1, len(SlowService.instances))
+
+        for consumer in consumers:
+            self.assertIs(consumers[0], consumer)
+            self.assertTrue(consumer.ready)
+
+    def test_initial_call_cycle(self):
+        x, y = self.run_concurrently(['peer.x', 'peer.y'])
+
+        self.assertIs(y, x.peer)
+        self.assertIs(x, y.peer)
+
+    def test_activation_layers(self):
+        layers = self.core._calculate_activation_layers()
+
+        self.assertEqual(2, len(layers))
+        self.assertEqual({'slow.alpha', 'slow.bravo', 'slow.charlie', 'peer.x', 'peer.y'}, set(layers[0]))
+        self.assertEqual(['consumer'], layers[1])
+
+    def test_warm_up(self):
+        started_at = time.perf_counter()
+
+        timings = self.core.warm_up(workers = 4)
+
+        elapsed_time = time.perf_counter() - started_at
+
+        self.assertEqual({'slow.alpha', 'slow.bravo', 'slow.charlie', 'peer.x', 'peer.y', 'consumer'}, set(timings))
+        self.assertEqual('consumer', list(timings)[-1])
+        self.assertEqual(3, len(SlowService.instances))
+        self.assertLess(elapsed_time, SlowService.delay * 4)
+
+        for entity_id in timings:
+            self.assertTrue(self.core.get_info(entity_id).activated())
+
+    def test_warm_up_skips_circular_dependencies(self):
+        # NOTE The constructions of a and b form a cycle.
+        for entity_id, peer_id in (('cycle.a', 'cycle.b'), ('cycle.b', 'cycle.a')):
+            with self.core.define_entity(entity_id, 'dummy.concurrency.SlowConsumer') as definition:
+                definition.add_dependency(peer_id, 'service')
+
+        with self.core.define_entity('cycle.user', 'dummy.concurrency.SlowConsumer') as definition:
+            definition.add_dependency('cycle.a', 'service')
+
+        timings = self.core.warm_up(workers = 4)
+
+        self.assertEqual({'slow.alpha', 'slow.bravo', 'slow.charlie', 'peer.x', 'peer.y', 'consumer'}, set(timings))
+
+        for entity_id in ('cycle.a', 'cycle.b', 'cycle.user'):
+            self.assertFalse(self.core.get_info(entity_id).activated())
+
+    def test_activate_selected_entities(self):
+        timings = self.core.activate_all(['consumer'], workers = 1)
+
+        self.assertEqual(['slow.alpha', 'consumer'], list(timings))
+        self.assertFalse(self.core.get_info('slow.bravo').activated())
@@ -0,0 +1,85 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# noinspection PyUnresolvedReferences
+from dummy.sample_aop import Alpha, Charlie
+
+from imagination.assembler.core import Assembler
+from imagination.core import Imagination
+from imagination import wrapper
+from imagination.wrapper import InterceptableCallable, Wrapper, is_wrapper
+
+
+class FunctionalTest(unittest.TestCase):
+    """ Test the interceptions with the generated proxies """
+    def setUp(self):
+        self.assembler = Assembler(Imagination(wrapper_mode = 'generated'))
+        self.assembler.load('test/data/locator-aop.xml')
+
+        self.core = self.assembler.core
+
+    def test_aop_positive(self):
+        conversation = self.core.get('conversation')
+        charlie      = self.core.get('charlie')
+
+        charlie.cook()
+
+        self.assertEqual(
+            ['Alpha: orders "egg"', 'Beta: acknowledge "egg"', 'Charlie: cook'],
+            conversation.logs,
+        )
+
+        self.assertEqual('Charlie', charlie.serve())
+
+    def test_proxy(self):
+        alpha   = self.core.get('alpha')
+        charlie = self.core.get('charlie')
+
+        self.assertTrue(is_wrapper(charlie))
+        self.assertNotIsInstance(charlie, Wrapper)
+        self.assertIsInstance(charlie, Charlie)
+        self.assertIsInstance(charlie._internal_instance, Charlie)
+        self.assertIsInstance(charlie.cook, InterceptableCallable)
+        self.assertIsInstance(alpha.order, InterceptableCallable)
+
+        # Not intercepted
+        self.assertEqual(alpha._internal_instance.say_thank, alpha.say_thank)
+        self.assertIs(self.core.get('conversation'), charlie.conversation)
+
+        self.assertIs(type(alpha), type(self.core.get('alpha')))
+
+    def test_attribute_delegation(self):
+        charlie = self.core.get('charlie')
+
+        charlie.name = 'Chuck'
+
+        self.assertEqual('Chuck', charlie._internal_instance.name)
+        self.assertEqual('Chuck', charlie.serve())
+
+        self.assertRaises(AttributeError, getattr, charlie, 'unknown')
+
+    def test_proxy_classes_generated_on_lockdown(self):
+        with mock.patch.object(wrapper, '_generate_proxy_class', wraps = wrapper._generate_proxy_class) as generate:
+            self.core.get('conversation')
+
+            self.assertEqual({Alpha, Charlie}, {call.args[0] for call in generate.call_args_list})
+            self.assertFalse(self.core.get_info('charlie').activated())
+
+            self.core.get('charlie')
+
+            self.assertEqual(2, generate.call_count)
+
+            # The proxy classes are not shared with the other containers.
+            assembler = Assembler(Imagination(wrapper_mode = 'generated'))
+            assembler.load('test/data/locator-aop.xml')
+            assembler.core.get('charlie')
+
+            self.assertEqual(4, generate.call_count)
+            self.assertIsNot(type(assembler.core.get('charlie')), type(self.core.get('charlie')))
+
+    def test_unknown_wrapper_mode(self):
+        self.assertRaises(ValueError, Imagination, wrapper_mode = 'unknown')
@@ -0,0 +1,74 @@
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# noinspection PyUnresolvedReferences
+from dummy.circular import AutoWiredAlpha, AutoWiredBravo, SelfRequesting
+
+from imagination.core import Imagination
+from imagination.exc import CircularDependencyError
+from imagination.helper.id_naming import fully_qualified_class_name
+from imagination.meta.container import Entity
+from imagination.meta.definition import DataDefinition
+
+
+class FunctionalTest(unittest.TestCase):
+    """ Test the detection of circular dependencies on activation """
+    def setUp(self):
+        self.core = Imagination()
+
+    def run_with_timeout(self, entity_id):
+        errors = []
+
+        def activate():
+            try:
+                self.core.get(entity_id)
+            except Exception as e:
+                errors.append(e)
+
+        thread = threading.Thread(target = activate, daemon = True)
+        thread.start()
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive(), 'Deadlocked')
+
+        return errors
+
+    def test_auto_wired_cycle(self):
+        for cls in (AutoWiredAlpha, AutoWiredBravo):
+            with self.core.define_entity(fully_qualified_class_name(cls), fully_qualified_class_name(cls)):
+                pass
+
+        for entity_id in (fully_qualified_class_name(AutoWiredAlpha), fully_qualified_class_name(AutoWiredBravo)):
+            errors = self.run_with_timeout(entity_id)
+
+            self.assertEqual(1, len(errors))
+            self.assertIsInstance(errors[0], CircularDependencyError)
+            self.assertIn(entity_id, str(errors[0]))
+
+    def test_constructor_requesting_itself(self):
+        with self.core.define_entity(SelfRequesting.entity_id, 'dummy.circular.SelfRequesting') as definition:
+            definition.add_dependency('container', 'container')
+
+        for _ in range(2):
+            errors = self.run_with_timeout(SelfRequesting.entity_id)
+
+            self.assertEqual(1, len(errors))
+            self.assertIsInstance(errors[0], CircularDependencyError)
+            self.assertEqual('self.requesting -> self.requesting', str(errors[0]))
+
+    def test_prototype_diamond(self):
+        for entity_id, dependency_ids in (('a', []), ('x', ['a']), ('y', ['a']), ('root', ['x', 'y'])):
+            container = Entity(entity_id, 'dummy.dynamic_param.SuperDynamicParamObject', cacheable = False)
+
+            for dependency_id in dependency_ids:
+                container.params.add(DataDefinition(dependency_id, dependency_id, 'entity'), dependency_id)
+
+            self.core.update_metadata({entity_id: container})
+
+        root = self.core.get('root')
+
+        self.assertIsNot(root.x.b['a'], root.b['y'].b['a'])
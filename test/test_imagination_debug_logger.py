@@ -1,9 +1,11 @@
 import logging
+import threading
+import time
 from logging import Logger
 from unittest import TestCase
 
 from imagination.assembler.handlers import AbstractContainerCreator, EntityCreator, FactorizationCreator, LambdaCreator
-from imagination.debug import LoggerFactory
+from imagination.debug import EntityLoggerAdapter, LogDispatcher, LoggerFactory, QueuedHandler
 
 
 class LoggerFactoryTest(TestCase):
@@ -33,3 +35,80 @@ class LoggerFactoryTest(TestCase):
         self.assertEqual(logger.name, 'imagination.assembler.handlers.LambdaCreator')
         logger.info('From the JSON logger')
 
+
+    def test_entity_logger(self):
+        alpha = self.lf.get_for_entity('alpha')
+        beta  = self.lf.get_for_entity('beta')
+
+        self.assertIsInstance(alpha, EntityLoggerAdapter)
+        self.assertIs(alpha.logger, beta.logger)
+
+        with self.assertLogs(alpha.logger, level = logging.WARNING) as context:
+            alpha.warning('Param %s: Not defined', 'x')
+
+        self.assertEqual('[alpha] Param x: Not defined', context.records[0].getMessage())
+        self.assertEqual('alpha', context.records[0].entity_id)
+
+
+class ListHandler(logging.Handler):
+    def __init__(self, delay: float = 0):
+        super().__init__()
+
+        self.delay   = delay
+        self.threads = []
+        self.records = []
+
+    def emit(self, record):
+        time.sleep(self.delay)
+
+        self.threads.append(threading.current_thread())
+        self.records.append(self.format(record))
+
+
+class LogDispatcherTest(TestCase):
+    def test_queued_logger(self):
+        dispatcher = LogDispatcher()
+        target     = ListHandler()
+        logger     = Logger('queued')
+
+        logger.addHandler(QueuedHandler(target, dispatcher))
+        logger.warning('Hello, %s', 'world')
+
+        dispatcher.stop()
+
+        self.assertEqual(['Hello, world'], target.records)
+        self.assertIsNot(threading.current_thread(), target.threads[0])
+
+    def test_overflow_drop(self):
+        dispatcher = LogDispatcher(max_size = 1, overflow_policy = 'drop')
+        target     = ListHandler(delay = 0.05)
+        logger     = Logger('queued/drop')
+
+        logger.addHandler(QueuedHandler(target, dispatcher))
+
+        for i in range(10):
+            logger.warning('Record %d', i)
+
+        dispatcher.stop()
+
+        self.assertGreater(dispatcher.dropped, 0)
+        self.assertEqual(10, len(target.records) + dispatcher.dropped)
+        self.assertEqual('Record 0', target.records[0])
+
+    def test_overflow_drop_oldest(self):
+        dispatcher = LogDispatcher(max_size = 1, overflow_policy = 'drop_oldest')
+        target     = ListHandler(delay = 0.05)
+        logger     = Logger('queued/drop-oldest')
+
+        logger.addHandler(QueuedHandler(target, dispatcher))
+
+        for i in range(10):
+            logger.warning('Record %d', i)
+
+        dispatcher.stop()
+
+        self.assertGreater(dispatcher.dropped, 0)
+        self.assertEqual('Record 9', target.records[-1])
+
+    def test_unknown_overflow_policy(self):
+        self.assertRaises(ValueError, LogDispatcher, overflow_policy = 'unknown')
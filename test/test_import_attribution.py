@@ -0,0 +1,103 @@
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from imagination.core import Imagination
+from imagination.loader import Loader, import_attribution, symbol_cache
+
+
+class FunctionalTest(unittest.TestCase):
+    """ Test the attribution of the import cost to the entities """
+    module_name = 'dummy.import_attribution'
+
+    def setUp(self):
+        sys.modules.pop(self.module_name, None)
+        symbol_cache.invalidate(self.module_name)
+        symbol_cache.invalidate('fractions')
+
+        import_attribution.clear()
+        import_attribution.enabled = True
+
+    def tearDown(self):
+        import_attribution.enabled = False
+        import_attribution.clear()
+
+    def test_report(self):
+        core = Imagination()
+
+        with core.define_entity('accountant', '{}.Accountant'.format(self.module_name)) as definition:
+            definition.add_classinfo('fractions.Fraction', 'currency')
+
+        core.get('accountant')
+
+        report = import_attribution.report()
+        entry  = report[0]
+
+        self.assertEqual('accountant', entry['entity_id'])
+        self.assertEqual(['{}.Accountant'.format(self.module_name), 'fractions.Fraction'], sorted(entry['paths']))
+        self.assertIn(self.module_name, entry['modules'])
+        self.assertGreater(entry['seconds'], 0)
+
+        self.assertEqual(report, json.loads(import_attribution.dump()))
+
+    def test_concurrent_imports_not_attributed(self):
+        slow_module_name  = 'dummy.slow_import'
+        other_module_name = 'dummy.import_policy'
+
+        for module_name in (slow_module_name, other_module_name):
+            sys.modules.pop(module_name, None)
+            symbol_cache.invalidate(module_name)
+
+        core = Imagination()
+
+        with core.define_entity('slow', '{}.Slow'.format(slow_module_name)):
+            pass
+
+        def import_other_module():
+            # Wait for the activation to start importing the slow module.
+            deadline = time.monotonic() + 5
+
+            while slow_module_name not in sys.modules and time.monotonic() < deadline:
+                time.sleep(0.001)
+
+            importlib.import_module(other_module_name)
+
+        thread = threading.Thread(target = import_other_module)
+        thread.start()
+
+        core.get('slow')
+        thread.join()
+
+        entry = import_attribution.report()[0]
+
+        self.assertEqual('slow', entry['entity_id'])
+        self.assertIn(slow_module_name, entry['modules'])
+        self.assertIn(other_module_name, sys.modules)
+        self.assertNotIn(other_module_name, entry['modules'])
+
+    def test_loader_module(self):
+        Loader('{}.Accountant'.format(self.module_name)).module
+
+        entry = import_attribution.report()[0]
+
+        self.assertIsNone(entry['entity_id'])
+        self.assertEqual([self.module_name], entry['paths'])
+        self.assertIn(self.module_name, entry['modules'])
+
+    def test_disabled(self):
+        import_attribution.enabled = False
+
+        core = Imagination()
+
+        with core.define_entity('accountant', '{}.Accountant'.format(self.module_name)):
+            pass
+
+        core.get('accountant')
+
+        self.assertEqual([], import_attribution.report())
@@ -0,0 +1,120 @@
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from imagination.core import Imagination
+from imagination.loader import symbol_cache
+from imagination.meta.container import Entity
+from imagination.meta.definition import DataDefinition
+
+
+class FunctionalTest(unittest.TestCase):
+    """ Test the import policies of the core """
+    module_name = 'dummy.import_policy'
+
+    def setUp(self):
+        sys.modules.pop(self.module_name, None)
+        symbol_cache.invalidate(self.module_name)
+
+    def define(self, core):
+        with core.define_entity('heavy', '{}.Heavy'.format(self.module_name)):
+            pass
+
+        with core.define_entity('consumer', 'dummy.dynamic_param.SuperDynamicParamObject') as definition:
+            definition.add_dependency('heavy')
+
+    def test_lazy(self):
+        core = Imagination()
+
+        self.define(core)
+        core.lock_down()
+
+        self.assertNotIn(self.module_name, sys.modules)
+
+        core.get('consumer')
+
+        self.assertIn(self.module_name, sys.modules)
+
+    def test_prefetch(self):
+        core = Imagination(import_policy = 'prefetch')
+
+        self.define(core)
+
+        self.assertNotIn(self.module_name, sys.modules)
+
+        core.lock_down()
+
+        self.assertTrue(core.wait_for_prefetch(5))
+        self.assertIn(self.module_name, sys.modules)
+        self.assertIn(self.module_name, dict(core.get_import_timings()))
+
+    def test_prefetch_and_get_concurrently(self):
+        module_name = 'dummy.slow_import'
+
+        sys.modules.pop(module_name, None)
+        symbol_cache.invalidate(module_name)
+
+        core = Imagination(import_policy = 'prefetch')
+
+        with core.define_entity('slow', '{}.Slow'.format(module_name)):
+            pass
+
+        core.lock_down()
+
+        # Wait for the prefetch to start importing the module.
+        deadline = time.monotonic() + 5
+
+        while module_name not in sys.modules and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        self.assertEqual('Slow', type(core.get('slow')).__name__)
+        self.assertTrue(core.wait_for_prefetch(5))
+
+    def test_eager(self):
+        core = Imagination(import_policy = 'eager')
+
+        self.define(core)
+
+        self.assertIn(self.module_name, sys.modules)
+
+    def test_eager_fails_fast(self):
+        core = Imagination(import_policy = 'eager')
+
+        with self.assertRaises(ImportError):
+            with core.define_entity('unknown', 'dummy.import_policy.Unknown'):
+                pass
+
+        self.assertFalse(core.contain('unknown'))
+
+    def define_with_placeholder(self, core):
+        container = Entity('factory', 'dummy.dynamic_param.SuperDynamicParamObject')
+        container.params.add(DataDefinition('{ $IMAGINATION_TEST_CLASS }', 'cls', 'class'), 'cls')
+
+        core.update_metadata({'factory': container})
+
+    def test_eager_with_placeholder(self):
+        core = Imagination(import_policy = 'eager')
+
+        os.environ['IMAGINATION_TEST_CLASS'] = '{}.Heavy'.format(self.module_name)
+
+        try:
+            self.define_with_placeholder(core)
+        finally:
+            del os.environ['IMAGINATION_TEST_CLASS']
+
+        self.assertIn(self.module_name, sys.modules)
+
+    def test_eager_with_undefined_placeholder(self):
+        core = Imagination(import_policy = 'eager')
+
+        self.define_with_placeholder(core)
+        core.lock_down()
+
+        self.assertTrue(core.contain('factory'))
+        self.assertNotIn(self.module_name, sys.modules)
+
+    def test_unknown_import_policy(self):
+        self.assertRaises(ValueError, Imagination, import_policy = 'unknown')
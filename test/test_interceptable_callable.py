@@ -0,0 +1,63 @@
+import unittest
+
+from imagination.meta.definition import Interception
+from imagination.wrapper import InterceptableCallable, InterceptorBinder
+
+
+class Auditor(object):
+    def __init__(self):
+        self.records = []
+
+    def record(self, *largs, **kwargs):
+        self.records.append((largs, kwargs))
+
+
+class UnitTest(unittest.TestCase):
+    """ Test the binding of the intercepting methods """
+    def setUp(self):
+        self.lookups    = []
+        self.instances  = {'auditor': Auditor()}
+        self.cacheables = {'auditor': True}
+
+        self.binder = InterceptorBinder(self.core_get, lambda entity_id: self.cacheables[entity_id])
+        self.callable = InterceptableCallable(
+            self.core_get,
+            lambda value: value * 2,
+            {
+                'before': [Interception('before', 'service', 'run', 'auditor', 'record')],
+                'after' : [Interception('after', 'service', 'run', 'auditor', 'record')],
+                'error' : [],
+            },
+            self.binder,
+        )
+
+    def core_get(self, entity_id):
+        self.lookups.append(entity_id)
+
+        return self.instances[entity_id] if self.cacheables[entity_id] else Auditor()
+
+    def test_interceptors_bound_once(self):
+        self.assertEqual(2, self.callable(1))
+        self.assertEqual(4, self.callable(2))
+
+        self.assertEqual(['auditor', 'auditor'], self.lookups)  # once per event type
+        self.assertEqual([((1,), {}), ((2,), {}), ((2,), {}), ((4,), {})], self.instances['auditor'].records)
+
+    def test_bindings_invalidated(self):
+        self.callable(1)
+
+        self.instances['auditor'] = Auditor()
+        self.binder.invalidate()
+
+        self.callable(2)
+
+        self.assertEqual(4, len(self.lookups))
+        self.assertEqual([((2,), {}), ((4,), {})], self.instances['auditor'].records)
+
+    def test_non_cacheable_interceptor_resolved_per_call(self):
+        self.cacheables['auditor'] = False
+
+        self.callable(1)
+        self.callable(2)
+
+        self.assertEqual(4, len(self.lookups))
@@ -0,0 +1,54 @@
+import json
+import json.decoder
+import unittest
+
+from imagination.loader import Loader, SymbolCache
+
+
+class UnitTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = SymbolCache(max_size = 2)
+
+    def test_loader(self):
+        loader = Loader('json.decoder.JSONDecoder')
+
+        self.assertIs(json.decoder.JSONDecoder, loader.package)
+        self.assertIs(json.decoder, loader.module)
+
+    def test_builtins_and_modules(self):
+        self.assertIs(int, Loader('int').package)
+        self.assertIs(json, Loader('json').package)
+
+    def test_cache(self):
+        self.assertIs(json.decoder.JSONDecoder, self.cache.resolve('json.decoder.JSONDecoder'))
+        self.assertIs(json.decoder.JSONDecoder, self.cache.resolve('json.decoder.JSONDecoder'))
+
+        stats = self.cache.stats()
+
+        self.assertEqual(1, stats.hits)
+        self.assertEqual(1, stats.misses)
+
+    def test_bounded_size(self):
+        self.cache.resolve('int')
+        self.cache.resolve('str')
+        self.cache.resolve('float')
+
+        self.assertEqual(2, self.cache.stats().size)
+
+    def test_invalidate(self):
+        cache = SymbolCache()
+
+        cache.resolve('json.decoder.JSONDecoder')
+        cache.resolve('json.dumps')
+        cache.resolve('int')
+
+        cache.invalidate('json.decoder')
+
+        self.assertEqual(2, cache.stats().size)
+
+        cache.invalidate()
+
+        self.assertEqual(0, cache.stats().size)
+
+    def test_unknown_reference(self):
+        self.assertRaises(ImportError, self.cache.resolve, 'json.unknown_reference')
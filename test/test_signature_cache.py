@@ -0,0 +1,60 @@
+import gc
+import inspect
+import unittest
+
+from imagination.helper.signature import SignatureCache
+
+
+class Sample(object):
+    def __init__(self, a, b = None):
+        pass
+
+    def method(self, c, *d, **e):
+        pass
+
+
+class UnitTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = SignatureCache(max_size = 2)
+
+    def test_signature_of_class(self):
+        self.assertEqual(inspect.signature(Sample), self.cache.signature(Sample))
+        self.assertEqual(('a', 'b'), tuple(p.name for p in self.cache.parameters(Sample)))
+
+        stats = self.cache.stats()
+
+        self.assertEqual(1, stats.hits)
+        self.assertEqual(1, stats.misses)
+        self.assertEqual(0.5, stats.hit_rate)
+
+    def test_bound_methods_share_entry(self):
+        first  = Sample(1).method
+        second = Sample(2).method
+
+        self.assertEqual(inspect.signature(first), self.cache.signature(first))
+        self.assertEqual(inspect.signature(second), self.cache.signature(second))
+        self.assertEqual(1, self.cache.stats().size)
+        self.assertEqual(1, self.cache.stats().hits)
+
+    def test_bounded_size(self):
+        self.cache.signature(Sample)
+        self.cache.signature(Sample.method)
+        self.cache.signature(len)
+
+        stats = self.cache.stats()
+
+        self.assertEqual(2, stats.size)
+        self.assertEqual(1, stats.evictions)
+
+    def test_dynamic_class_collected(self):
+        dynamic_class = type('Dynamic', (Sample,), {})
+
+        self.cache.signature(dynamic_class)
+        self.assertEqual(1, self.cache.stats().size)
+
+        del dynamic_class
+        gc.collect()
+
+        self.cache.signature(Sample)  # Trigger the cleanup.
+
+        self.assertEqual(1, self.cache.stats().size)
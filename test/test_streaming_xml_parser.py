@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from imagination.assembler.xml import StreamingXMLParser, XMLParser
+
+
+class UnitTest(unittest.TestCase):
+    def test_same_containers_as_dom_parser(self):
+        for filename in sorted(os.listdir('test/data')):
+            if not filename.endswith('.xml'):
+                continue
+
+            filepath = os.path.join('test/data', filename)
+
+            with self.subTest(filepath = filepath):
+                expected = XMLParser().parse(filepath)
+                actual   = StreamingXMLParser().parse(filepath)
+
+                self.assertEqual(list(expected), list(actual))
+
+                for entity_id in expected:
+                    self.assertEqual(repr(expected[entity_id]), repr(actual[entity_id]))
+
+    def test_large_file(self):
+        with tempfile.NamedTemporaryFile('w', suffix = '.xml', delete = False) as f:
+            f.write('<imagination>')
+
+            for i in range(5000):
+                f.write(
+                    '<entity id="e{0}" class="dummy.core.PlainOldObjectWithParameters">'
+                    '<param type="int" name="a">{0}</param>'
+                    '<param type="entity" name="b">e{1}</param>'
+                    '</entity>'.format(i, max(i - 1, 0))
+                )
+
+            f.write('</imagination>')
+
+        try:
+            container_map = StreamingXMLParser().parse(f.name)
+        finally:
+            os.unlink(f.name)
+
+        self.assertEqual(5000, len(container_map))
+        self.assertEqual({'e4998'}, container_map['e4999'].dependencies)
+
+    def test_kotoba_not_imported(self):
+        script = '\n'.join([
+            'import sys',
+            'from imagination.assembler.core import Assembler',
+            'assembler = Assembler(xml_parser = "streaming")',
+            'assembler.load("test/data/locator.xml")',
+            'assert "kotoba" not in sys.modules',
+        ])
+
+        subprocess.check_call([sys.executable, '-c', script])
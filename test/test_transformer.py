@@ -1,8 +1,12 @@
+import datetime
+import decimal
 import os
+import pathlib
 import unittest
 
 from imagination.exc                import UnknownEnvironmentVariableError
 from imagination.helper.transformer import Transformer
+from imagination.meta.definition    import DataDefinition, ParameterCollection
 
 
 class UnitTest(unittest.TestCase):
@@ -39,3 +43,156 @@ class UnitTest(unittest.TestCase):
 
         with self.assertRaises(UnknownEnvironmentVariableError):
             self.transformer._pre_process(input_data)
+
+    def test_pre_process_with_multiple_default_values_as_string(self):
+        expectation = 'I like sushi and ramen.'
+        input_data  = 'I like { $FOOD or "sushi" } and { $DRINK or "ramen" }.'
+
+        self.assertEqual(expectation, self.transformer._pre_process(input_data))
+
+    def test_pre_process_in_single_pass(self):
+        os.environ['IMAGINATION_TEST_NESTED'] = '{ $HOME }'
+
+        try:
+            self.assertEqual('{ $HOME }!', self.transformer._pre_process('{ $IMAGINATION_TEST_NESTED }!'))
+        finally:
+            del os.environ['IMAGINATION_TEST_NESTED']
+
+    def test_compile_once(self):
+        input_data = 'Hello, { $USER or "stranger" }.'
+        template   = self.transformer.compile(input_data)
+
+        self.assertIs(template, self.transformer.compile(input_data))
+        self.assertEqual(('Hello, ', ('USER', 'stranger'), '.'), template.chunks)
+        self.assertTrue(self.transformer.compile('No placeholders').static)
+
+    def test_fold_scalar(self):
+        definition = DataDefinition('17', kind = 'int')
+        folded     = self.transformer.fold(definition)
+
+        self.assertEqual(17, folded.value)
+        self.assertFalse(folded.mutable)
+        self.assertIs(folded, self.transformer.fold(definition))
+
+    def test_fold_collections(self):
+        items = ParameterCollection()
+        items.add(DataDefinition('1', kind = 'int'))
+        items.add(DataDefinition('2', kind = 'int'))
+
+        folded_tuple = self.transformer.fold(DataDefinition(items, kind = 'tuple'))
+        folded_list  = self.transformer.fold(DataDefinition(items, kind = 'list'))
+
+        self.assertEqual((1, 2), folded_tuple.get())
+        self.assertIs(folded_tuple.get(), folded_tuple.get())
+
+        self.assertEqual([1, 2], folded_list.get())
+        self.assertIsNot(folded_list.get(), folded_list.get())
+
+    def test_fold_nested_mutable_collection(self):
+        inner_items = ParameterCollection()
+        inner_items.add(DataDefinition('a'))
+
+        items = ParameterCollection()
+        items.add(DataDefinition(inner_items, kind = 'list'), 'letters')
+
+        folded = self.transformer.fold(DataDefinition(items, kind = 'dict'))
+        first  = folded.get()
+        second = folded.get()
+
+        self.assertEqual({'letters': ['a']}, first)
+        self.assertIsNot(first['letters'], second['letters'])
+
+    def test_fold_skips_dynamic_definitions(self):
+        items = ParameterCollection()
+        items.add(DataDefinition('alpha', kind = 'entity'))
+
+        self.assertIsNone(self.transformer.fold(DataDefinition('{ $HOME }')))
+        self.assertIsNone(self.transformer.fold(DataDefinition('alpha', kind = 'entity')))
+        self.assertIsNone(self.transformer.fold(DataDefinition(items, kind = 'list')))
+
+    def test_cast_collections(self):
+        items = ParameterCollection()
+        items.add(DataDefinition('1', kind = 'int'))
+        items.add(DataDefinition('1', kind = 'int'))
+        items.add(DataDefinition('2', kind = 'int'))
+
+        self.assertEqual([1, 1, 2], self.transformer.cast(DataDefinition(items, kind = 'list')))
+        self.assertEqual((1, 1, 2), self.transformer.cast(DataDefinition(items, kind = 'tuple')))
+        self.assertEqual({1, 2}, self.transformer.cast(DataDefinition(items, kind = 'set')))
+        self.assertEqual(frozenset({1, 2}), self.transformer.cast(DataDefinition(items, kind = 'frozenset')))
+
+    def test_cast_nested_collections(self):
+        inner_items = ParameterCollection()
+        inner_items.add(DataDefinition('a'))
+        inner_items.add(DataDefinition('b'))
+
+        items = ParameterCollection()
+        items.add(DataDefinition(inner_items, kind = 'frozenset'), 'letters')
+        items.add(DataDefinition(inner_items, kind = 'tuple'), 'ordered_letters')
+
+        self.assertEqual(
+            {'letters': frozenset({'a', 'b'}), 'ordered_letters': ('a', 'b')},
+            self.transformer.cast(DataDefinition(items, kind = 'dict')),
+        )
+
+    def test_cast_collection_with_activation_context(self):
+        calls       = []
+        transformer = Transformer(lambda entity_id, previously_activated: calls.append(previously_activated) or entity_id)
+
+        inner_items = ParameterCollection()
+        inner_items.add(DataDefinition('alpha', kind = 'entity'))
+
+        items = ParameterCollection()
+        items.add(DataDefinition(inner_items, kind = 'list'), 'entities')
+
+        previously_activated = ['root']
+
+        self.assertEqual(
+            {'entities': ['alpha']},
+            transformer.cast(DataDefinition(items, kind = 'dict'), previously_activated),
+        )
+        self.assertIs(previously_activated, calls[0])
+
+    def test_cast_large_collection(self):
+        items = ParameterCollection()
+
+        for i in range(50000):
+            items.add(DataDefinition(str(i), kind = 'int'))
+
+        self.assertEqual(list(range(50000)), self.transformer.cast(DataDefinition(items, kind = 'list')))
+        self.assertEqual(frozenset(range(50000)), self.transformer.fold(DataDefinition(items, kind = 'frozenset')).get())
+
+    def test_cast_builtin_converters(self):
+        expectations = [
+            (b'sushi', 'sushi', 'bytes'),
+            (decimal.Decimal('0.10'), '0.10', 'decimal'),
+            (pathlib.Path('/tmp/sushi'), '/tmp/sushi', 'path'),
+            (datetime.datetime(2017, 4, 1, 12, 30), '2017-04-01T12:30:00', 'datetime'),
+            (datetime.date(2017, 4, 1), '2017-04-01', 'date'),
+            (datetime.time(12, 30), '12:30', 'time'),
+            (datetime.timedelta(seconds = 90), '90', 'timedelta'),
+            (datetime.timedelta(days = 1, hours = 2, minutes = 3, seconds = 4), '1 day, 2:03:04', 'timedelta'),
+            ({'menu': ['sushi']}, '{"menu": ["sushi"]}', 'json'),
+            (b'sushi', 'c3Vz\n aGk=', 'base64'),
+        ]
+
+        for expected, definition, kind in expectations:
+            self.assertEqual(expected, self.transformer.cast(DataDefinition(definition, kind = kind)))
+
+    def test_fold_immutable_converted_values_only(self):
+        folded_path = self.transformer.fold(DataDefinition('/tmp', kind = 'path'))
+
+        self.assertIs(folded_path.get(), folded_path.get())
+        self.assertIsNone(self.transformer.fold(DataDefinition('[]', kind = 'json')))
+
+    def test_register(self):
+        self.transformer.register('upper', str.upper, immutable = True)
+
+        self.assertEqual('SUSHI', self.transformer.cast(DataDefinition('sushi', kind = 'upper')))
+        self.assertEqual('SUSHI', self.transformer.fold(DataDefinition('sushi', kind = 'upper')).get())
+
+        with self.assertRaises(ValueError):
+            self.transformer.register('entity', str)
+
+        with self.assertRaises(ValueError):
+            self.transformer.cast(DataDefinition('sushi', kind = 'lower'))